@@ -1,15 +1,24 @@
 import sys
 import subprocess
 import importlib
-import io
+import importlib.metadata
 import os
 import json
 from pathlib import Path
 import time
+import urllib.error
+import urllib.parse
 import urllib.request
+import shutil
 import hashlib
 import threading
- 
+import multiprocessing
+from collections import OrderedDict
+
+# Packaged worker processes start by running this file; hand them to multiprocessing first
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+
 
 # --- Ensure required packages are installed before importing them ---
 
@@ -81,6 +90,16 @@ def get_session_file_path():
         return Path("session.json")
 
 
+def get_timings_file_path():
+    """Where the per-stage timing summary of the last profiled run is written."""
+    return get_session_file_path().with_name("last_run_timings.json")
+
+
+def get_signature_cache_dir():
+    """Rasterized PDF signatures, as PNGs named by the SHA-256 of the signature file."""
+    return str(get_session_file_path().with_name("signature_cache"))
+
+
 def save_session_data(data):
     """Save session data to file with error handling."""
     try:
@@ -104,58 +123,146 @@ def load_session_data():
         # Return empty dict if loading fails
         return {}
 
-def pre_start_update_check():
+def get_update_check_path():
+    """Where the time and outcome of the last update discovery are remembered."""
+    return get_session_file_path().with_name("update_check.json")
+
+
+def _update_check_interval() -> float:
+    """Seconds between update discoveries (CERTGEN_UPDATE_INTERVAL_MIN, default 6 hours)."""
+    try:
+        return max(0.0, float(os.environ.get("CERTGEN_UPDATE_INTERVAL_MIN", "360")) * 60.0)
+    except ValueError:
+        return 6 * 3600.0
+
+
+def _update_network_timeout() -> float:
+    """Seconds a fetch or download may take before it is abandoned (CERTGEN_UPDATE_TIMEOUT, default 20)."""
+    try:
+        return max(1.0, float(os.environ.get("CERTGEN_UPDATE_TIMEOUT", "20")))
+    except ValueError:
+        return 20.0
+
+
+def load_update_check(key):
+    """Cached discovery result for key ({} if none), with its age in seconds under "age"."""
+    try:
+        with open(get_update_check_path(), 'r', encoding='utf-8') as f:
+            entry = dict(json.load(f).get(key) or {})
+        entry["age"] = time.time() - float(entry["checked_at"])
+        return entry
+    except Exception:
+        return {}
+
+
+def save_update_check(key, **result):
+    try:
+        path = get_update_check_path()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception:
+            data = {}
+        data[key] = dict(result, checked_at=time.time())
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+    except Exception:
+        pass
+
+
+def update_check_is_due(key) -> bool:
+    """True if the last discovery for key is older than the interval (or never ran)."""
+    age = load_update_check(key).get("age")
+    return age is None or not 0 <= age < _update_check_interval()
+
+
+def _run_git(repo_dir, *args, timeout=None, capture=True):
+    """subprocess.run for git in repo_dir; never prompts. A timeout kills git and returns code -1.
+
+    Network commands pass capture=False: a killed git can leave transport helpers
+    holding captured pipes open, which would block until they exit.
+    """
+    env = dict(os.environ, GIT_TERMINAL_PROMPT="0")
+    out = subprocess.PIPE if capture else subprocess.DEVNULL
+    try:
+        return subprocess.run(["git", *args], cwd=str(repo_dir), stdin=subprocess.DEVNULL, stdout=out, stderr=out,
+                              text=True, env=env, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return subprocess.CompletedProcess(["git", *args], -1, "", "timed out")
+
+
+def git_fetch_if_due(repo_dir, force=False) -> bool:
+    """Fetch the remotes of repo_dir at most once per update interval.
+
+    Offline or slow remotes are abandoned after the network timeout; the
+    attempt still counts, so the next fetch waits for the next interval.
+    Returns True if a fetch ran and succeeded.
+    """
+    key = "git:" + str(Path(repo_dir).resolve())
+    if not force and not update_check_is_due(key):
+        return False
+    res = _run_git(repo_dir, "fetch", "--all", "--prune", "--quiet", timeout=_update_network_timeout(),
+                   capture=False)
+    save_update_check(key, ok=res.returncode == 0)
+    return res.returncode == 0
+
+
+def git_update_status(repo_dir):
+    """(local_sha, upstream_sha, upstream_ref) from local refs only, as of the last fetch; None if unknown."""
+    res_branch = _run_git(repo_dir, "rev-parse", "--abbrev-ref", "HEAD")
+    branch = (res_branch.stdout or "").strip()
+    if res_branch.returncode != 0 or branch == "HEAD":
+        return None
+    res_upstream = _run_git(repo_dir, "rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}")
+    if res_upstream.returncode == 0:
+        upstream_ref = res_upstream.stdout.strip()
+    else:
+        upstream_ref = f"origin/{branch}"
+    res_local = _run_git(repo_dir, "rev-parse", "HEAD")
+    res_remote = _run_git(repo_dir, "rev-parse", upstream_ref)
+    if res_local.returncode != 0 or res_remote.returncode != 0:
+        return None
+    local_sha = (res_local.stdout or "").strip()
+    remote_sha = (res_remote.stdout or "").strip()
+    if not local_sha or not remote_sha:
+        return None
+    return local_sha, remote_sha, upstream_ref
+
+
+def pre_start_update_check(repo_dir=None):
     """Print-only update check that runs before package checks.
-    Uses git to compare local and remote; does not modify files or restart.
+    Compares against the remote refs of the last fetch; fetching itself runs in
+    UpdateCheckWorker after the UI shows, so nothing here touches the network.
     """
     try:
         safe_print("\n========== update: pre-flight ==========")
         safe_print("[update] initializing...")
-        repo_dir = Path(__file__).resolve().parent
+        repo_dir = Path(repo_dir or Path(__file__).resolve().parent)
         if not (repo_dir / ".git").exists():
             safe_print("[update] repo: not a git repository -> skip")
             safe_print("========== update: done =========\n")
             return
 
-        def run_git(*args):
-            return subprocess.run(["git", *args], cwd=str(repo_dir), stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-
-        # Fetch quietly
-        safe_print("[update] fetching: remote refs ...")
-        run_git("fetch", "--all", "--prune", "--quiet")
-        safe_print("[update] fetching: ok")
-
-        # Current branch
-        res_branch = run_git("rev-parse", "--abbrev-ref", "HEAD")
-        branch = (res_branch.stdout or "").strip()
-        if res_branch.returncode != 0 or branch == "HEAD":
-            safe_print("[update] branch: detached or unknown -> skip")
-            safe_print("========== update: done =========\n")
-            return
-
-        res_upstream = run_git("rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}")
-        if res_upstream.returncode == 0:
-            upstream_ref = res_upstream.stdout.strip()
+        last = load_update_check("git:" + str(repo_dir.resolve()))
+        if "age" in last:
+            outcome = "ok" if last.get("ok") else "failed"
+            safe_print(f"[update] last fetch: {int(last['age'] // 60)} min ago ({outcome})")
         else:
-            upstream_ref = f"origin/{branch}"
-        safe_print(f"[update] upstream: {upstream_ref}")
+            safe_print("[update] last fetch: never")
 
-        res_local = run_git("rev-parse", "HEAD")
-        res_remote = run_git("rev-parse", upstream_ref)
-        if res_local.returncode != 0 or res_remote.returncode != 0:
+        status = git_update_status(repo_dir)
+        if status is None:
             safe_print("[update] compare: failed -> skip")
             safe_print("========== update: done =========\n")
             return
 
-        local_sha = (res_local.stdout or "").strip()
-        remote_sha = (res_remote.stdout or "").strip()
-        if not local_sha or not remote_sha or local_sha == remote_sha:
+        local_sha, remote_sha, upstream_ref = status
+        safe_print(f"[update] upstream: {upstream_ref}")
+        if local_sha == remote_sha:
             safe_print("[update] status: up-to-date ✓")
-            safe_print("========== update: done =========\n")
-            return
-
-        safe_print(f"[update] status: behind  {local_sha[:7]} -> {remote_sha[:7]}")
-        safe_print("[update] action: will apply after UI loads")
+        else:
+            safe_print(f"[update] status: behind  {local_sha[:7]} -> {remote_sha[:7]}")
+            safe_print("[update] action: will apply after UI loads")
         safe_print("========== update: done =========\n")
     except Exception:
         safe_print("[update] error: pre-flight check skipped")
@@ -163,15 +270,18 @@ def pre_start_update_check():
             safe_print("========== update: done =========\n")
         except Exception:
             pass
-def _get_package_version(module):
-    return getattr(module, "__version__", getattr(module, "Version", "?"))
+def _get_package_version(pip_name):
+    try:
+        return importlib.metadata.version(pip_name)
+    except Exception:
+        return "?"
 
 def ensure_package(package_import_name, pip_name=None):
     package_to_install = pip_name or package_import_name
     safe_print(f"Checking {package_to_install} ...")
     try:
-        module = importlib.import_module(package_import_name)
-        safe_print(f"{package_to_install}: OK (v{_get_package_version(module)})")
+        importlib.import_module(package_import_name)
+        safe_print(f"{package_to_install}: OK (v{_get_package_version(package_to_install)})")
         return
     except ImportError:
         safe_print(f"{package_to_install}: missing")
@@ -179,8 +289,9 @@ def ensure_package(package_import_name, pip_name=None):
     safe_print(f"Installing {package_to_install} ...")
     try:
         subprocess.check_call([sys.executable, "-m", "pip", "install", package_to_install])
-        module = importlib.import_module(package_import_name)
-        safe_print(f"Installed {package_to_install} (v{_get_package_version(module)})")
+        importlib.invalidate_caches()
+        importlib.import_module(package_import_name)
+        safe_print(f"Installed {package_to_install} (v{_get_package_version(package_to_install)})")
     except Exception as e:
         safe_print(f"Failed to install {package_to_install}: {e}")
         sys.exit(1)
@@ -196,40 +307,97 @@ REQUIRED_PACKAGES = [
     ("PySide6", "PySide6"),
 ]
 
-print_start_banner()
-# Run update check before dependency checks (synchronous to keep output clean)
-try:
-    pre_start_update_check()
-except Exception:
-    pass
-if getattr(sys, "frozen", False):
-    safe_print("Running in packaged mode - skipping dependency checks.\n")
-else:
+
+def get_dependency_stamp_path():
+    """Where the result of the last full package check is remembered."""
+    return get_session_file_path().with_name("dependency_check.json")
+
+
+def _dependency_stamp():
+    """What a passed package check depends on, from package metadata only (nothing is imported)."""
+    versions = {}
+    for _, pip_name in REQUIRED_PACKAGES:
+        try:
+            versions[pip_name] = importlib.metadata.version(pip_name)
+        except Exception:
+            versions[pip_name] = None
+    return {
+        "interpreter": os.path.abspath(sys.executable),
+        "python": sys.version,
+        "required": [list(entry) for entry in REQUIRED_PACKAGES],
+        "versions": versions,
+    }
+
+
+def check_required_packages():
+    """Import (installing if needed) every required package, unless nothing changed since the last pass.
+
+    A passed check is stamped with the interpreter and the installed versions;
+    while those still match, launches skip the imports. CERTGEN_CHECK_PACKAGES=1
+    forces the full check.
+    """
+    stamp = _dependency_stamp()
+    forced = os.environ.get("CERTGEN_CHECK_PACKAGES", "").strip().lower() in ("1", "true", "yes", "on")
+    if not forced and None not in stamp["versions"].values():
+        try:
+            with open(get_dependency_stamp_path(), 'r', encoding='utf-8') as f:
+                if json.load(f) == stamp:
+                    safe_print("Required packages unchanged since last check.\n")
+                    return
+        except Exception:
+            pass
+
     safe_print("Checking required packages...")
     for import_name, pip_name in REQUIRED_PACKAGES:
         ensure_package(import_name, pip_name)
     safe_print("All required packages are present.\n")
+    try:
+        importlib.invalidate_caches()
+        with open(get_dependency_stamp_path(), 'w', encoding='utf-8') as f:
+            json.dump(_dependency_stamp(), f, indent=2)
+    except Exception:
+        # Only costs a full check next launch
+        pass
+
+def run_startup_checks():
+    """Banner, update status and package check, before the third-party imports below."""
+    print_start_banner()
+    # Print the update status before dependency checks (local refs only; fetching runs after the UI shows)
+    try:
+        pre_start_update_check()
+    except Exception:
+        pass
+    if getattr(sys, "frozen", False):
+        safe_print("Running in packaged mode - skipping dependency checks.\n")
+    else:
+        check_required_packages()
+
+
+# Only when launched as the app: importing this module (benchmarks, worker processes) has no side effects
+if __name__ == "__main__":
+    run_startup_checks()
 
 # Safe to import third-party libraries now
-import pandas as pd
-from PyPDF2 import PdfReader, PdfWriter
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.lib.utils import ImageReader
-from PIL import Image
-import fitz  # PyMuPDF
+from certificate_engine import (
+    COMBINED_FILE_NAME, ENGINES, NamesSpreadsheet, StageTimings, capitalize_each_word_preserving_rest,
+    default_engine, default_worker_count, generate_batch, generate_combined, plan_incremental, plan_outputs,
+    profiling_enabled, remove_stale_outputs, save_manifest,
+)
+from update_delta import apply_delta
+from preview_render import (
+    TILE_SIZE, OverlayLayer, PreviewCanvas, PreviewRenderWorker, SignatureLoadWorker, keep_none_alive,
+    load_signature_image, shared_render_cache, tile_rect, tile_threshold_pixels, tiles_in_rect,
+)
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QGridLayout, QLabel, QLineEdit, QPushButton, QProgressBar, 
     QFileDialog, QMessageBox, QGroupBox, QSpinBox, QFrame,
-    QDialog, QSizePolicy, QScrollArea, QSplitter, QSlider, QColorDialog
+    QDialog, QSizePolicy, QScrollArea, QSplitter, QSlider, QColorDialog, QCheckBox, QComboBox
 )
 from PySide6.QtCore import Qt, QThread, Signal, QTimer, QSize, QRect, QPoint
 from PySide6.QtGui import (
-    QPixmap, QPainter, QPen, QFont, QIcon, QFontDatabase, QBrush, QColor,
+    QPixmap, QPainter, QPen, QFont, QFontMetrics, QIcon, QFontDatabase, QBrush, QColor,
     QPolygon
 )
 # Default raw URL for HTTP updater (can be overridden by APP_UPDATE_URL env)
@@ -245,6 +413,21 @@ APP_UPDATE_EXE_URL = os.environ.get(
 ).strip()
 
 
+# Update manifests: small JSON files describing the published payloads,
+#   {"version": "3.1.0", "files": {"App.py": {"sha256": "...", "size": 123}, ...}}
+# fetched before any payload (can be overridden by APP_UPDATE_MANIFEST_URL / APP_UPDATE_EXE_MANIFEST_URL env)
+APP_UPDATE_MANIFEST_URL = os.environ.get(
+    "APP_UPDATE_MANIFEST_URL",
+    "https://raw.githubusercontent.com/sieffreezingman46/Certificate-Generator/main/update-manifest.json"
+).strip()
+APP_UPDATE_EXE_MANIFEST_URL = os.environ.get(
+    "APP_UPDATE_EXE_MANIFEST_URL",
+    "https://github.com/sieffreezingman46/Certificate-Generator/releases/latest/download/update-manifest.json"
+).strip()
+
+# Name of the packaged exe in the exe manifest
+EXE_MANIFEST_NAME = "CertificateGenerator.exe"
+
 # GitHub Releases API for version discovery
 GITHUB_RELEASES_API = os.environ.get(
     "APP_RELEASES_API",
@@ -291,17 +474,32 @@ class UpdateDownloadWorker(QThread):
 
     def run(self):
         try:
-            # Download latest exe bytes
-            remote_bytes = _download_remote_exe_bytes(APP_UPDATE_EXE_URL)
-            if not remote_bytes:
+            # Patch the running exe, or download (or reuse / resume) the latest one
+            entry = fetch_update_manifest_entry(APP_UPDATE_EXE_MANIFEST_URL, EXE_MANIFEST_NAME)
+            new_exe, remote_hash = _download_exe_update(entry)
+            if new_exe is None:
                 return
-            started = _start_exe_swap_with_bytes(remote_bytes)
+            if entry is not None and not _matches_manifest(entry, remote_hash, new_exe):
+                return
+            started = _start_exe_swap_with_file(new_exe)
             if started:
                 self.ready_to_restart.emit()
         except Exception:
             pass
 
 
+def get_updates_dir() -> Path:
+    """Downloaded update payloads, kept between launches so they can be revalidated or resumed."""
+    if getattr(sys, "frozen", False):
+        # User-local, not next to the exe
+        local_root = Path(os.environ.get("LOCALAPPDATA", str(Path.home() / "AppData" / "Local")))
+        updates_dir = local_root / ".certificate_generator" / "updates"
+    else:
+        updates_dir = get_session_file_path().with_name("updates")
+    updates_dir.mkdir(parents=True, exist_ok=True)
+    return updates_dir
+
+
 def http_update_app_py_if_needed(parent_window=None) -> bool:
     """HTTP fallback updater: downloads App.py from GITHUB_RAW_APP_URL and overwrites
     local App.py if content differs. Returns True if an update was written.
@@ -314,63 +512,227 @@ def http_update_app_py_if_needed(parent_window=None) -> bool:
         if not GITHUB_RAW_APP_URL:
             return False
 
-        # Determine install root depending on frozen state
-        if getattr(sys, "frozen", False):
-            install_root = Path(sys.executable).resolve().parent
-        else:
-            install_root = Path(__file__).resolve().parent
-
-        target_path = install_root / "App.py"
-        # Fetch remote content
-        with urllib.request.urlopen(GITHUB_RAW_APP_URL, timeout=10) as resp:
-            remote_bytes = resp.read()
-        if not remote_bytes:
+        target_path = Path(__file__).resolve().parent / "App.py"
+        # The manifest says whether anything changed without downloading App.py
+        entry = fetch_update_manifest_entry(APP_UPDATE_MANIFEST_URL, "App.py")
+        if entry is not None and target_path.exists() and _sha256_of_file(target_path) == entry["sha256"]:
             return False
 
-        # If local file missing, write it
-        if not target_path.exists():
-            with open(target_path, "wb") as f:
-                f.write(remote_bytes)
-            return True
-
-        # Compare and update if different
-        try:
-            with open(target_path, "rb") as f:
-                local_bytes = f.read()
-        except Exception:
-            local_bytes = b""
-        if local_bytes == remote_bytes:
+        # Conditional request; an unchanged remote answers 304 and the last download is reused
+        downloaded = get_updates_dir() / "App.py"
+        remote_hash, _ = download_update_file(GITHUB_RAW_APP_URL, downloaded, timeout=10)
+        if not remote_hash:
             return False
+        if entry is not None and not _matches_manifest(entry, remote_hash, downloaded):
+            return False  # not what the manifest describes; keep the current App.py
 
-        # Overwrite
-        with open(target_path, "wb") as f:
-            f.write(remote_bytes)
+        # Compare and update if different (or missing)
+        if target_path.exists() and _sha256_of_file(target_path) == remote_hash:
+            return False
+        partial = target_path.with_name(target_path.name + ".new")
+        shutil.copyfile(downloaded, partial)
+        os.replace(partial, target_path)
         return True
     except Exception:
         return False
 
 
 
-def _sha256_of_bytes(data: bytes) -> str:
-    try:
-        h = hashlib.sha256()
-        h.update(data or b"")
-        return h.hexdigest()
-    except Exception:
-        return ""
+# {resolved path: [mtime_ns, size, sha256]}, mirrored to ~/.certificate_generator/file_hashes.json
+_FILE_HASHES = None
+_FILE_HASHES_LOCK = threading.Lock()
+
+
+def _file_hashes_path():
+    return get_session_file_path().with_name("file_hashes.json")
 
 
 def _sha256_of_file(path: Path) -> str:
+    """SHA-256 of a file, remembered per (path, mtime, size) so an unchanged exe is hashed once."""
+    global _FILE_HASHES
     try:
+        path = Path(path).resolve()
+        st = path.stat()
+        key = str(path)
+        with _FILE_HASHES_LOCK:
+            if _FILE_HASHES is None:
+                try:
+                    with open(_file_hashes_path(), 'r', encoding='utf-8') as f:
+                        _FILE_HASHES = dict(json.load(f))
+                except Exception:
+                    _FILE_HASHES = {}
+            cached = _FILE_HASHES.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
         h = hashlib.sha256()
         with open(path, "rb") as f:
             for chunk in iter(lambda: f.read(1024 * 1024), b""):
                 h.update(chunk)
-        return h.hexdigest()
+        digest = h.hexdigest()
+        with _FILE_HASHES_LOCK:
+            _FILE_HASHES[key] = [st.st_mtime_ns, st.st_size, digest]
+            try:
+                with open(_file_hashes_path(), 'w', encoding='utf-8') as f:
+                    json.dump(_FILE_HASHES, f, indent=2)
+            except Exception:
+                pass
+        return digest
     except Exception:
         return ""
 
 
+def fetch_update_manifest_entry(manifest_url: str, name: str, timeout: float = 10):
+    """{"version", "sha256", "size", "deltas"} published for file name, or None without a usable manifest.
+
+    deltas lists the binary patches to this payload as {"from_sha256", "url", "sha256", "size"},
+    their file names resolved against the manifest URL.
+    """
+    try:
+        if not manifest_url:
+            return None
+        request = urllib.request.Request(manifest_url, headers={"User-Agent": f"CertificateGenerator/{APP_VERSION}"})
+        with urllib.request.urlopen(request, timeout=timeout) as resp:
+            manifest = json.loads(resp.read(64 * 1024).decode('utf-8'))
+        entry = manifest["files"][name]
+        sha256 = str(entry["sha256"]).strip().lower()
+        if len(sha256) != 64:
+            return None
+        deltas = []
+        for delta in entry.get("deltas") or []:
+            try:
+                deltas.append({
+                    "from_sha256": str(delta["from_sha256"]).lower(),
+                    "url": urllib.parse.urljoin(manifest_url, str(delta["file"])),
+                    "sha256": str(delta["sha256"]).lower(),
+                    "size": int(delta.get("size") or 0),
+                })
+            except Exception:
+                continue
+        return {"version": str(manifest.get("version") or ""), "sha256": sha256, "size": int(entry.get("size") or 0),
+                "deltas": deltas}
+    except Exception:
+        return None
+
+
+def _matches_manifest(entry, sha256: str, path: Path) -> bool:
+    try:
+        return sha256 == entry["sha256"] and (not entry["size"] or Path(path).stat().st_size == entry["size"])
+    except Exception:
+        return False
+
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _read_download_state(state_path: Path, url: str) -> dict:
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        return state if state.get("url") == url else {}
+    except Exception:
+        return {}
+
+
+def _write_download_state(state_path: Path, state: dict):
+    try:
+        with open(state_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+    except Exception:
+        pass
+
+
+def download_update_file(url: str, dest: Path, timeout: float = 20, _retry: bool = True):
+    """Stream url to dest in chunks, hashing as it goes. Returns (sha256, changed).
+
+    The validators of the last complete download (ETag / Last-Modified) are kept
+    in dest.download.json and sent back, so an unchanged payload costs a 304 and
+    dest is reused as is (changed=False). Bytes arrive in dest.part; if the
+    transfer breaks, the next call asks for the rest with a Range request, guarded
+    by If-Range so a payload that changed meanwhile is fetched again from the
+    start. dest is only replaced by a complete download. ("", False) on failure.
+    """
+    dest = Path(dest)
+    part_path = dest.with_name(dest.name + ".part")
+    state_path = dest.with_name(dest.name + ".download.json")
+    state = _read_download_state(state_path, url)
+    complete = state.get("complete") or {}
+    partial = state.get("partial") or {}
+    try:
+        have_complete = bool(complete.get("sha256")) and dest.exists() and dest.stat().st_size == complete.get("size")
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        # Weak ETags may not be used in If-Range
+        etag = partial.get("etag") or ""
+        if_range = etag if etag and not etag.startswith("W/") else partial.get("last_modified")
+        if not if_range:
+            offset = 0
+
+        headers = {"User-Agent": f"CertificateGenerator/{APP_VERSION}", "Accept-Encoding": "identity"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = if_range
+        elif have_complete:
+            if complete.get("etag"):
+                headers["If-None-Match"] = complete["etag"]
+            if complete.get("last_modified"):
+                headers["If-Modified-Since"] = complete["last_modified"]
+
+        try:
+            resp = urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=timeout)
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and have_complete:
+                return complete["sha256"], False
+            if e.code == 416 and _retry:
+                # Stale partial download; start over
+                part_path.unlink(missing_ok=True)
+                state.pop("partial", None)
+                _write_download_state(state_path, state)
+                return download_update_file(url, dest, timeout, _retry=False)
+            return "", False
+
+        with resp:
+            h = hashlib.sha256()
+            resumed = offset and resp.status == 206 and (resp.headers.get("Content-Range") or "").startswith(
+                f"bytes {offset}-")
+            if resp.status == 206 and not resumed:
+                part_path.unlink(missing_ok=True)
+                return "", False  # not the range that was asked for
+            if resumed:
+                with open(part_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                        h.update(chunk)
+            else:
+                offset = 0
+            length = resp.headers.get("Content-Length")
+            expected = offset + int(length) if length and length.isdigit() else None
+
+            # Record the validators first, so an interrupted transfer can be resumed
+            state = {"url": url, "complete": complete, "partial": {
+                "etag": resp.headers.get("ETag") or "",
+                "last_modified": resp.headers.get("Last-Modified") or "",
+            }}
+            _write_download_state(state_path, state)
+
+            received = offset
+            with open(part_path, "ab" if resumed else "wb") as f:
+                for chunk in iter(lambda: resp.read(DOWNLOAD_CHUNK_SIZE), b""):
+                    f.write(chunk)
+                    h.update(chunk)
+                    received += len(chunk)
+        if expected is not None and received != expected:
+            return "", False  # short read; keep the partial file for a resumed attempt
+
+        os.replace(part_path, dest)
+        sha256 = h.hexdigest()
+        partial = state["partial"]
+        _write_download_state(state_path, {"url": url, "complete": {
+            "etag": partial["etag"], "last_modified": partial["last_modified"], "sha256": sha256, "size": received,
+        }})
+        return sha256, True
+    except Exception:
+        return "", False
+
+
 def frozen_self_update_exe_if_needed(parent_window=None) -> bool:
     """When running as a packaged exe, download the latest exe and swap in-place.
     Returns True if an update process was started (app should quit soon).
@@ -383,89 +745,99 @@ def frozen_self_update_exe_if_needed(parent_window=None) -> bool:
 
         # Current exe
         current_exe = Path(sys.executable).resolve()
+        local_hash = _sha256_of_file(current_exe)
 
-        # Download target directory (user-local, not next to the exe)
-        local_root = Path(os.environ.get("LOCALAPPDATA", str(Path.home() / "AppData" / "Local")))
-        updates_dir = local_root / ".certificate_generator" / "updates"
-        updates_dir.mkdir(parents=True, exist_ok=True)
-        downloaded_exe = updates_dir / "CertificateGenerator.new.exe"
+        # The manifest says whether anything changed without downloading the exe
+        entry = fetch_update_manifest_entry(APP_UPDATE_EXE_MANIFEST_URL, EXE_MANIFEST_NAME)
+        if entry is not None and local_hash == entry["sha256"]:
+            return False
 
-        # Fetch remote exe bytes
-        with urllib.request.urlopen(APP_UPDATE_EXE_URL, timeout=20) as resp:
-            remote_bytes = resp.read()
-        if not remote_bytes:
+        new_exe, remote_hash = _download_exe_update(entry)
+        if new_exe is None:
+            return False
+        if entry is not None and not _matches_manifest(entry, remote_hash, new_exe):
             return False
 
         # Compare hashes to skip same version
-        remote_hash = _sha256_of_bytes(remote_bytes)
-        local_hash = _sha256_of_file(current_exe)
         if remote_hash and local_hash and remote_hash == local_hash:
             return False
 
-        # Write download to temp file
-        with open(downloaded_exe, "wb") as f:
-            f.write(remote_bytes)
-
-        # Spawn background PowerShell to wait, replace, and relaunch
-        pid = os.getpid()
-        old_path = str(current_exe).replace("'", "''")
-        new_path = str(downloaded_exe).replace("'", "''")
-        ps_script = (
-            f"$pidToWait={pid}; $old='{old_path}'; $new='{new_path}'; "
-            f"Wait-Process -Id $pidToWait; Start-Sleep -Milliseconds 200; "
-            f"Copy-Item -LiteralPath $new -Destination $old -Force; "
-            f"Remove-Item -LiteralPath $new -Force -ErrorAction SilentlyContinue; "
-            f"Start-Process -FilePath $old"
-        )
-        try:
-            subprocess.Popen([
-                "powershell", "-NoProfile", "-ExecutionPolicy", "Bypass",
-                "-WindowStyle", "Hidden", "-Command", ps_script
-            ])
-        except Exception:
-            # If PowerShell launch fails, leave the new file; user can replace manually
-            return False
-
         # Optionally notify user (caller may show a message); signal that we should quit
-        return True
+        return _start_exe_swap_with_file(new_exe)
     except Exception:
         return False
 
 
 
-def _download_remote_exe_bytes(url: str, timeout: int = 20) -> bytes:
+def _download_remote_exe(url: str, timeout: float = 20):
+    """(path, sha256) of the latest exe, streamed into the updates folder; (None, "") on failure."""
     try:
         if not url:
-            return b""
-        with urllib.request.urlopen(url, timeout=timeout) as resp:
-            return resp.read() or b""
+            return None, ""
+        new_exe = get_updates_dir() / "CertificateGenerator.new.exe"
+        sha256, _ = download_update_file(url, new_exe, timeout=timeout)
+        if not sha256:
+            return None, ""
+        return new_exe, sha256
     except Exception:
-        return b""
+        return None, ""
 
 
-def _start_exe_swap_with_bytes(remote_bytes: bytes) -> bool:
-    """Write remote exe bytes to a temp path and spawn PowerShell to replace current .exe on exit."""
+def _patch_current_exe(entry, current_exe: Path, timeout: float = 20):
+    """Path of the new exe rebuilt from current_exe with a published delta, or None.
+
+    Only used when the manifest lists a delta from exactly this exe; the patch
+    is downloaded like any payload and the result must match the manifest.
+    """
+    try:
+        local_hash = _sha256_of_file(current_exe)
+        delta = next((d for d in entry.get("deltas") or [] if d["from_sha256"] == local_hash), None)
+        if delta is None:
+            return None
+        updates_dir = get_updates_dir()
+        patch = updates_dir / "CertificateGenerator.exe.delta"
+        patch_hash, _ = download_update_file(delta["url"], patch, timeout=timeout)
+        if patch_hash != delta["sha256"]:
+            return None
+        # Not the full download's file: its .download.json validators describe that one
+        patched = updates_dir / "CertificateGenerator.patched.exe"
+        patched_hash = apply_delta(str(current_exe), str(patch), str(patched))
+        if not _matches_manifest(entry, patched_hash, patched):
+            return None
+        return patched
+    except Exception:
+        # DeltaError included: the caller falls back to the full download
+        return None
+
+
+def _download_exe_update(entry=None, timeout: float = 20, current_exe: Path = None, url: str = None):
+    """(path, sha256) of the new exe: patched locally when the manifest offers a delta
+    from the running exe, otherwise (or if patching fails) downloaded in full."""
+    current_exe = Path(current_exe or sys.executable).resolve()
+    if entry is not None:
+        patched = _patch_current_exe(entry, current_exe, timeout=timeout)
+        if patched is not None:
+            return patched, entry["sha256"]
+    return _download_remote_exe(url or APP_UPDATE_EXE_URL, timeout=timeout)
+
+
+def _start_exe_swap_with_file(new_exe: Path) -> bool:
+    """Spawn PowerShell to replace the current .exe with new_exe once this process exits."""
     try:
         if not getattr(sys, "frozen", False):
             return False
-        if not remote_bytes:
+        if not new_exe or not Path(new_exe).exists():
             return False
         current_exe = Path(sys.executable).resolve()
-        local_root = Path(os.environ.get("LOCALAPPDATA", str(Path.home() / "AppData" / "Local")))
-        updates_dir = local_root / ".certificate_generator" / "updates"
-        updates_dir.mkdir(parents=True, exist_ok=True)
-        downloaded_exe = updates_dir / "CertificateGenerator.new.exe"
-        with open(downloaded_exe, "wb") as f:
-            f.write(remote_bytes)
 
+        # new_exe stays in the updates folder as the validated last download
         pid = os.getpid()
         old_path = str(current_exe).replace("'", "''")
-        new_path = str(downloaded_exe).replace("'", "''")
+        new_path = str(new_exe).replace("'", "''")
         ps_script = (
             f"$pidToWait={pid}; $old='{old_path}'; $new='{new_path}'; "
             f"Wait-Process -Id $pidToWait; Start-Sleep -Milliseconds 200; "
             f"Copy-Item -LiteralPath $new -Destination $old -Force; "
-            f"Remove-Item -LiteralPath $new -Force -ErrorAction SilentlyContinue; "
             f"Start-Process -FilePath $old"
         )
         try:
@@ -474,6 +846,7 @@ def _start_exe_swap_with_bytes(remote_bytes: bytes) -> bool:
                 "-WindowStyle", "Hidden", "-Command", ps_script
             ])
         except Exception:
+            # If PowerShell launch fails, leave the new file; user can replace manually
             return False
         return True
     except Exception:
@@ -481,88 +854,85 @@ def _start_exe_swap_with_bytes(remote_bytes: bytes) -> bool:
 
 
 class UpdateCheckWorker(QThread):
-    """Background worker to perform update checks without blocking UI."""
+    """Background worker to perform update checks without blocking UI.
+
+    Discovery (git fetch, or the releases API when packaged) runs at most once
+    per update interval unless force is set; in between, the cached outcome is used.
+    """
     update_available = Signal()
     no_update = Signal()
     updating_started = Signal()
     restart_requested = Signal()
 
-    def __init__(self, parent_window=None, parent=None):
+    def __init__(self, parent_window=None, parent=None, repo_dir=None, force=False):
         super().__init__(parent)
         self.parent_window = parent_window
+        self.repo_dir = Path(repo_dir or Path(__file__).resolve().parent)
+        self.force = force
+
+    def _packaged_update_available(self) -> bool:
+        # A published manifest answers with a few hundred bytes
+        entry = fetch_update_manifest_entry(APP_UPDATE_EXE_MANIFEST_URL, EXE_MANIFEST_NAME,
+                                            timeout=_update_network_timeout())
+        if entry is not None:
+            local_hash = _sha256_of_file(Path(sys.executable).resolve())
+            return bool(local_hash) and local_hash != entry["sha256"]
+
+        # Use GitHub Releases API to compare semantic versions when available
+        latest_tag = ""
+        try:
+            with urllib.request.urlopen(GITHUB_RELEASES_API, timeout=_update_network_timeout()) as resp:
+                data = json.loads(resp.read().decode('utf-8', errors='ignore') or '{}')
+                latest_tag = _parse_version_tag(data.get('tag_name') or '')
+        except Exception:
+            latest_tag = ""
+
+        if latest_tag and _compare_versions(APP_VERSION, latest_tag) < 0:
+            return True
+        # Fallback to hash compare if API did not yield newer (a 304 when the exe is unchanged)
+        new_exe, remote_hash = _download_remote_exe(APP_UPDATE_EXE_URL, timeout=_update_network_timeout())
+        if new_exe is None:
+            return False
+        local_hash = _sha256_of_file(Path(sys.executable).resolve())
+        return bool(remote_hash and local_hash and remote_hash != local_hash)
 
     def run(self):
         try:
             # Packaged: check latest release tag and prompt user before downloading
             if getattr(sys, "frozen", False):
                 try:
-                    # Use GitHub Releases API to compare semantic versions when available
-                    latest_tag = ""
-                    try:
-                        with urllib.request.urlopen(GITHUB_RELEASES_API, timeout=10) as resp:
-                            data = json.loads(resp.read().decode('utf-8', errors='ignore') or '{}')
-                            latest_tag = _parse_version_tag(data.get('tag_name') or '')
-                    except Exception:
-                        latest_tag = ""
-
-                    local_ver = APP_VERSION
-                    if latest_tag and _compare_versions(local_ver, latest_tag) < 0:
+                    key = f"release:{Path(sys.executable).resolve()}:{APP_VERSION}"
+                    if self.force or update_check_is_due(key):
+                        available = self._packaged_update_available()
+                        save_update_check(key, update_available=available)
+                    else:
+                        available = bool(load_update_check(key).get("update_available"))
+                    if available:
                         self.update_available.emit()
                     else:
-                        # Fallback to hash compare if API did not yield newer
-                        remote_bytes = _download_remote_exe_bytes(APP_UPDATE_EXE_URL)
-                        if remote_bytes:
-                            current_exe = Path(sys.executable).resolve()
-                            remote_hash = _sha256_of_bytes(remote_bytes)
-                            local_hash = _sha256_of_file(current_exe)
-                            if remote_hash and local_hash and remote_hash != local_hash:
-                                self.update_available.emit()
-                            else:
-                                self.no_update.emit()
+                        self.no_update.emit()
                 except Exception:
                     pass
                 return
 
             # Source tree: git or HTTP App.py fallback
-            repo_dir = Path(__file__).resolve().parent
+            repo_dir = self.repo_dir
             if not (repo_dir / ".git").exists():
                 try:
-                    http_update_app_py_if_needed(self.parent_window)
+                    key = "http:" + str(repo_dir.resolve())
+                    if self.force or update_check_is_due(key):
+                        save_update_check(key, updated=http_update_app_py_if_needed(self.parent_window))
                 except Exception:
                     pass
                 return
 
-            def run_git(*args, raise_on_error=True):
-                result = subprocess.run([
-                    "git", *args
-                ], cwd=str(repo_dir), stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-                if raise_on_error and result.returncode != 0:
-                    raise RuntimeError(result.stderr.strip() or "git command failed")
-                return result
-
-            run_git("fetch", "--all", "--prune", "--quiet", raise_on_error=False)
-            res_branch = run_git("rev-parse", "--abbrev-ref", "HEAD", raise_on_error=False)
-            branch = (res_branch.stdout or "").strip()
-            if res_branch.returncode != 0 or branch == "HEAD":
-                return
-
-            res_upstream = run_git("rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}", raise_on_error=False)
-            if res_upstream.returncode == 0:
-                upstream_ref = res_upstream.stdout.strip()
-            else:
-                upstream_ref = f"origin/{branch}"
-
-            res_local = run_git("rev-parse", "HEAD", raise_on_error=False)
-            res_remote = run_git("rev-parse", upstream_ref, raise_on_error=False)
-            if res_local.returncode != 0 or res_remote.returncode != 0:
+            git_fetch_if_due(repo_dir, force=self.force)
+            status = git_update_status(repo_dir)
+            if status is None or status[0] == status[1]:
                 return
 
-            local_sha = (res_local.stdout or "").strip()
-            remote_sha = (res_remote.stdout or "").strip()
-            if not local_sha or not remote_sha or local_sha == remote_sha:
-                return
-
-            pull = run_git("pull", "--rebase", "--autostash", raise_on_error=False)
+            pull = _run_git(repo_dir, "pull", "--rebase", "--autostash", timeout=_update_network_timeout(),
+                        capture=False)
             if pull.returncode != 0:
                 return
 
@@ -579,7 +949,8 @@ def check_for_updates_on_startup(parent_window=None):
     """
     try:
         app = QApplication.instance()
-        worker = UpdateCheckWorker(parent_window=parent_window, parent=app)
+        force = bool(getattr(parent_window, "_manual_update_invocation", False))
+        worker = UpdateCheckWorker(parent_window=parent_window, parent=app, force=force)
         # Prompt user and optionally start download-and-swap
         def _notify_available():
             try:
@@ -637,19 +1008,6 @@ def check_for_updates_on_startup(parent_window=None):
     except Exception:
         pass
 
-def capitalize_each_word_preserving_rest(name):
-    if not name:
-        return name
-    words = name.split()
-    capitalized_words = []
-    for word in words:
-        if word and word[0].islower():
-            capitalized_words.append(word[0].upper() + word[1:])
-        else:
-            capitalized_words.append(word)
-    return " ".join(capitalized_words)
-
-
 class ArrowButton(QPushButton):
     def __init__(self, arrow_direction="up", parent=None):
         super().__init__(parent)
@@ -880,9 +1238,13 @@ class CertificateGeneratorThread(QThread):
     status_updated = Signal(str)
     finished = Signal(str)
     error_occurred = Signal(str)
+    # Per-stage timing summary, emitted at the end of a profiled run
+    timings_ready = Signal(dict)
 
     def __init__(self, names_file_path, template_pdf_path, output_folder_path, 
-                 font_path, font_size, x_position, y_position, name_column, text_color_rgb=None):
+                 font_path, font_size, x_position, y_position, name_column, text_color_rgb=None,
+                 workers=None, combined_output=False, engine=None, incremental=True, force=False, profile=None,
+                 names_model=None):
         super().__init__()
         self.names_file_path = names_file_path
         self.template_pdf_path = template_pdf_path
@@ -902,8 +1264,24 @@ class CertificateGeneratorThread(QThread):
                 self.text_color_rgb = (0.0, 0.0, 0.0)
         except Exception:
             self.text_color_rgb = (0.0, 0.0, 0.0)
+        # Worker processes for large batches (None -> CERTGEN_WORKERS or CPU count)
+        self.workers = workers if workers else default_worker_count()
+        # Write one multi-page PDF instead of one file per name
+        self.combined_output = bool(combined_output)
+        # Rendering backend name from certificate_engine.ENGINES (None -> CERTGEN_ENGINE or default)
+        self.engine = engine or default_engine()
+        # Skip certificates whose inputs haven't changed since the last run (see the output folder manifest)
+        self.incremental = bool(incremental)
+        # Render every certificate anyway (the CLI's --force); stale files and the manifest are still handled
+        self.force = bool(force)
+        # Collect per-stage timings (None -> CERTGEN_PROFILE)
+        self.profile = profiling_enabled() if profile is None else bool(profile)
+        # Parsed names file; the window passes its own so an unchanged file is not read again
+        self.names_model = names_model if names_model is not None else NamesSpreadsheet()
 
     def run(self):
+        timings = StageTimings() if self.profile else None
+        run_started = time.perf_counter()
         try:
             if not self.names_file_path or not os.path.exists(self.names_file_path):
                 raise FileNotFoundError("Names file not found")
@@ -912,149 +1290,147 @@ class CertificateGeneratorThread(QThread):
             if not self.output_folder_path or not os.path.isdir(self.output_folder_path):
                 raise FileNotFoundError("Output folder not found")
 
-            # Load spreadsheet (single-line to avoid any indentation ambiguity)
-            names_df = (
-                pd.read_excel(self.names_file_path)
-                if self.names_file_path.endswith(".xlsx")
-                else pd.read_csv(self.names_file_path)
-            )
-
-            if self.name_column not in names_df.columns:
-                raise KeyError(f"Column '{self.name_column}' not found in sheet")
-
-            # Build ordered names list from selected column until the first blank cell
-            names_series = names_df[self.name_column]
-            names_list = []
-            for cell in names_series:
-                if pd.isna(cell) or (isinstance(cell, str) and cell.strip() == ""):
-                    break  # stop at first blank cell
-                names_list.append(str(cell).strip())
+            names_list = self.names_model.names(self.names_file_path, self.name_column)
             if not names_list:
                 raise ValueError(f"No names found in column '{self.name_column}'")
+            if not self.combined_output:
+                jobs = plan_outputs(names_list, self.output_folder_path)
+            if timings is not None:
+                timings.lap("names_read", run_started)
 
-            # Register font
             if not self.font_path or not os.path.exists(self.font_path):
                 raise FileNotFoundError("Font file not found")
-            font_name = os.path.splitext(os.path.basename(self.font_path))[0].replace(" ", "_")
-            pdfmetrics.registerFont(TTFont(font_name, self.font_path))
-
-            total = len(names_list)
-            completed = 0
-
-            for raw_name in names_list:
-                name_value = capitalize_each_word_preserving_rest(raw_name)
-
-                # Fresh template per certificate to avoid cumulative merges
-                template_reader = PdfReader(open(self.template_pdf_path, "rb"))
-                template_page = template_reader.pages[0]
-                page_width = float(template_page.mediabox.width)
-                page_height = float(template_page.mediabox.height)
 
-                # Create overlay
-                packet = io.BytesIO()
-                can = canvas.Canvas(packet, pagesize=(page_width, page_height))
-                try:
-                    # Apply text color
-                    try:
-                        r, g, b = self.text_color_rgb
-                        can.setFillColorRGB(float(r), float(g), float(b))
-                    except Exception:
-                        pass
-                    can.setFont(font_name, int(self.font_size))
-                    # Use selected X (center) if provided, otherwise default to page center
-                    x_center = float(self.x_position) if self.x_position is not None else (page_width / 2.0)
-                    can.drawCentredString(x_center, int(self.y_position), name_value)
+            # Template, font and signatures are loaded once per process by the engine
+            settings = {
+                "template_pdf_path": self.template_pdf_path,
+                "font_path": self.font_path,
+                "font_size": self.font_size,
+                "x_position": self.x_position,
+                "y_position": self.y_position,
+                "text_color_rgb": self.text_color_rgb,
+                "signatures": list(getattr(self, "signatures", []) or []),
+                "engine": self.engine,
+            }
 
-                    # Draw signatures onto the overlay if any
-                    try:
-                        for sig in getattr(self, "signatures", []):
-                            path = sig.get("path")
-                            if not path or not os.path.exists(path):
-                                continue
-                            try:
-                                if path.lower().endswith(".pdf"):
-                                    sdoc = fitz.open(path)
-                                    spage = sdoc.load_page(0)
-                                    spix = spage.get_pixmap(matrix=fitz.Matrix(2.0, 2.0))
-                                    simg = Image.open(io.BytesIO(spix.tobytes("ppm")))
-                                    buf = io.BytesIO()
-                                    simg.save(buf, format='PNG')
-                                    buf.seek(0)
-                                    img_reader = ImageReader(buf)
-                                    sw = simg.width
-                                    sh = simg.height
-                                else:
-                                    img_reader = ImageReader(path)
-                                    simg = Image.open(path)
-                                    sw, sh = simg.size
-                            except Exception:
-                                continue
-
-                            # Flexible per-axis scaling if present
-                            w_pts = sig.get("w_pts")
-                            h_pts = sig.get("h_pts")
-                            if w_pts and h_pts:
-                                target_w_pts = max(1.0, float(w_pts))
-                                target_h_pts = max(1.0, float(h_pts))
-                            else:
-                                scale_fraction = float(sig.get("scale", 0.2))
-                                target_w_pts = max(1.0, page_width * max(min(scale_fraction, 1.0), 0.02))
-                                ratio = sh / max(sw, 1)
-                                target_h_pts = max(1.0, target_w_pts * ratio)
-
-                            sx_pts = sig.get("x_pts")
-                            sy_pts = sig.get("y_pts")
-                            if sx_pts is None or sy_pts is None:
-                                sx_pts = page_width * 0.65
-                                sy_pts = page_height * 0.25
-                            # Convert preview's top-left anchor to PDF's bottom-left anchor
-                            # sy_pts is currently measured from bottom to the TOP edge; subtract image height
-                            sy_bottom_left = float(sy_pts) - float(target_h_pts)
-                            # Clamp to page bounds
-                            if sy_bottom_left < 0:
-                                sy_bottom_left = 0.0
-                            if sx_pts < 0:
-                                sx_pts = 0.0
-                            if sx_pts > page_width - target_w_pts:
-                                sx_pts = page_width - target_w_pts
-                            if sy_bottom_left > page_height - target_h_pts:
-                                sy_bottom_left = page_height - target_h_pts
-
-                            can.drawImage(
-                                img_reader,
-                                float(sx_pts),
-                                float(sy_bottom_left),
-                                width=float(target_w_pts),
-                                height=float(target_h_pts),
-                                mask='auto'
-                            )
-                    except Exception:
-                        pass
-                finally:
-                    can.save()
-                    packet.seek(0)
-
-                # Merge
-                overlay_pdf = PdfReader(packet)
-                writer = PdfWriter()
-                template_page.merge_page(overlay_pdf.pages[0])
-                writer.add_page(template_page)
-
-                # Save
-                output_path = os.path.join(self.output_folder_path, f"{name_value}.pdf")
-                with open(output_path, "wb") as out_file:
-                    writer.write(out_file)
-
-                completed += 1
+            def _on_progress(completed, total, name_value):
                 if total > 0:
                     progress = int(completed * 100 / total)
                     self.progress_updated.emit(progress)
                 self.status_updated.emit(f"Generated {completed}/{total}: {name_value}")
 
-            self.finished.emit(f"✅ Done. Certificates saved to: {self.output_folder_path}")
+            if self.combined_output:
+                combined_path = os.path.join(self.output_folder_path, COMBINED_FILE_NAME)
+                generate_combined(names_list, combined_path, settings, on_progress=_on_progress, timings=timings)
+                self._report_timings(timings, run_started, len(names_list))
+                self.finished.emit(f"✅ Done. Certificates saved to: {combined_path}")
+                return
+
+            if not self.incremental:
+                generate_batch(jobs, settings, workers=self.workers, on_progress=_on_progress, timings=timings)
+                self._report_timings(timings, run_started, len(jobs))
+                self.finished.emit(f"✅ Done. Certificates saved to: {self.output_folder_path}")
+                return
+
+            if timings is not None:
+                plan_started = time.perf_counter()
+            pending, manifest, stale_paths = plan_incremental(jobs, settings, self.output_folder_path)
+            if self.force:
+                pending = jobs
+            if timings is not None:
+                timings.lap("incremental_plan", plan_started)
+            unchanged = len(jobs) - len(pending)
+            if unchanged:
+                self.status_updated.emit(f"Skipping {unchanged} up-to-date certificate(s)...")
+            generate_batch(pending, settings, workers=self.workers, on_progress=_on_progress, timings=timings)
+            removed = remove_stale_outputs(stale_paths)
+            save_manifest(self.output_folder_path, manifest)
+            self._report_timings(timings, run_started, len(pending), unchanged=unchanged)
+
+            summary = f"{len(pending)} generated, {unchanged} unchanged"
+            if removed:
+                summary += f", {removed} removed"
+            self.progress_updated.emit(100)
+            self.finished.emit(f"✅ Done ({summary}). Certificates saved to: {self.output_folder_path}")
         except Exception as exc:
             self.error_occurred.emit(str(exc))
 
+    def _report_timings(self, timings, run_started, certificates, **extra):
+        """Emit the stage summary of a profiled run and write it next to the session file."""
+        if timings is None:
+            return
+        summary = timings.summary(
+            total_seconds=round(time.perf_counter() - run_started, 6),
+            certificates=certificates,
+            workers=self.workers,
+            engine=self.engine,
+            combined_output=self.combined_output,
+            **extra,
+        )
+        self.timings_ready.emit(summary)
+        try:
+            with open(get_timings_file_path(), "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=2)
+        except Exception:
+            # Timing output is diagnostic only
+            pass
+
+
+class NamesLoadWorker(QThread):
+    """Reads preview names through the shared NamesSpreadsheet off the GUI thread.
+
+    Requests are coalesced like PreviewRenderWorker's: request() replaces a
+    read that has not started yet, so typing a column name reads only the last
+    one. Each result carries the id request() returned.
+    """
+
+    loaded = Signal(int, object)  # request id, list of names
+    failed = Signal(int, str)  # request id, error message
+
+    def __init__(self, names_model, parent=None):
+        super().__init__(parent)
+        self._names_model = names_model
+        self._cond = threading.Condition()
+        self._pending = None  # (request id, path, column)
+        self._latest_id = 0
+        self._stopping = False
+
+    def request(self, names_file_path, name_column):
+        """Queue a read of one column, superseding anything still queued. Returns the request id."""
+        with self._cond:
+            self._latest_id += 1
+            request_id = self._latest_id
+            self._pending = (request_id, names_file_path, name_column)
+            self._stopping = False
+            self._cond.notify()
+        if not self.isRunning():
+            self.start()
+        return request_id
+
+    def stop(self):
+        """Drop queued reads and wait for the current one to finish."""
+        with self._cond:
+            self._stopping = True
+            self._pending = None
+            self._cond.notify()
+        self.wait()
+
+    def run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                request_id, names_file_path, name_column = self._pending
+                self._pending = None
+            try:
+                names = self._names_model.names(names_file_path, name_column)
+            except Exception as exc:
+                self.failed.emit(request_id, str(exc))
+                continue
+            self.loaded.emit(request_id, names)
+
 
 class PDFPreviewDialog(QDialog):
     def __init__(self, pdf_path, parent=None):
@@ -1098,28 +1474,16 @@ class PDFPreviewDialog(QDialog):
 
     def load_pdf(self):
         try:
-            doc = fitz.open(self.pdf_path)
-            page = doc.load_page(0)
-            pix = page.get_pixmap(matrix=fitz.Matrix(self.render_zoom, self.render_zoom))
-            
-            img_data = pix.tobytes("ppm")
-            img = Image.open(io.BytesIO(img_data))
-            
-            # Convert PIL to QPixmap
-            img_bytes = io.BytesIO()
-            img.save(img_bytes, format='PNG')
-            img_bytes.seek(0)
-            
-            pixmap = QPixmap()
-            pixmap.loadFromData(img_bytes.getvalue())
+            pixmap, _, _ = shared_render_cache().render(self.pdf_path, self.render_zoom)
+            rendered_width, rendered_height = pixmap.width(), pixmap.height()
             
             # Scale to fit width
             target_width = 750
             if pixmap.width() > target_width:
                 pixmap = pixmap.scaledToWidth(target_width, Qt.SmoothTransformation)
             
-            self.preview_scale = pixmap.width() / (pix.width)
-            self.rendered_height = pix.height
+            self.preview_scale = pixmap.width() / (rendered_width)
+            self.rendered_height = rendered_height
             self.original_pixmap = pixmap
             
             self.preview_label.setPixmap(pixmap)
@@ -1215,19 +1579,7 @@ class PositionPreviewDialog(QDialog):
 
     def _load_pdf(self):
         try:
-            doc = fitz.open(self.pdf_path)
-            page = doc.load_page(0)
-            self._pdf_width_pts = float(page.rect.width)
-            self._pdf_height_pts = float(page.rect.height)
-            pix = page.get_pixmap(matrix=fitz.Matrix(self.render_zoom, self.render_zoom))
-
-            img_data = pix.tobytes("ppm")
-            img = Image.open(io.BytesIO(img_data))
-            img_bytes = io.BytesIO()
-            img.save(img_bytes, format='PNG')
-            img_bytes.seek(0)
-            qpix = QPixmap()
-            qpix.loadFromData(img_bytes.getvalue())
+            qpix, self._pdf_width_pts, self._pdf_height_pts = shared_render_cache().render(self.pdf_path, self.render_zoom)
 
             # Fit width to 820px for dialog
             target_width = 820
@@ -1436,19 +1788,7 @@ class SignaturePositionDialog(QDialog):
 
     def _load_pdf(self):
         try:
-            doc = fitz.open(self.pdf_path)
-            page = doc.load_page(0)
-            self._pdf_width_pts = float(page.rect.width)
-            self._pdf_height_pts = float(page.rect.height)
-            pix = page.get_pixmap(matrix=fitz.Matrix(self.render_zoom, self.render_zoom))
-
-            img_data = pix.tobytes("ppm")
-            img = Image.open(io.BytesIO(img_data))
-            buf = io.BytesIO()
-            img.save(buf, format='PNG')
-            buf.seek(0)
-            base = QPixmap()
-            base.loadFromData(buf.getvalue())
+            base, self._pdf_width_pts, self._pdf_height_pts = shared_render_cache().render(self.pdf_path, self.render_zoom)
             # Fit width to 820px for dialog
             target_width = 820
             if base.width() > target_width:
@@ -1966,7 +2306,33 @@ class CertificateGeneratorApp(QMainWindow):
         self.y_position = 300
         self.x_position = None  # PDF points; default to page center on first preview load
         self.name_column = "Name"
+        self.combined_output = False
+        self.force_regenerate = False  # per window, not saved: every later run would be a full one
+        self.engine = default_engine()
         self.preview_zoom = 1.0
+        # Rendered template pages per zoom level (shared with the placement dialogs)
+        self._preview_cache = shared_render_cache()
+        # Page rasterization runs on this worker; only the newest request is shown
+        self._preview_worker = PreviewRenderWorker(self)
+        self._preview_worker.rendered.connect(self._on_preview_rendered)
+        self._preview_worker.tile_rendered.connect(self._on_preview_tile_rendered)
+        self._preview_worker.failed.connect(self._on_preview_failed)
+        self._preview_request_id = None
+        self._preview_request_key = None
+        self._preview_sharp_pixmap = None  # last fully rendered page (placeholders scale from it)
+        self._preview_sharp_path = None
+        # Tiled mode (page larger than tile_threshold_pixels at the current zoom)
+        self._preview_tiled = False
+        self._preview_tile_key = None  # cache key of the tiled page; tiles are key + (tx, ty)
+        self._preview_tile_request_id = None
+        self._preview_tiles_in_flight = set()
+        # Names file parsed once and shared with the generator thread; first reads run on _names_loader
+        self._names_model = NamesSpreadsheet()
+        self._names_loader = None
+        self._names_request_id = None
+        # Overlay hot-path caches: font family per font file, smooth-scaled signature pixmaps
+        self._font_family_cache = {}
+        self._scaled_signature_cache = OrderedDict()
         self._panning = False
         self._pan_start = None
         self._fit_on_next_load = False
@@ -1981,7 +2347,6 @@ class CertificateGeneratorApp(QMainWindow):
         self.preview_names = []
         self.preview_index = 0
         self._base_pixmap = None
-        self._last_preview_key = None
         self._pdf_page_width_pts = None
         self._pdf_page_height_pts = None
         # Signatures state: list of dicts {path, pixmap, pdf_image, x_pts, y_pts, scale, w_pts, h_pts}
@@ -1992,6 +2357,14 @@ class CertificateGeneratorApp(QMainWindow):
         self._drag_sig_index = -1
         self._drag_sig_offset = QPoint(0, 0)
         self._sig_resize_index = -1
+        # id(signature entry) -> (chip, thumbnail label); session signatures load in the background
+        self._signature_chips = {}
+        self._signature_loader = None
+        # The preview canvas guards against the PySide6 None leak as it paints; this covers the
+        # void calls made elsewhere (progress bar, labels) while the preview sits still
+        self._none_guard_timer = QTimer(self)
+        self._none_guard_timer.timeout.connect(keep_none_alive)
+        self._none_guard_timer.start(1000)
         
         # Load session data before setting up UI
         self._load_session_data()
@@ -2141,6 +2514,30 @@ class CertificateGeneratorApp(QMainWindow):
         self.name_col_edit.textChanged.connect(self.on_name_column_changed)
         options_layout.addWidget(self.name_col_edit, 3, 1, 1, 2)
 
+        # Output mode
+        self.combined_output_check = QCheckBox(f"Single combined PDF ({COMBINED_FILE_NAME})")
+        self.combined_output_check.setToolTip("Write one page per name into a single PDF, e.g. for printing")
+        self.combined_output_check.setChecked(self.combined_output)
+        self.combined_output_check.toggled.connect(self.on_combined_output_toggled)
+        options_layout.addWidget(self.combined_output_check, 4, 0, 1, 3)
+
+        self.force_regenerate_check = QCheckBox("Regenerate all certificates")
+        self.force_regenerate_check.setToolTip(
+            "Render every certificate again, including those unchanged since the last run")
+        self.force_regenerate_check.setChecked(self.force_regenerate)
+        self.force_regenerate_check.setEnabled(not self.combined_output)  # combined output always renders all
+        self.force_regenerate_check.toggled.connect(self.on_force_regenerate_toggled)
+        options_layout.addWidget(self.force_regenerate_check, 5, 0, 1, 3)
+
+        # Rendering backend
+        options_layout.addWidget(QLabel("Renderer:"), 6, 0)
+        self.engine_combo = QComboBox()
+        self.engine_combo.addItems(list(ENGINES))
+        self.engine_combo.setCurrentText(self.engine)
+        self.engine_combo.setToolTip("reportlab: original pipeline; pymupdf: draws straight onto the template")
+        self.engine_combo.currentTextChanged.connect(self.on_engine_changed)
+        options_layout.addWidget(self.engine_combo, 6, 1, 1, 2)
+
         # Removed Preview font tweak (%)
         # options_layout.addWidget(QLabel("Preview font %:"), 3, 0)
         # self.preview_tweak_spin = CustomSpinBox()
@@ -2221,7 +2618,7 @@ class CertificateGeneratorApp(QMainWindow):
         self.preview_scroll.setWidgetResizable(True)
         self.preview_scroll.setMinimumHeight(400)
         
-        self.preview_widget = QLabel("PDF preview will appear here when template is selected")
+        self.preview_widget = PreviewCanvas("PDF preview will appear here when template is selected")
         self.preview_widget.setAlignment(Qt.AlignCenter)
         self.preview_widget.setStyleSheet("color: #adb5bd; font-style: italic; background-color: #343a40; border: 2px dashed #495057; margin: 0px; padding: 0px;")
         self.preview_widget.setMouseTracking(True)
@@ -2233,6 +2630,9 @@ class CertificateGeneratorApp(QMainWindow):
         self.preview_widget.wheelEvent = self.on_preview_wheel
         
         self.preview_scroll.setWidget(self.preview_widget)
+        # Tiled (high zoom) preview renders what scrolls into view
+        self.preview_scroll.horizontalScrollBar().valueChanged.connect(self._request_visible_tiles)
+        self.preview_scroll.verticalScrollBar().valueChanged.connect(self._request_visible_tiles)
         
         # Store zoom overlay reference for positioning
         self.zoom_overlay = None
@@ -2601,6 +3001,10 @@ class CertificateGeneratorApp(QMainWindow):
             self.y_position = max(0, min(2000, session_data.get("y_position", 300)))
             self.x_position = session_data.get("x_position", None)
             self.name_column = session_data.get("name_column", "Name")
+            self.combined_output = bool(session_data.get("combined_output", False))
+            engine = session_data.get("engine")
+            if engine in ENGINES:
+                self.engine = engine
             
             # Validate file paths exist
             if self.names_file_path and not os.path.exists(self.names_file_path):
@@ -2612,40 +3016,19 @@ class CertificateGeneratorApp(QMainWindow):
             if self.font_path and not os.path.exists(self.font_path):
                 self.font_path = ""
             
-            # Load signature attachments
+            # Load signature attachments; pixmaps are filled in by _start_signature_loading
             signatures_data = session_data.get("signatures", [])
             self.signatures = []
             for sig_data in signatures_data:
                 path = sig_data.get("path", "")
                 if path and os.path.exists(path):
-                    try:
-                        # Load signature pixmap
-                        sig_pixmap = None
-                        if path.lower().endswith(".pdf"):
-                            doc = fitz.open(path)
-                            page = doc.load_page(0)
-                            pix = page.get_pixmap(matrix=fitz.Matrix(2.0, 2.0))
-                            img = Image.open(io.BytesIO(pix.tobytes("ppm")))
-                            buf = io.BytesIO()
-                            img.save(buf, format='PNG')
-                            buf.seek(0)
-                            sig_pixmap = QPixmap()
-                            sig_pixmap.loadFromData(buf.getvalue())
-                        else:
-                            sig_pixmap = QPixmap(path)
-                        
-                        if sig_pixmap and not sig_pixmap.isNull():
-                            sig_entry = {
-                                "path": path,
-                                "pixmap": sig_pixmap,
-                                "x_pts": sig_data.get("x_pts"),
-                                "y_pts": sig_data.get("y_pts"),
-                                "scale": sig_data.get("scale", 0.2),
-                            }
-                            self.signatures.append(sig_entry)
-                    except Exception:
-                        # Skip invalid signature files
-                        continue
+                    self.signatures.append({
+                        "path": path,
+                        "pixmap": None,
+                        "x_pts": sig_data.get("x_pts"),
+                        "y_pts": sig_data.get("y_pts"),
+                        "scale": sig_data.get("scale", 0.2),
+                    })
                 
             # Load text color if present
             try:
@@ -2684,6 +3067,8 @@ class CertificateGeneratorApp(QMainWindow):
                 "y_position": self.y_position,
                 "x_position": self.x_position,
                 "name_column": self.name_column,
+                "combined_output": self.combined_output,
+                "engine": self.engine,
                 "signatures": signatures_data,
                 "text_color": self._text_color_hex(),
             }
@@ -2695,9 +3080,10 @@ class CertificateGeneratorApp(QMainWindow):
     def _restore_session_ui(self):
         """Restore signature chips and trigger preview loading after UI is ready."""
         try:
-            # Restore signature chips
+            # Restore signature chips; their images load in the background
             for sig_entry in self.signatures:
                 self._create_signature_chip(sig_entry)
+            self._start_signature_loading()
             
             # Trigger preview loading if we have both template and names
             if self.template_pdf_path and self.names_file_path:
@@ -2714,6 +3100,55 @@ class CertificateGeneratorApp(QMainWindow):
             # Fail silently if restoration fails
             pass
 
+    def _start_signature_loading(self):
+        """Rasterize/decode session signatures on a worker thread (PDFs come from the PNG cache when unchanged)."""
+        entries = [sig for sig in self.signatures if sig.get("pixmap") is None]
+        if not entries:
+            return
+        loader = SignatureLoadWorker([sig["path"] for sig in entries], get_signature_cache_dir(), self)
+        loader.loaded.connect(lambda index, image: self._on_signature_loaded(entries[index], image))
+        loader.failed.connect(lambda index, message: self._on_signature_failed(entries[index]))
+        loader.finished.connect(self._on_signature_loading_finished)
+        self._signature_loader = loader
+        loader.start()
+
+    def _on_signature_loading_finished(self):
+        loader, self._signature_loader = self._signature_loader, None
+        if loader is not None:
+            loader.deleteLater()
+
+    def _on_signature_loaded(self, sig_entry, image):
+        if sig_entry not in self.signatures:
+            return  # removed while loading
+        sig_entry["pixmap"] = QPixmap.fromImage(image)
+        self._set_signature_thumbnail(sig_entry)
+        self.refresh_preview_overlay()
+
+    def _on_signature_failed(self, sig_entry):
+        # Skip invalid signature files, as loading them synchronously used to
+        self._remove_signature(sig_entry)
+
+    def _set_signature_thumbnail(self, sig_entry):
+        chip_and_thumb = self._signature_chips.get(id(sig_entry))
+        spix = sig_entry.get("pixmap")
+        if chip_and_thumb is None or spix is None or spix.isNull():
+            return
+        chip_and_thumb[1].setPixmap(spix.scaled(36, 28, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+
+    def _remove_signature(self, sig_entry):
+        """Drop a signature and its chip, refresh the preview and save the session."""
+        try:
+            self.signatures.remove(sig_entry)
+        except ValueError:
+            pass
+        chip_and_thumb = self._signature_chips.pop(id(sig_entry), None)
+        if chip_and_thumb is not None:
+            chip_and_thumb[0].setParent(None)
+            chip_and_thumb[0].deleteLater()
+        self.refresh_preview_overlay()
+        # Save session data after removal
+        self._save_session_data()
+
     def _create_signature_chip(self, sig_entry):
         """Create a signature chip UI element for the given signature entry."""
         try:
@@ -2727,9 +3162,8 @@ class CertificateGeneratorApp(QMainWindow):
             # left: thumbnail
             thumb = QLabel()
             thumb.setFixedSize(36, 28)
-            spix = sig_entry.get("pixmap")
-            if spix and not spix.isNull():
-                thumb.setPixmap(spix.scaled(36, 28, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            self._signature_chips[id(sig_entry)] = (chip, thumb)
+            self._set_signature_thumbnail(sig_entry)
             thumb.setStyleSheet("border:1px solid #404040; border-radius:4px; background-color:#222;")
             chip_lay.addWidget(thumb)
             
@@ -2787,31 +3221,18 @@ class CertificateGeneratorApp(QMainWindow):
             chip_lay.addWidget(rm)
             self.sig_list_layout.addWidget(chip)
 
-            def _remove():
-                try:
-                    idx = self.signatures.index(sig_entry)
-                    self.signatures.pop(idx)
-                except ValueError:
-                    pass
-                chip.setParent(None)
-                chip.deleteLater()
-                if self._base_pixmap is not None:
-                    self.refresh_preview_overlay()
-                # Save session data after removal
-                self._save_session_data()
-            rm.clicked.connect(_remove)
+            rm.clicked.connect(lambda: self._remove_signature(sig_entry))
 
             # Click chip to reconfigure placement
             def _reconfigure():
-                if not self.template_pdf_path:
-                    return
+                if not self.template_pdf_path or sig_entry.get("pixmap") is None:
+                    return  # still loading
                 try:
                     # Open a lightweight placement dialog for the selected signature
                     dlg = SignaturePositionDialog(self.template_pdf_path, self, sig_entry)
                     if dlg.exec() == QDialog.Accepted:
                         # sig_entry updated in the dialog
-                        if self._base_pixmap is not None:
-                            self.refresh_preview_overlay()
+                        self.refresh_preview_overlay()
                         # Save session data after reconfiguration
                         self._save_session_data()
                 except Exception as e:
@@ -2901,20 +3322,11 @@ class CertificateGeneratorApp(QMainWindow):
         if not file_path:
             return
         try:
-            # Load preview pixmap for overlay
-            sig_pixmap = None
-            if file_path.lower().endswith(".pdf"):
-                doc = fitz.open(file_path)
-                page = doc.load_page(0)
-                pix = page.get_pixmap(matrix=fitz.Matrix(2.0, 2.0))
-                img = Image.open(io.BytesIO(pix.tobytes("ppm")))
-                buf = io.BytesIO()
-                img.save(buf, format='PNG')
-                buf.seek(0)
-                sig_pixmap = QPixmap()
-                sig_pixmap.loadFromData(buf.getvalue())
-            else:
-                sig_pixmap = QPixmap(file_path)
+            # Load preview pixmap for overlay (and cache a rasterized PDF for the next launch)
+            try:
+                sig_pixmap = QPixmap.fromImage(load_signature_image(file_path, get_signature_cache_dir()))
+            except Exception:
+                sig_pixmap = None
 
             if sig_pixmap is None or sig_pixmap.isNull():
                 QMessageBox.warning(self, "Signature", "Could not load the selected signature.")
@@ -2937,26 +3349,12 @@ class CertificateGeneratorApp(QMainWindow):
             try:
                 dlg = SignaturePositionDialog(self.template_pdf_path, self, sig_entry)
                 if dlg.exec() == QDialog.Accepted:
-                    if self._base_pixmap is not None:
-                        self.refresh_preview_overlay()
+                    self.refresh_preview_overlay()
                     # Save session data after successful configuration
                     self._save_session_data()
                 else:
                     # If user cancels first configuration, remove the chip and entry
-                    try:
-                        idx = self.signatures.index(sig_entry)
-                        self.signatures.pop(idx)
-                    except ValueError:
-                        pass
-                    # Find and remove the chip that was created
-                    for i in range(self.sig_list_layout.count()):
-                        widget = self.sig_list_layout.itemAt(i).widget()
-                        if widget and widget.objectName() == "sig_chip":
-                            widget.setParent(None)
-                            widget.deleteLater()
-                            break
-                    if self._base_pixmap is not None:
-                        self.refresh_preview_overlay()
+                    self._remove_signature(sig_entry)
             except Exception as e:
                 QMessageBox.critical(self, "Signature", f"Error configuring signature: {e}")
         except Exception as e:
@@ -3001,8 +3399,7 @@ class CertificateGeneratorApp(QMainWindow):
                 self.color_preview.setStyleSheet(
                     f"border: 1px solid #404040; border-radius: 4px; background-color: {hexv};")
             # Refresh preview overlay color
-            if self._base_pixmap is not None:
-                self.refresh_preview_overlay()
+            self.refresh_preview_overlay()
         except Exception:
             pass
 
@@ -3156,15 +3553,13 @@ class CertificateGeneratorApp(QMainWindow):
             QTimer.singleShot(100, self.position_nav_buttons)
             
         try:
-            doc = fitz.open(self.template_pdf_path)
-            page = doc.load_page(0)
             # Fit-to-width on first load after selecting a template
             if self._fit_on_next_load:
                 try:
                     viewport_width = max(self.preview_scroll.viewport().width(), 1)
                 except Exception:
                     viewport_width = 800
-                pdf_width_pts = float(page.rect.width)
+                pdf_width_pts = self._preview_cache.page_size(self.template_pdf_path)[0]
                 target_zoom = viewport_width / max(pdf_width_pts, 1.0)
                 self.preview_zoom = max(min(target_zoom, 4.0), 0.4)
                 # sync drag bar if present
@@ -3174,30 +3569,199 @@ class CertificateGeneratorApp(QMainWindow):
                     pass
                 self._fit_on_next_load = False
 
-            pix = page.get_pixmap(matrix=fitz.Matrix(self.preview_zoom, self.preview_zoom))
-            
-            img_data = pix.tobytes("ppm")
-            img = Image.open(io.BytesIO(img_data))
-            
-            # Convert PIL to QPixmap
-            img_bytes = io.BytesIO()
-            img.save(img_bytes, format='PNG')
-            img_bytes.seek(0)
-            
-            pixmap = QPixmap()
-            pixmap.loadFromData(img_bytes.getvalue())
-            # Store base pixmap and page size for fast overlay redraws
-            self._base_pixmap = pixmap
-            self._pdf_page_width_pts = float(page.rect.width)
-            self._pdf_page_height_pts = float(page.rect.height)
+            key = self._preview_cache.key(self.template_pdf_path, self.preview_zoom)
+            width_pts, height_pts = self._preview_cache.page_size(self.template_pdf_path)
+            zoom = self._preview_cache.key_zoom(key)
+            page_w = max(1, int(round(width_pts * zoom)))
+            page_h = max(1, int(round(height_pts * zoom)))
+            if page_w * page_h > tile_threshold_pixels():
+                self._show_preview_tiles(key, width_pts, height_pts, page_w, page_h)
+                return
+            self._leave_tiled_preview()
+
+            cached = self._preview_cache.get(key)
+            if cached is not None:
+                # Supersede any render still in flight
+                self._preview_request_id = None
+                self._show_preview_page(*cached)
+                return
+
+            if self._preview_request_id is not None and self._preview_request_key == key:
+                return  # already rendering exactly this page
+
+            # Until the sharp page arrives, stretch the last one of this template to the new size
+            if self._preview_sharp_pixmap is not None and self._preview_sharp_path == key[0]:
+                self._pdf_page_width_pts = width_pts
+                self._pdf_page_height_pts = height_pts
+                self._base_pixmap = self._preview_sharp_pixmap
+                self.preview_widget.set_page(QSize(page_w, page_h), self._paint_preview_base)
+                self.refresh_preview_overlay()
+            elif self._base_pixmap is None:
+                self.preview_widget.set_page(None)
+                self.preview_widget.setText("Rendering preview...")
+
+            self._preview_request_key = key
+            self._preview_request_id = self._preview_worker.request(
+                self.template_pdf_path, self._preview_cache.key_zoom(key))
 
-            # Draw current overlay and display
-            self.refresh_preview_overlay()
-            self.preview_widget.setStyleSheet("")  # Remove placeholder styling
-            
         except Exception as e:
-            self.preview_widget.setText(f"Error loading preview: {str(e)}")
-            self.preview_widget.setStyleSheet("color: #e74c3c; font-style: italic; background-color: #343a40;")
+            self._show_preview_error(e)
+
+    def _show_preview_page(self, pixmap, width_pts, height_pts):
+        # Store base pixmap and page size for fast overlay redraws
+        self._base_pixmap = pixmap
+        self._preview_sharp_pixmap = pixmap
+        self._preview_sharp_path = os.path.abspath(self.template_pdf_path)
+        self._pdf_page_width_pts = width_pts
+        self._pdf_page_height_pts = height_pts
+
+        # Page layer from the pixmap, overlay layers on top
+        self.preview_widget.setStyleSheet("")  # Remove placeholder styling
+        self.preview_widget.set_page(pixmap.size(), self._paint_preview_base)
+        self.refresh_preview_overlay()
+
+    def _show_preview_tiles(self, key, width_pts, height_pts, page_w, page_h):
+        """High zoom: keep no full-page pixmap, render only the tiles around the viewport."""
+        self._preview_request_id = None  # a full-page render in flight is no longer wanted
+        if key != self._preview_tile_key:
+            self._preview_tile_request_id = None
+            self._preview_tiles_in_flight = set()
+        self._preview_tiled = True
+        self._preview_tile_key = key
+        self._base_pixmap = None
+        self._pdf_page_width_pts = width_pts
+        self._pdf_page_height_pts = height_pts
+        self.preview_widget.setStyleSheet("")  # Remove placeholder styling
+        self.preview_widget.set_page(QSize(page_w, page_h), self._paint_preview_base)
+        self.refresh_preview_overlay()
+        # Let the scroll area apply the new size before working out what is visible
+        QTimer.singleShot(0, self._request_visible_tiles)
+
+    def _leave_tiled_preview(self):
+        if not self._preview_tiled:
+            return
+        self._preview_tiled = False
+        self._preview_tile_key = None
+        self._preview_tile_request_id = None
+        self._preview_tiles_in_flight = set()
+
+    def _preview_page_size(self):
+        """(width, height) in pixels of the page as currently shown, or None."""
+        size = self.preview_widget.page_size()
+        if size is None:
+            return None
+        return size.width(), size.height()
+
+    def _visible_tiles(self):
+        """Tiles intersecting the viewport plus half a tile of margin, nearest to its center first."""
+        page_w, page_h = self._preview_page_size()
+        origin = self.preview_widget.page_origin()
+        viewport = self.preview_scroll.viewport()
+        x = self.preview_scroll.horizontalScrollBar().value() - origin.x()
+        y = self.preview_scroll.verticalScrollBar().value() - origin.y()
+        margin = TILE_SIZE // 2
+        tiles = tiles_in_rect(x - margin, y - margin, viewport.width() + 2 * margin,
+                              viewport.height() + 2 * margin, page_w, page_h)
+        cx = x + viewport.width() // 2 - TILE_SIZE // 2
+        cy = y + viewport.height() // 2 - TILE_SIZE // 2
+        return sorted(tiles, key=lambda t: abs(t[0] * TILE_SIZE - cx) + abs(t[1] * TILE_SIZE - cy))
+
+    def _request_visible_tiles(self, *_):
+        if not self._preview_tiled or self._preview_tile_key is None:
+            return
+        try:
+            key = self._preview_tile_key
+            missing = [t for t in self._visible_tiles() if self._preview_cache.get(key + t) is None]
+            if not missing or set(missing) <= self._preview_tiles_in_flight:
+                return
+            page_w, page_h = self._preview_page_size()
+            self._preview_tiles_in_flight = set(missing)
+            self._preview_tile_request_id = self._preview_worker.request_tiles(
+                self.template_pdf_path, self._preview_cache.key_zoom(key),
+                [(tx, ty, tile_rect(tx, ty, page_w, page_h)) for tx, ty in missing])
+        except Exception as e:
+            self._show_preview_error(e)
+
+    def _paint_preview_base(self, painter, exposed):
+        """Page layer of the preview canvas: the exposed part of the template."""
+        page_w, page_h = self._preview_page_size()
+        if not self._preview_tiled:
+            # A stretched placeholder until the sharp render for this zoom arrives
+            base = self._base_pixmap
+            if base is not None and not base.isNull():
+                sx = base.width() / page_w
+                sy = base.height() / page_h
+                painter.drawPixmap(exposed, base, QRect(int(exposed.x() * sx), int(exposed.y() * sy),
+                                                        max(1, int(exposed.width() * sx)),
+                                                        max(1, int(exposed.height() * sy))))
+            return
+        key = self._preview_tile_key
+        if key is None:
+            return
+        fallback = None
+        if self._preview_sharp_pixmap is not None and self._preview_sharp_path == key[0]:
+            fallback = self._preview_sharp_pixmap
+        missing = False
+        for tx, ty in tiles_in_rect(exposed.x(), exposed.y(), exposed.width(), exposed.height(), page_w, page_h):
+            target = QRect(*tile_rect(tx, ty, page_w, page_h))
+            cached = self._preview_cache.get(key + (tx, ty))
+            if cached is not None:
+                painter.drawPixmap(target, cached[0])
+                continue
+            missing = True
+            if fallback is not None:
+                sx = fallback.width() / page_w
+                sy = fallback.height() / page_h
+                source = QRect(int(target.x() * sx), int(target.y() * sy),
+                               max(1, int(target.width() * sx)), max(1, int(target.height() * sy)))
+                painter.drawPixmap(target, fallback, source)
+            else:
+                painter.fillRect(target, QColor("#ffffff"))
+        if missing:
+            # E.g. the viewport grew; fetch whatever is now exposed
+            QTimer.singleShot(0, self._request_visible_tiles)
+
+    def _on_preview_tile_rendered(self, request_id, tx, ty, image):
+        if request_id != self._preview_tile_request_id or self._preview_tile_key is None:
+            return
+        self._preview_tiles_in_flight.discard((tx, ty))
+        self._preview_cache.store(self._preview_tile_key + (tx, ty), QPixmap.fromImage(image),
+                                  self._pdf_page_width_pts, self._pdf_page_height_pts)
+        page_w, page_h = self._preview_page_size()
+        self.preview_widget.update_page_rect(QRect(*tile_rect(tx, ty, page_w, page_h)))
+
+    def _show_preview_error(self, error):
+        self.preview_widget.set_page(None)
+        self.preview_widget.setText(f"Error loading preview: {str(error)}")
+        self.preview_widget.setStyleSheet("color: #e74c3c; font-style: italic; background-color: #343a40;")
+
+    def _on_preview_rendered(self, request_id, image, width_pts, height_pts):
+        if request_id != self._preview_request_id:
+            return  # superseded by a newer zoom/template or a cache hit
+        self._preview_request_id = None
+        pixmap = QPixmap.fromImage(image)
+        self._preview_cache.store(self._preview_request_key, pixmap, width_pts, height_pts)
+        self._show_preview_page(pixmap, width_pts, height_pts)
+
+    def _on_preview_failed(self, request_id, message):
+        if request_id == self._preview_tile_request_id:
+            self._leave_tiled_preview()
+        elif request_id != self._preview_request_id:
+            return
+        self._preview_request_id = None
+        self._show_preview_error(message)
+
+    def closeEvent(self, event):
+        try:
+            self._preview_worker.stop()
+            self._preview_cache.close()
+            if self._signature_loader is not None:
+                self._signature_loader.stop()
+            if self._names_loader is not None:
+                self._names_loader.stop()
+        except Exception:
+            pass
+        super().closeEvent(event)
 
     def reconfigure_position(self):
         if not self.template_pdf_path:
@@ -3239,7 +3803,8 @@ class CertificateGeneratorApp(QMainWindow):
         self.generator_thread = CertificateGeneratorThread(
             self.names_file_path, self.template_pdf_path, self.output_folder_path,
             self.font_path, self.font_size, self.x_position, self.y_position, self.name_column,
-            text_color_rgb=tc_rgb
+            text_color_rgb=tc_rgb, combined_output=self.combined_output, engine=self.engine,
+            force=self.force_regenerate, names_model=self._names_model,
         )
         # Pass signatures (path/x/y/scale only) to the worker thread
         try:
@@ -3265,6 +3830,7 @@ class CertificateGeneratorApp(QMainWindow):
         self.generator_thread.status_updated.connect(self.status_label.setText)
         self.generator_thread.finished.connect(self.on_generation_finished)
         self.generator_thread.error_occurred.connect(self.on_generation_error)
+        self.generator_thread.timings_ready.connect(self.on_generation_timings)
         
         self.generator_thread.start()
 
@@ -3274,6 +3840,16 @@ class CertificateGeneratorApp(QMainWindow):
         self.generate_btn.setEnabled(True)
         QMessageBox.information(self, "Success", "Certificates generated successfully!")
 
+    def on_generation_timings(self, summary):
+        """Log the stage summary of a profiled run (also written to last_run_timings.json)."""
+        safe_print(f"[timings] {summary.get('certificates')} certificate(s) in {summary.get('total_seconds', 0.0):.2f} s "
+                   f"({summary.get('engine')}, {summary.get('workers')} worker(s)) -> {get_timings_file_path()}")
+        # Slowest first (the dict comes through the signal with its keys sorted)
+        stages = sorted(summary.get("stages", {}).items(), key=lambda item: -item[1]["seconds"])
+        for stage, entry in stages:
+            mean_ms = "" if entry["mean_ms"] is None else f"  {entry['mean_ms']:.2f} ms each"
+            safe_print(f"[timings]   {stage:<20} {entry['seconds']:8.3f} s  x{entry['count']}{mean_ms}")
+
     def on_generation_error(self, error_message):
         self.status_label.setText(f"❌ Error: {error_message}")
         self.progress_bar.setVisible(False)
@@ -3446,21 +4022,22 @@ class CertificateGeneratorApp(QMainWindow):
                 # Convert from px back to PDF pts using scale
                 pdf_width_pts = float(self._pdf_page_width_pts or 1.0)
                 pdf_height_pts = float(self._pdf_page_height_pts or 1.0)
-                base = self._base_pixmap or self.preview_widget.pixmap()
-                if pdf_width_pts > 0 and pdf_height_pts > 0 and base is not None and not base.isNull():
-                    # Use the currently displayed pixmap to avoid offset issues
-                    scale_x = base.width() / pdf_width_pts
-                    scale_y = base.height() / pdf_height_pts
+                page_size = self._preview_page_size()
+                if pdf_width_pts > 0 and pdf_height_pts > 0 and page_size is not None:
+                    # Use the currently displayed page size to avoid offset issues
+                    page_w, page_h = page_size
+                    scale_x = page_w / pdf_width_pts
+                    scale_y = page_h / pdf_height_pts
                     # Map point relative to preview widget contents
                     # content_x/content_y is the cursor; we want top-left = cursor - half signature size
                     # Retrieve current signature scaled size from bounds
                     b = next((bb for bb in self._signature_bounds if bb["index"] == self._drag_sig_index), None)
                     half_w = int((b["w"]) / 2) if b else self._drag_sig_offset.x()
                     half_h = int((b["h"]) / 2) if b else self._drag_sig_offset.y()
-                    new_x_px = max(0, min(base.width(), content_x - half_w))
-                    new_y_px = max(0, min(base.height(), content_y - half_h))
+                    new_x_px = max(0, min(page_w, content_x - half_w))
+                    new_y_px = max(0, min(page_h, content_y - half_h))
                     sig["x_pts"] = float(new_x_px / scale_x)
-                    sig["y_pts"] = float((base.height() - new_y_px) / scale_y)
+                    sig["y_pts"] = float((page_h - new_y_px) / scale_y)
                     self.refresh_preview_overlay()
             except Exception:
                 pass
@@ -3514,16 +4091,17 @@ class CertificateGeneratorApp(QMainWindow):
         x = pt.x()
         y = pt.y()
         try:
-            pix = self.preview_widget.pixmap()
-            if pix is not None and not pix.isNull():
-                # If label is larger than pixmap due to layout, compute top-left offset
-                x0 = max(0, (self.preview_widget.width() - pix.width()) // 2)
-                y0 = max(0, (self.preview_widget.height() - pix.height()) // 2)
+            page_size = self._preview_page_size()
+            if page_size is not None:
+                page_w, page_h = page_size
+                # If label is larger than the page due to layout, compute top-left offset
+                x0 = max(0, (self.preview_widget.width() - page_w) // 2)
+                y0 = max(0, (self.preview_widget.height() - page_h) // 2)
                 x -= x0
                 y -= y0
-                # Clamp to pixmap bounds
-                x = max(0, min(pix.width(), x))
-                y = max(0, min(pix.height(), y))
+                # Clamp to page bounds
+                x = max(0, min(page_w, x))
+                y = max(0, min(page_h, y))
         except Exception:
             pass
         return QPoint(int(x), int(y))
@@ -3565,6 +4143,19 @@ class CertificateGeneratorApp(QMainWindow):
             self.update_nav_buttons()
             self.refresh_preview_overlay()
 
+    def on_combined_output_toggled(self, checked):
+        self.combined_output = bool(checked)
+        self.force_regenerate_check.setEnabled(not self.combined_output)
+        self._save_session_data()
+
+    def on_force_regenerate_toggled(self, checked):
+        self.force_regenerate = bool(checked)
+
+    def on_engine_changed(self, text):
+        if text in ENGINES:
+            self.engine = text
+            self._save_session_data()
+
     def on_name_column_changed(self, text):
         self.name_column = text or "Name"
         self._build_preview_names()
@@ -3581,18 +4172,16 @@ class CertificateGeneratorApp(QMainWindow):
     def _build_preview_names(self):
         """Build the in-memory list of names from the selected column, stopping at first blank."""
         self.preview_names = []
+        self._names_request_id = None  # a read still in flight is no longer wanted
         try:
             if not self.names_file_path or not os.path.exists(self.names_file_path):
                 return
-            if self.names_file_path.endswith(".xlsx"):
-                names_df = pd.read_excel(self.names_file_path)
+            cached = self._names_model.cached_names(self.names_file_path, self.name_column)
+            if cached is not None:
+                self.preview_names = cached
             else:
-                names_df = pd.read_csv(self.names_file_path)
-            if self.name_column in names_df.columns:
-                for cell in names_df[self.name_column]:
-                    if pd.isna(cell) or (isinstance(cell, str) and cell.strip() == ""):
-                        break
-                    self.preview_names.append(str(cell).strip())
+                # Read in the background; the preview shows the names once they arrive
+                self._request_preview_names()
         except Exception:
             # Leave preview_names empty on failure
             self.preview_names = []
@@ -3600,97 +4189,167 @@ class CertificateGeneratorApp(QMainWindow):
         if self.preview_index >= len(self.preview_names):
             self.preview_index = 0
 
+    def _request_preview_names(self):
+        if self._names_loader is None:
+            self._names_loader = NamesLoadWorker(self._names_model, self)
+            self._names_loader.loaded.connect(self._on_preview_names_loaded)
+            self._names_loader.failed.connect(self._on_preview_names_failed)
+        self._names_request_id = self._names_loader.request(self.names_file_path, self.name_column)
+
+    def _on_preview_names_loaded(self, request_id, names):
+        if request_id != self._names_request_id:
+            return  # superseded by another file or column
+        self._names_request_id = None
+        self.preview_names = names
+        if self.preview_index >= len(self.preview_names):
+            self.preview_index = 0
+        self.refresh_preview_overlay()
+        self.update_nav_buttons()
+
+    def _on_preview_names_failed(self, request_id, message):
+        # preview_names stays empty, as when the names could not be read synchronously
+        if request_id == self._names_request_id:
+            self._names_request_id = None
+
     def refresh_preview_overlay(self):
-        """Redraw overlay text for the current preview index on top of base pixmap, fast."""
-        if self._base_pixmap is None:
+        """Re-layout the name and signature layers; the canvas repaints only the ones that changed."""
+        page_size = self._preview_page_size()
+        if page_size is None:
             return
-        pixmap = self._base_pixmap.copy()
         try:
-            self._signature_bounds = []
-            if self.font_path and os.path.exists(self.font_path) and self.preview_names:
-                current_name = self.preview_names[self.preview_index]
-                current_name = capitalize_each_word_preserving_rest(current_name)
-                temp_font_id = QFontDatabase.addApplicationFont(self.font_path)
-                font_family = "Arial"  # Default fallback
-                if temp_font_id != -1:
-                    families = QFontDatabase.applicationFontFamilies(temp_font_id)
-                    if families:
-                        font_family = families[0]  # Use user-selected font for main preview
-                painter = QPainter(pixmap)
-                # Determine scale between PDF points and preview pixels
-                pdf_height_pts = float(self._pdf_page_height_pts or 1.0)
-                scale_y = pixmap.height() / pdf_height_pts
-                pdf_width_pts = float(self._pdf_page_width_pts or 1.0)
-                scale_x = pixmap.width() / pdf_width_pts if pdf_width_pts > 0 else scale_y
-                preview_font_px = max(int(self.font_size * scale_y), 1)
-                font = QFont(font_family)
-                font.setPixelSize(preview_font_px)
-                painter.setFont(font)
-                try:
-                    painter.setPen(QPen(self.text_color if hasattr(self, 'text_color') else Qt.black, 2))
-                except Exception:
-                    painter.setPen(QPen(Qt.black, 2))
-                # X position: center if None, else map from PDF points to pixels
-                if self.x_position is None:
-                    center_x = pixmap.width() // 2
-                else:
-                    center_x = int(self.x_position * (pixmap.width() / max(pdf_width_pts, 1.0)))
-                preview_y = pixmap.height() - int(self.y_position * scale_y)
-                text_rect = painter.fontMetrics().boundingRect(current_name)
-                painter.drawText(center_x - text_rect.width() // 2, preview_y, current_name)
-                # Draw signatures (optional) with frames
-                if getattr(self, "signatures", None):
-                    for idx, sig in enumerate(self.signatures):
-                        spix = sig.get("pixmap")
-                        if spix is None or spix.isNull():
-                            continue
-                        # Use per-axis flexible scaling if present
-                        w_pts = sig.get("w_pts")
-                        h_pts = sig.get("h_pts")
-                        if w_pts and h_pts:
-                            target_w = max(1, int(float(w_pts) * scale_x))
-                            target_h = max(1, int(float(h_pts) * scale_y))
-                            spix_scaled = spix.scaled(target_w, target_h, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
-                        else:
-                            scale_fraction = float(sig.get("scale", 0.2))
-                            # Target width based on page width
-                            target_w = int(pixmap.width() * max(min(scale_fraction, 1.0), 0.02))
-                            if target_w <= 0:
-                                continue
-                            ratio = spix.height() / max(spix.width(), 1)
-                            target_h = max(1, int(target_w * ratio))
-                            spix_scaled = spix.scaled(target_w, target_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        if sig.get("x_pts") is None or sig.get("y_pts") is None:
-                            # Default placement if not configured yet (centered under cursor on first attach)
-                            x_px = int(pixmap.width() * 0.65)
-                            y_px = int(pixmap.height() * 0.25)
-                        else:
-                            # Stored x/y are top-left; draw at those
-                            x_px = int(float(sig["x_pts"]) * scale_x)
-                            y_px = pixmap.height() - int(float(sig["y_pts"]) * scale_y)
-                        painter.drawPixmap(x_px, y_px, spix_scaled)
-                        # Frame with subtle shadow and hover glow
-                        frame_rect = QRect(x_px, y_px, spix_scaled.width(), spix_scaled.height())
-                        painter.setBrush(Qt.NoBrush)
-                        # shadow
-                        shadow_pen = QPen(QColor(0,0,0,120), 3)
-                        painter.setPen(shadow_pen)
-                        painter.drawRoundedRect(frame_rect.adjusted(1,1,1,1), 6, 6)
-                        # base/hover
-                        base_pen = QPen(QColor(230,230,230,190), 1)
-                        hover_pen = QPen(QColor("#7B2CBF"), 2)
-                        painter.setPen(hover_pen if idx == self._sig_hover_index else base_pen)
-                        painter.drawRoundedRect(frame_rect, 6, 6)
-                        # Track bounds for hover detection
-                        self._signature_bounds.append({"x": x_px, "y": y_px, "w": spix_scaled.width(), "h": spix_scaled.height(), "index": idx})
-                painter.end()
+            layers = self._preview_overlay_layers(*page_size)
         except Exception:
-            pass
-        # Display
-        self.preview_widget.setPixmap(pixmap)
-        self.preview_widget.resize(pixmap.size())
+            layers = []
+        self.preview_widget.set_layers(layers)
         self.update_nav_buttons()
 
+    def _preview_font_family(self, font_path):
+        """Family name of the user font, registering the file with Qt only once per version."""
+        try:
+            st = os.stat(font_path)
+            key = (os.path.abspath(font_path), st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = (font_path, None, None)
+        family = self._font_family_cache.get(key)
+        if family is None:
+            family = "Arial"  # Default fallback
+            temp_font_id = QFontDatabase.addApplicationFont(font_path)
+            if temp_font_id != -1:
+                families = QFontDatabase.applicationFontFamilies(temp_font_id)
+                if families:
+                    family = families[0]  # Use user-selected font for main preview
+            self._font_family_cache[key] = family
+        return family
+
+    def _scaled_signature(self, spix, target_w, target_h, aspect_mode):
+        """Smooth-scaled signature pixmap, cached per (pixmap, size) so drags and hovers only blit."""
+        key = (spix.cacheKey(), target_w, target_h, aspect_mode)
+        scaled = self._scaled_signature_cache.get(key)
+        if scaled is None:
+            scaled = spix.scaled(target_w, target_h, aspect_mode, Qt.SmoothTransformation)
+            self._scaled_signature_cache[key] = scaled
+            # Old sizes pile up while zooming or resizing; keep the most recent few per signature
+            while len(self._scaled_signature_cache) > max(16, 4 * len(self.signatures)):
+                self._scaled_signature_cache.popitem(last=False)
+        else:
+            self._scaled_signature_cache.move_to_end(key)
+        return scaled
+
+    def _preview_overlay_layers(self, page_width_px, page_height_px):
+        """Name and signature layers (with frames) for a page of the given pixel size.
+
+        Also records the signature bounds used for hover and drag hit testing.
+        """
+        layers = []
+        self._signature_bounds = []
+        if not (self.font_path and os.path.exists(self.font_path) and self.preview_names):
+            return layers
+        current_name = self.preview_names[self.preview_index]
+        current_name = capitalize_each_word_preserving_rest(current_name)
+        font_family = self._preview_font_family(self.font_path)
+        # Determine scale between PDF points and preview pixels
+        pdf_height_pts = float(self._pdf_page_height_pts or 1.0)
+        scale_y = page_height_px / pdf_height_pts
+        pdf_width_pts = float(self._pdf_page_width_pts or 1.0)
+        scale_x = page_width_px / pdf_width_pts if pdf_width_pts > 0 else scale_y
+        preview_font_px = max(int(self.font_size * scale_y), 1)
+        font = QFont(font_family)
+        font.setPixelSize(preview_font_px)
+        try:
+            text_color = QColor(self.text_color if hasattr(self, 'text_color') else Qt.black)
+        except Exception:
+            text_color = QColor(Qt.black)
+        # X position: center if None, else map from PDF points to pixels
+        if self.x_position is None:
+            center_x = page_width_px // 2
+        else:
+            center_x = int(self.x_position * (page_width_px / max(pdf_width_pts, 1.0)))
+        preview_y = page_height_px - int(self.y_position * scale_y)
+        text_rect = QFontMetrics(font).boundingRect(current_name)
+        text_x = center_x - text_rect.width() // 2
+
+        def _paint_name(painter):
+            painter.setFont(font)
+            painter.setPen(QPen(text_color, 2))
+            painter.drawText(text_x, preview_y, current_name)
+
+        layers.append(OverlayLayer(
+            "name", text_rect.translated(text_x, preview_y).adjusted(-2, -2, 2, 2),
+            (current_name, font_family, preview_font_px, text_color.rgba()), _paint_name))
+
+        # Signatures (optional) with frames
+        for idx, sig in enumerate(getattr(self, "signatures", None) or []):
+            spix = sig.get("pixmap")
+            if spix is None or spix.isNull():
+                continue
+            # Use per-axis flexible scaling if present
+            w_pts = sig.get("w_pts")
+            h_pts = sig.get("h_pts")
+            if w_pts and h_pts:
+                target_w = max(1, int(float(w_pts) * scale_x))
+                target_h = max(1, int(float(h_pts) * scale_y))
+                spix_scaled = self._scaled_signature(spix, target_w, target_h, Qt.IgnoreAspectRatio)
+            else:
+                scale_fraction = float(sig.get("scale", 0.2))
+                # Target width based on page width
+                target_w = int(page_width_px * max(min(scale_fraction, 1.0), 0.02))
+                if target_w <= 0:
+                    continue
+                ratio = spix.height() / max(spix.width(), 1)
+                target_h = max(1, int(target_w * ratio))
+                spix_scaled = self._scaled_signature(spix, target_w, target_h, Qt.KeepAspectRatio)
+            if sig.get("x_pts") is None or sig.get("y_pts") is None:
+                # Default placement if not configured yet (centered under cursor on first attach)
+                x_px = int(page_width_px * 0.65)
+                y_px = int(page_height_px * 0.25)
+            else:
+                # Stored x/y are top-left; draw at those
+                x_px = int(float(sig["x_pts"]) * scale_x)
+                y_px = page_height_px - int(float(sig["y_pts"]) * scale_y)
+            frame_rect = QRect(x_px, y_px, spix_scaled.width(), spix_scaled.height())
+            hovered = idx == self._sig_hover_index
+
+            def _paint_signature(painter, spix_scaled=spix_scaled, frame_rect=frame_rect, hovered=hovered):
+                painter.drawPixmap(frame_rect.topLeft(), spix_scaled)
+                # Frame with subtle shadow and hover glow
+                painter.setBrush(Qt.NoBrush)
+                # shadow
+                shadow_pen = QPen(QColor(0,0,0,120), 3)
+                painter.setPen(shadow_pen)
+                painter.drawRoundedRect(frame_rect.adjusted(1,1,1,1), 6, 6)
+                # base/hover
+                base_pen = QPen(QColor(230,230,230,190), 1)
+                hover_pen = QPen(QColor("#7B2CBF"), 2)
+                painter.setPen(hover_pen if hovered else base_pen)
+                painter.drawRoundedRect(frame_rect, 6, 6)
+
+            # Bounds include the shadow and hover pens
+            layers.append(OverlayLayer(("signature", idx), frame_rect.adjusted(-2, -2, 4, 4),
+                                       (spix_scaled.cacheKey(), hovered), _paint_signature))
+            # Track bounds for hover detection
+            self._signature_bounds.append({"x": x_px, "y": y_px, "w": spix_scaled.width(), "h": spix_scaled.height(), "index": idx})
+        return layers
+
     def open_output_folder(self):
         if not self.output_folder_path or not os.path.isdir(self.output_folder_path):
             QMessageBox.information(self, "Open Folder", 
@@ -0,0 +1,181 @@
+"""Check that the rendering backends produce the same certificate.
+
+Renders one certificate (name plus a PNG and a PDF signature) with every
+engine in certificate_engine.ENGINES on variants of a synthetic template
+whose page boxes differ from the plain case:
+
+- plain:    MediaBox at the origin, no CropBox, no rotation
+- rotate90: /Rotate 90
+- cropbox:  CropBox inside the MediaBox
+- offset:   MediaBox not starting at (0, 0)
+- combined: all three at once
+
+Each output is rasterized with PyMuPDF and compared with the reportlab one;
+the share of pixels differing by more than --threshold in any channel is
+printed per engine and variant, with the render time per certificate.
+Exits 1 if any share is above --max-diff.
+
+Usage:
+    python benchmarks/bench_engine_parity.py [--zoom 2] [--max-diff 0.002]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+DEFAULT_FONT = os.path.join(REPO_ROOT, "Fonts", "Montserrat-Medium.ttf")
+REFERENCE_ENGINE = "reportlab"
+VARIANTS = {
+    "plain": {},
+    "rotate90": {"/Rotate": 90},
+    "cropbox": {"/CropBox": (40, 30, 800, 560)},
+    "offset": {"/MediaBox": (100, 50, 942, 645)},
+    "combined": {"/MediaBox": (100, 50, 942, 645), "/CropBox": (140, 80, 900, 610), "/Rotate": 270},
+}
+
+
+def make_template(path):
+    """A4 landscape certificate with a border and a heading."""
+    from reportlab.pdfgen import canvas
+
+    width, height = 842.0, 595.0
+    can = canvas.Canvas(path, pagesize=(width, height))
+    can.setStrokeColorRGB(0.1, 0.2, 0.4)
+    can.setLineWidth(6)
+    can.rect(24, 24, width - 48, height - 48)
+    can.setFont("Helvetica-Bold", 36)
+    can.drawCentredString(width / 2, height - 120, "Certificate of Completion")
+    can.setFont("Helvetica", 14)
+    can.drawCentredString(width / 2, height - 160, "This certificate is proudly presented to")
+    can.showPage()
+    can.save()
+
+
+def make_png_signature(path):
+    """Transparent PNG scribble, roughly the size of a scanned signature."""
+    from PIL import Image, ImageDraw
+    import random
+
+    rng = random.Random(0)
+    img = Image.new("RGBA", (600, 220), (255, 255, 255, 0))
+    draw = ImageDraw.Draw(img)
+    points = [(20 + i * 14, 110 + rng.randint(-70, 70)) for i in range(40)]
+    draw.line(points, fill=(10, 20, 90, 255), width=5, joint="curve")
+    img.save(path)
+
+
+def make_variant(source, path, boxes):
+    from PyPDF2 import PdfReader, PdfWriter
+    from PyPDF2.generic import ArrayObject, FloatObject, NameObject, NumberObject
+
+    reader = PdfReader(source)
+    page = reader.pages[0]
+    for key, value in boxes.items():
+        if isinstance(value, tuple):
+            page[NameObject(key)] = ArrayObject([FloatObject(v) for v in value])
+        else:
+            page[NameObject(key)] = NumberObject(value)
+    writer = PdfWriter()
+    writer.add_page(page)
+    with open(path, "wb") as f:
+        writer.write(f)
+
+
+def make_pdf_signature(path):
+    from reportlab.pdfgen import canvas
+
+    can = canvas.Canvas(path, pagesize=(300, 110))
+    can.setStrokeColorRGB(0.6, 0.05, 0.05)
+    can.setLineWidth(4)
+    can.bezier(10, 20, 90, 120, 180, -20, 290, 90)
+    can.save()
+
+
+def rasterize(path, zoom):
+    import fitz
+    from PIL import Image
+
+    doc = fitz.open(path)
+    try:
+        pix = doc.load_page(0).get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+        return Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    finally:
+        doc.close()
+
+
+def diff_share(a, b, threshold):
+    """Share of pixels where any channel differs by more than threshold; 1.0 on a size mismatch."""
+    from PIL import ImageChops
+
+    if a.size != b.size:
+        return 1.0
+    diff = ImageChops.difference(a, b).convert("L").point(lambda v: 255 if v > threshold else 0)
+    return diff.histogram()[255] / float(a.size[0] * a.size[1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the rendering backends on unusual template page boxes.")
+    parser.add_argument("--zoom", type=float, default=2.0, help="rasterization zoom (default: 2)")
+    parser.add_argument("--threshold", type=int, default=64, help="per-channel difference that counts (default: 64)")
+    parser.add_argument("--max-diff", type=float, default=0.002,
+                        help="largest share of differing pixels allowed (default: 0.002)")
+    args = parser.parse_args(argv)
+
+    from certificate_engine import ENGINES, create_renderer
+
+    root = tempfile.mkdtemp(prefix="certgen-parity-")
+    failed = False
+    try:
+        source = os.path.join(root, "template.pdf")
+        make_template(source)
+        png_signature = os.path.join(root, "signature.png")
+        make_png_signature(png_signature)
+        pdf_signature = os.path.join(root, "signature.pdf")
+        make_pdf_signature(pdf_signature)
+        signatures = [
+            {"path": png_signature, "x_pts": 90, "y_pts": 190, "scale": 0.22},
+            {"path": pdf_signature, "x_pts": 560, "y_pts": 200, "w_pts": 180, "h_pts": 70},
+        ]
+        engines = [REFERENCE_ENGINE] + [e for e in ENGINES if e != REFERENCE_ENGINE]
+        print(f"share of pixels differing from {REFERENCE_ENGINE} (> {args.threshold}) at zoom {args.zoom:g}")
+        for variant, boxes in VARIANTS.items():
+            template = os.path.join(root, f"template_{variant}.pdf")
+            make_variant(source, template, boxes)
+            reference = None
+            for engine in engines:
+                renderer = create_renderer({
+                    "engine": engine,
+                    "template_pdf_path": template,
+                    "font_path": DEFAULT_FONT,
+                    "font_size": 40,
+                    "x_position": None,
+                    "y_position": 300,
+                    "text_color_rgb": (0.1, 0.3, 0.6),
+                    "signatures": signatures,
+                })
+                output = os.path.join(root, f"{variant}_{engine}.pdf")
+                started = time.perf_counter()
+                renderer.write("Ada Lovelace", output)
+                elapsed = (time.perf_counter() - started) * 1000.0
+                image = rasterize(output, args.zoom)
+                if reference is None:
+                    reference = image
+                    print(f"  {variant:<9} {engine:<10} {elapsed:7.1f} ms  reference")
+                    continue
+                share = diff_share(reference, image, args.threshold)
+                ok = share <= args.max_diff
+                print(f"  {variant:<9} {engine:<10} {elapsed:7.1f} ms  {share * 100:6.3f}%  {'ok' if ok else 'MISMATCH'}")
+                failed = failed or not ok
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    print("FAIL" if failed else "OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
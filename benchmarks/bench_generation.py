@@ -0,0 +1,321 @@
+"""Benchmark harness for the certificate generation pipeline.
+
+Synthesizes its own inputs (a simple and a heavy vector template, name lists
+and signature images), then runs the same steps as
+CertificateGeneratorThread.run - read names, plan outputs, render - through
+certificate_engine, headlessly. Every scenario runs in a fresh subprocess so
+peak RSS is per scenario.
+
+Usage:
+    python benchmarks/bench_generation.py                      # full matrix
+    python benchmarks/bench_generation.py --quick              # 100 rows, 0 and 3 signatures
+    python benchmarks/bench_generation.py --sizes 100,10000 --signatures 0,1 \\
+        --output results.json --baseline benchmarks/baseline.json
+
+Reported per scenario: certificates/sec, p50/p99 per-certificate latency,
+peak RSS (this process and its workers) and bytes written. With --baseline,
+throughput drops larger than --tolerance are listed and the exit code is 1.
+"""
+import argparse
+import csv
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+DEFAULT_FONT = os.path.join(REPO_ROOT, "Fonts", "Montserrat-Medium.ttf")
+DEFAULT_OUTPUT = os.path.join(REPO_ROOT, "benchmarks", "results", "benchmark_results.json")
+TEMPLATES = ("simple", "heavy")
+DEFAULT_SIZES = (100, 10000, 100000)
+DEFAULT_SIGNATURES = (0, 1, 2, 3)
+
+
+# ---------- input synthesis ----------
+
+def make_template(path, kind):
+    """A4 landscape certificate; 'heavy' adds ~40k vector strokes like an ornate border export."""
+    from reportlab.pdfgen import canvas
+    import random
+
+    width, height = 842.0, 595.0
+    can = canvas.Canvas(path, pagesize=(width, height))
+    can.setStrokeColorRGB(0.1, 0.2, 0.4)
+    can.setLineWidth(6)
+    can.rect(24, 24, width - 48, height - 48)
+    can.setFont("Helvetica-Bold", 36)
+    can.drawCentredString(width / 2, height - 120, "Certificate of Completion")
+    can.setFont("Helvetica", 14)
+    can.drawCentredString(width / 2, height - 160, "This certificate is proudly presented to")
+    if kind == "heavy":
+        rng = random.Random(1234)
+        can.setLineWidth(0.3)
+        for _ in range(40000):
+            x, y = rng.uniform(30, width - 30), rng.uniform(30, height - 30)
+            path_obj = can.beginPath()
+            path_obj.moveTo(x, y)
+            path_obj.curveTo(x + rng.uniform(-20, 20), y + rng.uniform(-20, 20),
+                             x + rng.uniform(-20, 20), y + rng.uniform(-20, 20),
+                             x + rng.uniform(-30, 30), y + rng.uniform(-30, 30))
+            can.drawPath(path_obj, stroke=1, fill=0)
+    can.showPage()
+    can.save()
+
+
+def make_signature(path, seed):
+    """Transparent PNG scribble, roughly the size of a scanned signature."""
+    from PIL import Image, ImageDraw
+    import random
+
+    rng = random.Random(seed)
+    img = Image.new("RGBA", (600, 220), (255, 255, 255, 0))
+    draw = ImageDraw.Draw(img)
+    points = [(20 + i * 14, 110 + rng.randint(-70, 70)) for i in range(40)]
+    draw.line(points, fill=(10, 20, 90, 255), width=5, joint="curve")
+    img.save(path)
+
+
+def make_names(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Id", "Name", "Email"])
+        for i in range(rows):
+            writer.writerow([i, f"participant number {i}", f"p{i}@example.com"])
+
+
+def prepare_inputs(work_dir, sizes, max_signatures):
+    inputs = {"templates": {}, "names": {}, "signatures": []}
+    for kind in TEMPLATES:
+        path = os.path.join(work_dir, f"template_{kind}.pdf")
+        make_template(path, kind)
+        inputs["templates"][kind] = path
+    for rows in sizes:
+        path = os.path.join(work_dir, f"names_{rows}.csv")
+        make_names(path, rows)
+        inputs["names"][rows] = path
+    for i in range(max_signatures):
+        path = os.path.join(work_dir, f"signature_{i}.png")
+        make_signature(path, i)
+        inputs["signatures"].append(path)
+    return inputs
+
+
+# ---------- one scenario (runs in a child process) ----------
+
+def _peak_rss_bytes():
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows
+    scale = 1 if sys.platform == "darwin" else 1024  # ru_maxrss is bytes on macOS, KiB elsewhere
+    self_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    children_peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale
+    return max(self_peak, children_peak)
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+def run_scenario(spec):
+    """Generate one batch as CertificateGeneratorThread.run does and measure it."""
+    from certificate_engine import generate_batch, iter_names, plan_outputs
+
+    output_dir = tempfile.mkdtemp(prefix="certgen-bench-")
+    try:
+        signatures = [
+            {"path": path, "x_pts": 80.0 + 240.0 * i, "y_pts": 150.0, "w_pts": 150.0, "h_pts": 55.0, "scale": 0.2}
+            for i, path in enumerate(spec["signatures"])
+        ]
+        settings = {
+            "template_pdf_path": spec["template"],
+            "font_path": spec["font"],
+            "font_size": 30,
+            "x_position": None,
+            "y_position": 300,
+            "text_color_rgb": (0.1, 0.1, 0.3),
+            "signatures": signatures,
+            "engine": spec["engine"],
+        }
+        started = time.perf_counter()
+        jobs = plan_outputs(iter_names(spec["names"], "Name"), output_dir)
+        prepared = time.perf_counter()
+
+        # Completion times; with workers they arrive per chunk, so spread each gap over its chunk
+        latencies = []
+        last = [prepared, 0]
+
+        def _on_progress(completed, total, name_value):
+            now = time.perf_counter()
+            count = completed - last[1]
+            if count > 0:
+                latencies.extend([(now - last[0]) / count] * count)
+            last[0], last[1] = now, completed
+
+        generate_batch(jobs, settings, workers=spec["workers"], on_progress=_on_progress)
+        finished = time.perf_counter()
+
+        bytes_written = 0
+        for entry in os.scandir(output_dir):
+            if entry.is_file():
+                bytes_written += entry.stat().st_size
+        latencies.sort()
+        elapsed = finished - started
+        return {
+            "certificates": len(jobs),
+            "seconds": round(elapsed, 4),
+            "setup_seconds": round(prepared - started, 4),
+            "certs_per_sec": round(len(jobs) / elapsed, 2) if elapsed > 0 else None,
+            "p50_ms": round(_percentile(latencies, 0.50) * 1000, 3) if latencies else None,
+            "p99_ms": round(_percentile(latencies, 0.99) * 1000, 3) if latencies else None,
+            "peak_rss_bytes": _peak_rss_bytes(),
+            "bytes_written": bytes_written,
+        }
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+# ---------- matrix, reporting and baseline comparison ----------
+
+def scenario_key(template, rows, signature_count):
+    return f"{template}/{rows}/sig{signature_count}"
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    """Return lines describing throughput regressions beyond tolerance."""
+    regressions = []
+    base_scenarios = baseline.get("scenarios", {})
+    for key, result in results["scenarios"].items():
+        base = base_scenarios.get(key)
+        if not base or not base.get("certs_per_sec") or not result.get("certs_per_sec"):
+            continue
+        change = result["certs_per_sec"] / base["certs_per_sec"] - 1.0
+        marker = ""
+        if change < -tolerance:
+            marker = "  <-- regression"
+            regressions.append(f"{key}: {base['certs_per_sec']} -> {result['certs_per_sec']} certs/sec")
+        print(f"  {key:<24} {base['certs_per_sec']:>10} -> {result['certs_per_sec']:>10} certs/sec "
+              f"({change:+.1%}){marker}")
+    return regressions
+
+
+def _parse_int_list(value):
+    try:
+        return [int(v) for v in value.split(",") if v.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated integers, got '{value}'")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark certificate generation.")
+    parser.add_argument("--templates", default=",".join(TEMPLATES),
+                        help="comma-separated template kinds: simple, heavy (default: both)")
+    parser.add_argument("--sizes", type=_parse_int_list, default=list(DEFAULT_SIZES),
+                        help="comma-separated name counts (default: 100,10000,100000)")
+    parser.add_argument("--signatures", type=_parse_int_list, default=list(DEFAULT_SIGNATURES),
+                        help="comma-separated signature counts, 0-3 (default: 0,1,2,3)")
+    parser.add_argument("--quick", action="store_true", help="100 rows with 0 and 3 signatures only")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes per scenario (default: 1, which gives exact per-certificate latency)")
+    parser.add_argument("--engine", default="reportlab", help="rendering backend (default: reportlab)")
+    parser.add_argument("--font", default=DEFAULT_FONT, help="TTF font used for names")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT,
+                        help="where to write the JSON results (default: benchmarks/results/benchmark_results.json)")
+    parser.add_argument("--baseline", default=None, help="earlier results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="allowed throughput drop versus the baseline (default: 0.10)")
+    parser.add_argument("--run-scenario", default=None, help=argparse.SUPPRESS)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.run_scenario:
+        # Child process: run one scenario and print its result as JSON
+        with open(args.run_scenario, "r", encoding="utf-8") as f:
+            spec = json.load(f)
+        print(json.dumps(run_scenario(spec)))
+        return 0
+
+    templates = [t.strip() for t in args.templates.split(",") if t.strip() in TEMPLATES]
+    sizes, signature_counts = args.sizes, [n for n in args.signatures if 0 <= n <= 3]
+    if args.quick:
+        sizes, signature_counts = [100], [0, 3]
+
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "workers": args.workers,
+        "engine": args.engine,
+        "scenarios": {},
+    }
+    work_dir = tempfile.mkdtemp(prefix="certgen-bench-inputs-")
+    try:
+        inputs = prepare_inputs(work_dir, sizes, max(signature_counts or [0]))
+        for template in templates:
+            for rows in sizes:
+                for signature_count in signature_counts:
+                    key = scenario_key(template, rows, signature_count)
+                    spec = {
+                        "template": inputs["templates"][template],
+                        "names": inputs["names"][rows],
+                        "signatures": inputs["signatures"][:signature_count],
+                        "font": args.font,
+                        "workers": args.workers,
+                        "engine": args.engine,
+                    }
+                    spec_path = os.path.join(work_dir, "scenario.json")
+                    with open(spec_path, "w", encoding="utf-8") as f:
+                        json.dump(spec, f)
+                    proc = subprocess.run(
+                        [sys.executable, os.path.abspath(__file__), "--run-scenario", spec_path],
+                        capture_output=True, text=True,
+                    )
+                    result = None
+                    for line in reversed(proc.stdout.splitlines()):
+                        if line.startswith("{"):
+                            result = json.loads(line)
+                            break
+                    if result is None:
+                        print(f"{key}: failed\n{proc.stderr.strip()}", file=sys.stderr)
+                        results["scenarios"][key] = {"error": proc.stderr.strip()[-2000:]}
+                        continue
+                    results["scenarios"][key] = result
+                    rss = result["peak_rss_bytes"]
+                    print(f"{key:<24} {result['certs_per_sec']:>9} certs/s  "
+                          f"p50 {result['p50_ms']} ms  p99 {result['p99_ms']} ms  "
+                          f"rss {rss / 1e6 if rss else float('nan'):.0f} MB  "
+                          f"written {result['bytes_written'] / 1e6:.1f} MB", flush=True)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"Compared with {args.baseline} (tolerance {args.tolerance:.0%}):")
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} scenario(s) slower than the baseline allows", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
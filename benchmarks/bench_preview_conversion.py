@@ -0,0 +1,90 @@
+"""Micro-benchmark: fitz page -> QPixmap conversion used by the preview widgets.
+
+Compares the old PPM -> PIL -> PNG -> QPixmap.loadFromData route with
+preview_render.pixmap_from_fitz, which wraps the fitz sample buffer as a
+QImage directly. Rendering itself is done once and excluded, so only the
+conversion is timed.
+
+Usage:
+    python benchmarks/bench_preview_conversion.py [--zoom 4] [--repeat 20] [--template FILE]
+"""
+import argparse
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import fitz  # PyMuPDF
+from PIL import Image
+from PySide6.QtGui import QGuiApplication, QPixmap
+
+from preview_render import pixmap_from_fitz
+
+
+def convert_via_png(pix):
+    """The conversion every preview path used before pixmap_from_fitz."""
+    img = Image.open(io.BytesIO(pix.tobytes("ppm")))
+    buf = io.BytesIO()
+    img.save(buf, format='PNG')
+    pixmap = QPixmap()
+    pixmap.loadFromData(buf.getvalue())
+    return pixmap
+
+
+def _time(func, pix, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(pix)
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return statistics.median(samples), min(samples)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time fitz -> QPixmap conversion.")
+    parser.add_argument("--zoom", type=float, default=4.0, help="render zoom (default: 4)")
+    parser.add_argument("--repeat", type=int, default=20, help="conversions per method (default: 20)")
+    parser.add_argument("--template", default=None, help="PDF to render (default: synthesized simple template)")
+    args = parser.parse_args(argv)
+
+    app = QGuiApplication.instance() or QGuiApplication([])  # QPixmap needs a GUI application
+    template = args.template
+    tmp_dir = None
+    if template is None:
+        from bench_generation import make_template
+        tmp_dir = tempfile.mkdtemp(prefix="certgen-bench-")
+        template = os.path.join(tmp_dir, "template.pdf")
+        make_template(template, "simple")
+
+    doc = fitz.open(template)
+    pix = doc.load_page(0).get_pixmap(matrix=fitz.Matrix(args.zoom, args.zoom))
+    doc.close()
+
+    # Same pixels either way
+    a = convert_via_png(pix).toImage()
+    b = pixmap_from_fitz(pix).toImage()
+    assert a.size() == b.size() and a.pixel(a.width() // 2, a.height() // 2) == b.pixel(b.width() // 2, b.height() // 2)
+
+    old_median, old_best = _time(convert_via_png, pix, args.repeat)
+    new_median, new_best = _time(pixmap_from_fitz, pix, args.repeat)
+    print(f"page {pix.width}x{pix.height} px at zoom {args.zoom:g}, {args.repeat} runs")
+    print(f"  PPM -> PIL -> PNG -> QPixmap : median {old_median:8.2f} ms  best {old_best:8.2f} ms")
+    print(f"  pixmap_from_fitz (QImage)    : median {new_median:8.2f} ms  best {new_best:8.2f} ms")
+    print(f"  speed-up                     : {old_median / max(new_median, 1e-9):.1f}x")
+
+    if tmp_dir:
+        os.remove(template)
+        os.rmdir(tmp_dir)
+    del app
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""Offscreen frame-time benchmark for the main preview overlay.
+
+Builds the real CertificateGeneratorApp window on the offscreen platform,
+puts a synthetic template page of increasing size in the preview with a
+name and several signatures, and times the two interactive hot paths:
+
+- hover: toggling the hover highlight of one signature frame
+- drag:  moving one signature by a pixel (what on_preview_move does)
+
+A frame is refresh_preview_overlay() plus processing the resulting paint.
+For comparison the old approach (copy the whole page pixmap, repaint the
+name and every signature, setPixmap on a label) is timed on the same pages.
+
+Usage:
+    python benchmarks/bench_preview_frames.py [--zooms 1,2,3] [--frames 120] [--signatures 4]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from PySide6.QtCore import QRect, QSize, Qt
+from PySide6.QtGui import QColor, QFont, QPainter, QPen, QPixmap
+from PySide6.QtWidgets import QApplication, QLabel, QScrollArea
+
+from preview_render import keep_none_alive
+
+DEFAULT_FONT = os.path.join(REPO_ROOT, "Fonts", "Montserrat-Medium.ttf")
+PAGE_PTS = (842.0, 595.0)  # A4 landscape
+
+
+def make_signature_pixmap(seed):
+    pixmap = QPixmap(1200, 450)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setPen(QPen(QColor(20, 20, 120), 12))
+    for i in range(8):
+        painter.drawLine(60 + i * 130, 380 - (i * 37 + seed * 11) % 300, 140 + i * 130, 80 + (i * 53) % 280)
+    painter.end()
+    return pixmap
+
+
+def make_page(zoom):
+    pixmap = QPixmap(int(PAGE_PTS[0] * zoom), int(PAGE_PTS[1] * zoom))
+    pixmap.fill(QColor("#fdfbf3"))
+    return pixmap
+
+
+def _time_frames(app, frames, step):
+    samples = []
+    for i in range(frames):
+        keep_none_alive()  # the legacy path paints outside PreviewCanvas, which does this itself
+        started = time.perf_counter()
+        step(i)
+        app.processEvents()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    samples.sort()
+    return statistics.median(samples), samples[int(0.99 * (len(samples) - 1))]
+
+
+def legacy_frame(label, base, signatures, font_family, hover_index):
+    """The pre-layering redraw: full pixmap copy and repaint of every overlay item."""
+    pixmap = base.copy()
+    painter = QPainter(pixmap)
+    font = QFont(font_family)
+    font.setPixelSize(max(1, int(30 * pixmap.height() / PAGE_PTS[1])))
+    painter.setFont(font)
+    painter.drawText(pixmap.width() // 3, pixmap.height() // 2, "Ada Lovelace")
+    for idx, (spix, rect) in enumerate(signatures):
+        painter.drawPixmap(rect.topLeft(), spix)
+        painter.setPen(QPen(QColor(0, 0, 0, 120), 3))
+        painter.drawRoundedRect(rect.adjusted(1, 1, 1, 1), 6, 6)
+        painter.setPen(QPen(QColor("#7B2CBF"), 2) if idx == hover_index else QPen(QColor(230, 230, 230, 190), 1))
+        painter.drawRoundedRect(rect, 6, 6)
+    painter.end()
+    label.setPixmap(pixmap)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time preview overlay frames offscreen.")
+    parser.add_argument("--zooms", default="1,2,3", help="comma-separated page zooms (default: 1,2,3)")
+    parser.add_argument("--frames", type=int, default=120, help="frames per measurement (default: 120)")
+    parser.add_argument("--signatures", type=int, default=4, help="signatures on the page (default: 4)")
+    parser.add_argument("--font", default=DEFAULT_FONT, help="TTF font used for the name")
+    args = parser.parse_args(argv)
+    if not os.path.exists(args.font):
+        parser.error(f"font not found: {args.font}")
+    zooms = [float(z) for z in args.zooms.split(",") if z.strip()]
+
+    app = QApplication.instance() or QApplication([])
+    import App
+
+    window = App.CertificateGeneratorApp()
+    window.resize(1400, 900)
+    window.show()
+    window.font_path = args.font
+    window.preview_names = ["Ada Lovelace"]
+    window.template_pdf_path = os.path.join(REPO_ROOT, "benchmark-template.pdf")  # only used as a path key
+    window.signatures = [
+        {"pixmap": make_signature_pixmap(i), "x_pts": 80.0 + i * 170.0, "y_pts": 200.0, "scale": 0.18}
+        for i in range(args.signatures)
+    ]
+
+    legacy_scroll = QScrollArea()
+    legacy_scroll.resize(1200, 800)
+    legacy_label = QLabel()
+    legacy_scroll.setWidget(legacy_label)
+    legacy_scroll.setWidgetResizable(True)
+    legacy_scroll.show()
+    font_family = window._preview_font_family(args.font)
+
+    print(f"{args.signatures} signatures, {args.frames} frames; median / p99 ms per frame")
+    print(f"{'page px':>12}  {'hover':>15}  {'drag':>15}  {'old full repaint':>18}")
+    for zoom in zooms:
+        base = make_page(zoom)
+        window._show_preview_page(base, *PAGE_PTS)
+        app.processEvents()
+        # Keep the signature being hovered/dragged on screen so its frames are really painted
+        bounds = window._signature_bounds[0]
+        origin = window.preview_widget.page_origin()
+        window.preview_scroll.ensureVisible(origin.x() + bounds["x"] + bounds["w"] // 2,
+                                           origin.y() + bounds["y"] + bounds["h"] // 2,
+                                           bounds["w"], bounds["h"])
+        app.processEvents()
+
+        def hover(i):
+            window._sig_hover_index = i % 2 - 1  # alternate between no hover and the first signature
+            window.refresh_preview_overlay()
+
+        def drag(i):
+            window.signatures[0]["x_pts"] = 80.0 + (i % 40)
+            window.refresh_preview_overlay()
+
+        hover_ms = _time_frames(app, args.frames, hover)
+        drag_ms = _time_frames(app, args.frames, drag)
+
+        scale = base.width() / PAGE_PTS[0]
+        legacy_sigs = []
+        for i, sig in enumerate(window.signatures):
+            target_w = int(base.width() * sig["scale"])
+            spix = sig["pixmap"].scaled(target_w, target_w, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            legacy_sigs.append((spix, QRect(int(sig["x_pts"] * scale), base.height() - int(sig["y_pts"] * scale),
+                                            spix.width(), spix.height())))
+        legacy_ms = _time_frames(app, args.frames,
+                                 lambda i: legacy_frame(legacy_label, base, legacy_sigs, font_family, i % 2 - 1))
+        size = QSize(base.width(), base.height())
+        print(f"{size.width():>5}x{size.height():<6}  {hover_ms[0]:7.2f} / {hover_ms[1]:5.2f}  "
+              f"{drag_ms[0]:7.2f} / {drag_ms[1]:5.2f}  {legacy_ms[0]:9.2f} / {legacy_ms[1]:6.2f}")
+
+    window.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""Restoring session signatures at startup, cold and warm signature cache.
+
+Writes a session with a few heavy vector signature PDFs, a PNG and a PDF
+that does not open, then launches the window offscreen twice against a
+temporary home directory:
+
+- cold: nothing cached; the PDFs are rasterized in the render process
+- warm: every PDF signature comes from the PNG cache
+
+For each launch it prints the time until the window is shown, the time
+until every signature has its pixmap, the longest stall of a 10 ms GUI
+timer in between, and how many PDF rasterizations ran in the GUI process
+(expected 0). The broken signature must be dropped from the session.
+Exits 1 on any mismatch.
+
+Usage:
+    python benchmarks/bench_signature_loading.py [--strokes 6000]
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+LOAD_TIMEOUT_S = 60
+
+
+def make_session(root, strokes):
+    from reportlab.pdfgen import canvas
+    from PIL import Image
+
+    paths = []
+    for k in range(3):
+        path = os.path.join(root, f"signature{k}.pdf")
+        c = canvas.Canvas(path, pagesize=(600, 600))
+        rng = random.Random(k)
+        for _ in range(strokes):  # a vectorized scan is many tiny paths
+            c.line(rng.random() * 600, rng.random() * 600, rng.random() * 600, rng.random() * 600)
+        c.save()
+        paths.append(path)
+    path = os.path.join(root, "signature.png")
+    Image.new("RGBA", (300, 120), (0, 0, 120, 255)).save(path)
+    paths.append(path)
+    path = os.path.join(root, "broken.pdf")
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4 not really")
+    paths.append(path)
+
+    state_dir = os.path.join(os.environ["HOME"], ".certificate_generator")
+    os.makedirs(state_dir, exist_ok=True)
+    with open(os.path.join(state_dir, "session.json"), "w") as f:
+        json.dump({"signatures": [{"path": p, "x_pts": 100 + 50 * i, "y_pts": 200, "scale": 0.2}
+                                  for i, p in enumerate(paths)]}, f)
+
+
+def launch():
+    """One offscreen launch; prints a JSON result line."""
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    import preview_render
+
+    rasterized = [0]
+    rasterize = preview_render._rasterize_first_page
+
+    def counting(*args, **kwargs):
+        rasterized[0] += 1
+        return rasterize(*args, **kwargs)
+
+    preview_render._rasterize_first_page = counting
+    import App
+
+    app = App.QApplication([])
+    started = time.perf_counter()
+    window = App.CertificateGeneratorApp()
+    window.show()
+    app.processEvents()
+    shown = time.perf_counter() - started
+
+    ticks = []
+    timer = App.QTimer()
+    timer.timeout.connect(lambda: ticks.append(time.perf_counter()))
+    timer.start(10)
+    deadline = time.perf_counter() + LOAD_TIMEOUT_S
+    while time.perf_counter() < deadline and (
+            window._signature_loader is not None or any(s.get("pixmap") is None for s in window.signatures)):
+        app.processEvents()
+        time.sleep(0.005)
+    loaded = time.perf_counter() - started
+    timer.stop()
+
+    with open(os.path.join(os.environ["HOME"], ".certificate_generator", "session.json")) as f:
+        saved = [os.path.basename(s["path"]) for s in json.load(f)["signatures"]]
+    result = {
+        "shown_ms": shown * 1000.0,
+        "loaded_ms": loaded * 1000.0,
+        "stall_ms": max((b - a for a, b in zip(ticks, ticks[1:])), default=0.0) * 1000.0,
+        "rasterized": rasterized[0],
+        "missing": sum(1 for s in window.signatures if s.get("pixmap") is None),
+        "saved": saved,
+    }
+    window.close()
+    app.processEvents()
+    print(json.dumps(result), flush=True)
+    os._exit(0)  # skip Qt teardown of the spawned render process
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time restoring session signatures at startup.")
+    parser.add_argument("--strokes", type=int, default=6000, help="paths per signature PDF (default: 6000)")
+    parser.add_argument("--launch", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.launch:
+        return launch()
+
+    root = tempfile.mkdtemp(prefix="certgen-signatures-")
+    os.environ["HOME"] = os.environ["USERPROFILE"] = os.path.join(root, "home")
+    failed = False
+    try:
+        make_session(root, args.strokes)
+        cache_dir = os.path.join(os.environ["HOME"], ".certificate_generator", "signature_cache")
+        print(f"3 signature PDFs x {args.strokes} paths, 1 PNG, 1 broken PDF")
+        for label in ("cold cache", "warm cache"):
+            out = subprocess.run([sys.executable, os.path.abspath(__file__), "--launch"],
+                                 capture_output=True, text=True, timeout=LOAD_TIMEOUT_S * 2)
+            lines = [line for line in out.stdout.splitlines() if line.startswith("{")]
+            if not lines:
+                print(f"  {label}: launch failed\n{out.stderr}")
+                failed = True
+                continue
+            r = json.loads(lines[-1])
+            cached = len(os.listdir(cache_dir)) if os.path.isdir(cache_dir) else 0
+            ok = (r["rasterized"] == 0 and r["missing"] == 0 and "broken.pdf" not in r["saved"]
+                  and len(r["saved"]) == 4 and cached == 3)
+            print(f"  {label:<11} window {r['shown_ms']:7.0f} ms  all loaded {r['loaded_ms']:7.0f} ms  "
+                  f"longest stall {r['stall_ms']:5.0f} ms  in-process renders {r['rasterized']}  "
+                  f"{'ok' if ok else 'MISMATCH'}")
+            failed = failed or not ok
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    print("FAIL" if failed else "OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""Startup budget check: time to first window, with -X importtime reporting.
+
+Starts a fresh interpreter under `python -X importtime` that imports App.py
+with its normal startup checks (banner, update pre-flight, package check),
+builds and shows the main window on the offscreen platform, and reports:
+
+- wall time from launching the interpreter to the first shown window
+- how much of that was spent importing App.py
+- the slowest top-level imports by cumulative time, from -X importtime
+- whether any library that should be deferred to first use was imported
+
+The window starts with an empty session (HOME points at a temporary
+directory), so nothing triggers spreadsheet reading or generation. The
+first launch in that directory runs the full package check and writes the
+dependency stamp; it is reported separately and the budget applies to the
+launches after it.
+Exits 1 when the time to first window exceeds --budget or a deferred
+library was imported, so it can gate a build.
+
+Usage:
+    python benchmarks/bench_startup.py [--budget 4.0] [--runs 3] [--top 12]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Only needed to read a names spreadsheet or to generate; must not load before the window shows
+DEFERRED_MODULES = ("pandas", "openpyxl", "PyPDF2", "reportlab", "PIL")
+
+RESULT_MARKER = "CERTGEN_STARTUP_RESULT "
+
+# Run in the child; mirrors App.main() up to the first shown window
+CHILD_SCRIPT = r"""
+import json, sys, time
+sys.path.insert(0, sys.argv[1])
+started = time.time()
+import App
+App.run_startup_checks()
+imported = time.time()
+app = App.QApplication([sys.executable])
+window = App.CertificateGeneratorApp()
+window.show()
+app.processEvents()
+shown = time.time()
+result = {
+    "script_start": started, "imported": imported, "shown": shown,
+    "deferred_loaded": [m for m in json.loads(sys.argv[2]) if m in sys.modules],
+}
+sys.stdout.write("\n" + RESULT_MARKER + json.dumps(result) + "\n")
+sys.stdout.flush()
+os._exit(0)
+"""
+
+
+def parse_importtime(stderr):
+    """{top-level package: cumulative microseconds} from -X importtime output."""
+    totals = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # header line
+        name = parts[2]
+        if name.startswith("  "):
+            continue  # nested import, already counted in its top-level parent
+        name = name.strip()
+        totals[name] = totals.get(name, 0) + int(parts[1])
+    return totals
+
+
+def run_once(home):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", HOME=home, USERPROFILE=home)
+    script = "RESULT_MARKER = " + repr(RESULT_MARKER) + "\n" + CHILD_SCRIPT
+    launched = time.time()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script, REPO_ROOT, json.dumps(DEFERRED_MODULES)],
+        cwd=REPO_ROOT, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=300,
+    )
+    result = None
+    for line in proc.stdout.splitlines():
+        if line.startswith(RESULT_MARKER):
+            result = json.loads(line[len(RESULT_MARKER):])
+    if result is None:
+        raise RuntimeError(f"startup probe failed (exit {proc.returncode}):\n{proc.stderr[-2000:]}")
+    result["launched"] = launched
+    result["imports"] = parse_importtime(proc.stderr)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check time to first window against a budget.")
+    parser.add_argument("--budget", type=float, default=4.0, help="max median seconds to first window (default: 4)")
+    parser.add_argument("--runs", type=int, default=3, help="fresh interpreters to start (default: 3)")
+    parser.add_argument("--top", type=int, default=12, help="slowest imports to list (default: 12)")
+    args = parser.parse_args(argv)
+
+    runs = []
+    with tempfile.TemporaryDirectory(prefix="certgen-startup-") as home:
+        first = run_once(home)
+        for _ in range(max(1, args.runs)):
+            runs.append(run_once(home))
+
+    first_window = statistics.median(r["shown"] - r["launched"] for r in runs)
+    app_import = statistics.median(r["imported"] - r["script_start"] for r in runs)
+    window_build = statistics.median(r["shown"] - r["imported"] for r in runs)
+    last = runs[-1]
+
+    print(f"first launch         : {first['shown'] - first['launched']:6.2f} s  (full package check)")
+    print(f"time to first window : {first_window:6.2f} s  (median of {len(runs)}, budget {args.budget:g} s)")
+    print(f"  import App.py      : {app_import:6.2f} s  (includes startup checks)")
+    print(f"  build + show window: {window_build:6.2f} s")
+    print("slowest top-level imports (cumulative, last run):")
+    for name, micros in sorted(last["imports"].items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {micros / 1000.0:9.1f} ms  {name}")
+
+    failed = False
+    if last["deferred_loaded"]:
+        print(f"FAIL: imported before the first window: {', '.join(last['deferred_loaded'])}")
+        failed = True
+    if first_window > args.budget:
+        print(f"FAIL: time to first window {first_window:.2f} s is over the {args.budget:g} s budget")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""Update discovery against a local bare git repository with a slow remote.
+
+Sets up an upstream bare repository one commit ahead of a client clone
+whose remote answers only after --delay seconds (its upload-pack sleeps
+first), then measures:
+
+- a plain `git fetch` of that remote: what every launch used to wait for
+- pre_start_update_check: the pre-flight that still runs before the window
+- UpdateCheckWorker.run with the interval expired: fetches, finds the new
+  commit and pulls it (this is the part that now runs after the UI shows)
+- UpdateCheckWorker.run again inside the interval: no fetch
+- a forced check against a remote that does not answer in time, with
+  CERTGEN_UPDATE_TIMEOUT=--timeout: must give up after about that long
+
+Everything uses a temporary HOME, so ~/.certificate_generator is not touched.
+Exits 1 if the pre-flight or the cached check depends on the fetch time
+(takes more than a quarter of --delay) or the offline check overruns.
+
+Usage:
+    python benchmarks/bench_update_check.py [--delay 3] [--timeout 2]
+"""
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def git(cwd, *args):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          text=True).stdout.strip()
+
+
+def commit(repo, name, text):
+    with open(os.path.join(repo, name), "w") as f:
+        f.write(text)
+    git(repo, "add", name)
+    git(repo, "-c", "user.name=bench", "-c", "user.email=bench@example.invalid", "commit", "-q", "-m", name)
+
+
+def make_repositories(root, delay):
+    """(client clone, upstream bare repo); upstream is one commit ahead and answers after delay seconds."""
+    work = os.path.join(root, "work")
+    bare = os.path.join(root, "upstream.git")
+    client = os.path.join(root, "client")
+    os.makedirs(work)
+    git(work, "init", "-q", "-b", "main")
+    commit(work, "App.py", "v1\n")
+    git(root, "clone", "-q", "--bare", work, bare)
+    git(root, "clone", "-q", bare, client)
+    commit(work, "App.py", "v2\n")
+    git(work, "push", "-q", bare, "main")
+    set_remote_delay(client, delay)
+    return client, bare
+
+
+def set_remote_delay(client, delay):
+    # upload-pack is started through the shell with the repository path appended
+    git(client, "config", "remote.origin.uploadpack", f"sleep {delay}; git-upload-pack")
+
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return time.perf_counter() - started, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time update discovery against a slow local remote.")
+    parser.add_argument("--delay", type=float, default=3.0, help="seconds the remote waits before answering (default: 3)")
+    parser.add_argument("--timeout", type=float, default=2.0, help="CERTGEN_UPDATE_TIMEOUT for the offline case (default: 2)")
+    args = parser.parse_args(argv)
+
+    root = tempfile.mkdtemp(prefix="certgen-update-")
+    os.environ["HOME"] = os.environ["USERPROFILE"] = os.path.join(root, "home")
+    os.makedirs(os.environ["HOME"])
+    os.environ["CERTGEN_UPDATE_TIMEOUT"] = str(max(args.delay * 4, 10.0))
+    import App
+
+    failed = False
+    try:
+        client, bare = make_repositories(root, args.delay)
+        probe = os.path.join(root, "probe")
+        git(root, "clone", "-q", bare, probe)
+        set_remote_delay(probe, args.delay)
+        fetch_s, _ = timed(lambda: git(probe, "fetch", "--all", "--prune", "--quiet"))
+        print(f"plain git fetch (old pre-flight)     : {fetch_s:6.2f} s")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            preflight_s, _ = timed(lambda: App.pre_start_update_check(client))
+        print(f"pre_start_update_check (before UI)   : {preflight_s:6.3f} s")
+
+        restarts = []
+        worker = App.UpdateCheckWorker(repo_dir=client)
+        worker.restart_requested.connect(lambda: restarts.append(True))
+        due_s, _ = timed(worker.run)
+        updated = git(client, "rev-parse", "HEAD") == git(bare, "rev-parse", "main")
+        print(f"background check, interval expired   : {due_s:6.2f} s  (pulled new commit: {updated and bool(restarts)})")
+
+        cached_s, _ = timed(App.UpdateCheckWorker(repo_dir=client).run)
+        print(f"background check, inside interval    : {cached_s:6.3f} s")
+
+        os.environ["CERTGEN_UPDATE_TIMEOUT"] = str(args.timeout)
+        set_remote_delay(client, args.timeout * 5)  # long enough to count as never; the orphan exits soon after
+        offline_s, _ = timed(App.UpdateCheckWorker(repo_dir=client, force=True).run)
+        last = App.load_update_check("git:" + os.path.realpath(client))
+        print(f"forced check, remote never answers   : {offline_s:6.2f} s  (recorded ok={last.get('ok')})")
+
+        if preflight_s > args.delay / 4 or cached_s > args.delay / 4:
+            print("FAIL: startup path still waits for the remote")
+            failed = True
+        if not (updated and restarts):
+            print("FAIL: background check did not pull the new commit")
+            failed = True
+        if offline_s > args.timeout + 2.0 or last.get("ok") is not False:
+            print("FAIL: unreachable remote was not abandoned after the timeout")
+            failed = True
+        if not failed:
+            print("OK")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""Delta updates of the packaged exe, offline, against a local http.server stand-in.
+
+Builds two synthetic releases of an exe-sized file (the second changes,
+inserts and moves a few regions of the first), publishes the second with
+update_manifest.py --delta-from the first, and drives the exe updater's
+download step (App._download_exe_update) as a client running release 1:
+
+- delta offered for this exe: only the patch is downloaded, the patched
+  file matches the manifest
+- client on another build: no matching delta, full download
+- corrupt patch published: patching fails, full download instead
+
+Prints make/apply times and the bytes the server sent. Exits 1 on any
+mismatch.
+
+Usage:
+    python benchmarks/bench_update_delta.py [--size-mb 32]
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+import update_manifest
+
+
+def make_releases(old_path, new_path, size):
+    rng = random.Random(7)
+    old = rng.randbytes(size)
+    new = bytearray(old)
+    for _ in range(6):  # patched code / resources
+        at = rng.randrange(size - 5000)
+        new[at:at + 3000] = rng.randbytes(3000)
+    new[1024:1024] = rng.randbytes(40_000)  # everything after shifts
+    moved = bytes(new[size // 3:size // 3 + 500_000])
+    del new[size // 3:size // 3 + 500_000]
+    new[size // 2:size // 2] = moved
+    with open(old_path, "wb") as f:
+        f.write(old)
+    with open(new_path, "wb") as f:
+        f.write(new)
+
+
+class CountingHandler(SimpleHTTPRequestHandler):
+    sent = 0
+
+    def log_message(self, *args):
+        pass
+
+    def copyfile(self, source, outputfile):
+        data = source.read()
+        outputfile.write(data)
+        CountingHandler.sent += len(data)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check delta updates of the exe against a local server.")
+    parser.add_argument("--size-mb", type=int, default=32, help="size of the synthetic exe (default: 32)")
+    args = parser.parse_args(argv)
+
+    root = tempfile.mkdtemp(prefix="certgen-delta-")
+    os.environ["HOME"] = os.environ["USERPROFILE"] = os.environ["LOCALAPPDATA"] = os.path.join(root, "home")
+    os.makedirs(os.environ["HOME"])
+    import App
+
+    client = os.path.join(root, "client")
+    publish = os.path.join(root, "publish")
+    os.makedirs(client)
+    os.makedirs(publish)
+    old_exe = os.path.join(client, "CertificateGenerator.exe")
+    new_exe = os.path.join(publish, "CertificateGenerator.exe")
+    make_releases(old_exe, new_exe, args.size_mb * 1024 * 1024)
+    with open(new_exe, "rb") as f:
+        new_sha = hashlib.sha256(f.read()).hexdigest()
+
+    started = time.perf_counter()
+    manifest_path = os.path.join(publish, "update-manifest.json")
+    update_manifest.main(["--version", "3.2.0", new_exe, "-o", manifest_path, "--delta-from", old_exe])
+    make_s = time.perf_counter() - started
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), lambda *a, **kw: CountingHandler(*a, directory=publish, **kw))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    manifest_url = base + "/update-manifest.json"
+    exe_url = base + "/CertificateGenerator.exe"
+
+    failed = False
+    print(f"exe {args.size_mb} MB; delta made in {make_s:.2f} s")
+
+    def check(label, current_exe, expect_patched):
+        nonlocal failed
+        shutil.rmtree(App.get_updates_dir(), ignore_errors=True)
+        CountingHandler.sent = 0
+        started = time.perf_counter()
+        entry = App.fetch_update_manifest_entry(manifest_url, App.EXE_MANIFEST_NAME)
+        path, sha = App._download_exe_update(entry, current_exe=current_exe, url=exe_url)
+        elapsed = time.perf_counter() - started
+        with open(path, "rb") as f:
+            ok = sha == new_sha and hashlib.sha256(f.read()).hexdigest() == new_sha
+        patched = path.name == "CertificateGenerator.patched.exe"
+        ok = ok and patched == expect_patched
+        print(f"  {label:<34} {CountingHandler.sent / 1e6:8.2f} MB sent  {elapsed:6.2f} s  "
+              f"{'patched' if patched else 'full download':<13}  {'ok' if ok else 'MISMATCH'}")
+        failed = failed or not ok
+
+    try:
+        with open(manifest_path) as f:
+            deltas = json.load(f)["files"]["CertificateGenerator.exe"].get("deltas") or []
+        if not deltas:
+            print("FAIL: no delta was published")
+            return 1
+        delta_path = os.path.join(publish, deltas[0]["file"])
+        check("client on release 1 (delta)", old_exe, True)
+
+        other = os.path.join(client, "other.exe")
+        with open(old_exe, "rb") as f, open(other, "wb") as g:
+            g.write(f.read()[:-1] + b"!")
+        check("client on another build", other, False)
+
+        with open(delta_path, "r+b") as f:
+            f.seek(os.path.getsize(delta_path) // 2)
+            f.write(b"\0" * 64)
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        manifest["files"]["CertificateGenerator.exe"]["deltas"][0].update(update_manifest.describe(delta_path))
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f)
+        check("corrupt delta published", old_exe, False)
+    finally:
+        server.shutdown()
+        shutil.rmtree(root, ignore_errors=True)
+    print("FAIL" if failed else "OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""Self-updater downloads against a local http.server stand-in.
+
+Serves a synthetic payload (default 64 MB, about the size of the packaged
+exe) with ETag / Last-Modified validators and Range / If-Range support,
+and drives App.download_update_file through the cases the updater meets:
+
+- first check: full download, streamed to disk
+- unchanged payload: conditional request answered with 304
+- new release, connection dropped part-way: the partial file is kept
+- next check: resumed with a Range request, only the missing bytes sent
+- release replaced while a partial file is pending: If-Range no longer
+  matches, so the server sends the whole new payload
+
+For each case it prints the bytes the server sent and the peak Python heap
+of the call (tracemalloc), and checks the SHA-256 against the payload.
+Exits 1 on any mismatch.
+
+Usage:
+    python benchmarks/bench_update_download.py [--size-mb 64]
+"""
+import argparse
+import email.utils
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+
+class Payload:
+    """What the stand-in server currently publishes."""
+
+    def __init__(self):
+        self.data = b""
+        self.etag = ""
+        self.last_modified = ""
+        self.drop_after = None  # close the connection after this many body bytes
+        self.sent = 0
+
+    def publish(self, data, version):
+        self.data = data
+        self.etag = f'"{hashlib.sha256(data).hexdigest()[:16]}"'
+        self.last_modified = email.utils.formatdate(1_700_000_000 + version * 3600, usegmt=True)
+
+
+class UpdateHandler(BaseHTTPRequestHandler):
+    payload = None
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        p = self.payload
+        if self.headers.get("If-None-Match") == p.etag or (
+                "If-None-Match" not in self.headers and self.headers.get("If-Modified-Since") == p.last_modified):
+            self.send_response(304)
+            self.send_header("ETag", p.etag)
+            self.end_headers()
+            return
+        start = 0
+        status = 200
+        requested = self.headers.get("Range", "")
+        if requested.startswith("bytes=") and self.headers.get("If-Range") in (p.etag, p.last_modified):
+            start = int(requested[len("bytes="):].split("-")[0])
+            if start >= len(p.data):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(p.data)}")
+                self.end_headers()
+                return
+            status = 206
+        body = memoryview(p.data)[start:]
+        self.send_response(status)
+        self.send_header("ETag", p.etag)
+        self.send_header("Last-Modified", p.last_modified)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{len(p.data) - 1}/{len(p.data)}")
+        self.end_headers()
+        limit = len(body) if p.drop_after is None else min(len(body), p.drop_after)
+        for offset in range(0, limit, 256 * 1024):
+            chunk = body[offset:min(limit, offset + 256 * 1024)]
+            self.wfile.write(chunk)
+            p.sent += len(chunk)
+        if limit < len(body):
+            self.close_connection = True
+            self.wfile.flush()
+            self.connection.shutdown(2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exercise the updater's downloads against a local server.")
+    parser.add_argument("--size-mb", type=int, default=64, help="payload size in MB (default: 64)")
+    args = parser.parse_args(argv)
+
+    root = tempfile.mkdtemp(prefix="certgen-download-")
+    os.environ["HOME"] = os.environ["USERPROFILE"] = os.path.join(root, "home")
+    os.makedirs(os.environ["HOME"])
+    import App
+
+    payload = Payload()
+    UpdateHandler.payload = payload
+    server = ThreadingHTTPServer(("127.0.0.1", 0), UpdateHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/CertificateGenerator.exe"
+    dest = os.path.join(root, "CertificateGenerator.new.exe")
+    size = args.size_mb * 1024 * 1024
+
+    failed = False
+    print(f"payload {args.size_mb} MB; bytes sent by the server / peak Python heap of the call")
+
+    def check(label, expect_sha, expect_changed):
+        nonlocal failed
+        payload.sent = 0
+        tracemalloc.start()
+        started = time.perf_counter()
+        sha256, changed = App.download_update_file(url, dest, timeout=10)
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        ok = sha256 == expect_sha and changed == expect_changed
+        if expect_sha:
+            with open(dest, "rb") as f:
+                ok = ok and hashlib.sha256(f.read()).hexdigest() == expect_sha
+        print(f"  {label:<38} {payload.sent / 1e6:8.2f} MB  {peak / 1e6:6.2f} MB  {elapsed:6.2f} s  "
+              f"{'ok' if ok else 'MISMATCH'}")
+        failed = failed or not ok
+
+    try:
+        v1 = os.urandom(size)
+        payload.publish(v1, 1)
+        check("first check (full download)", hashlib.sha256(v1).hexdigest(), True)
+        check("unchanged (304)", hashlib.sha256(v1).hexdigest(), False)
+
+        v2 = os.urandom(size)
+        payload.publish(v2, 2)
+        payload.drop_after = int(size * 0.6)
+        check("new release, dropped at 60%", "", False)
+        payload.drop_after = None
+        check("next check (Range resume)", hashlib.sha256(v2).hexdigest(), True)
+        check("unchanged again (304)", hashlib.sha256(v2).hexdigest(), False)
+
+        v3 = os.urandom(size)
+        payload.publish(v3, 3)
+        payload.drop_after = int(size * 0.3)
+        check("release 3, dropped at 30%", "", False)
+        v4 = os.urandom(size)
+        payload.publish(v4, 4)
+        payload.drop_after = None
+        check("release 4 meanwhile (If-Range miss)", hashlib.sha256(v4).hexdigest(), True)
+    finally:
+        server.shutdown()
+        shutil.rmtree(root, ignore_errors=True)
+    print("FAIL" if failed else "OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
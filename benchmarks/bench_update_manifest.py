@@ -0,0 +1,147 @@
+"""Manifest-first update discovery against a local http.server stand-in.
+
+Copies App.py and its modules into a temporary install, points its App.py
+updater (http_update_app_py_if_needed) at a local server that publishes
+update-manifest.json next to App.py, and reports the bytes the server sent
+for each check:
+
+- up to date: only the manifest is fetched
+- new App.py published: manifest, then the payload; the install is updated
+- payload that does not match the manifest: rejected, install untouched
+- no manifest published: falls back to the conditional payload download
+
+It also times _sha256_of_file on a --hash-mb file: first call, repeat
+(cached per path, mtime and size) and after the file is touched.
+Exits 1 if any case misbehaves.
+
+Usage:
+    python benchmarks/bench_update_manifest.py [--hash-mb 64]
+"""
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+from bench_update_download import Payload, UpdateHandler
+
+sys.path.insert(0, REPO_ROOT)
+import update_manifest
+
+
+class ManifestHandler(UpdateHandler):
+    manifest = None  # bytes, or None for a 404
+
+    def do_GET(self):
+        if not self.path.endswith("/update-manifest.json"):
+            return super().do_GET()
+        if self.manifest is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(self.manifest)))
+        self.end_headers()
+        self.wfile.write(self.manifest)
+        self.payload.sent += len(self.manifest)
+
+
+def load_install(install_dir):
+    for name in ("App.py", "certificate_engine.py", "preview_render.py"):
+        shutil.copy(os.path.join(REPO_ROOT, name), install_dir)
+    sys.path.insert(0, install_dir)  # ahead of the repo, so the copies are what gets imported
+    return importlib.import_module("App")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check manifest-first update discovery.")
+    parser.add_argument("--hash-mb", type=int, default=64, help="size of the file hashed for the cache timing")
+    args = parser.parse_args(argv)
+
+    root = tempfile.mkdtemp(prefix="certgen-manifest-")
+    os.environ["HOME"] = os.environ["USERPROFILE"] = os.path.join(root, "home")
+    os.makedirs(os.environ["HOME"])
+    install = os.path.join(root, "install")
+    publish = os.path.join(root, "publish")
+    os.makedirs(install)
+    os.makedirs(publish)
+    App = load_install(install)
+    installed = os.path.join(install, "App.py")
+
+    payload = Payload()
+    ManifestHandler.payload = payload
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ManifestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    App.GITHUB_RAW_APP_URL = base + "/App.py"
+    App.APP_UPDATE_MANIFEST_URL = base + "/update-manifest.json"
+
+    def publish_app(data, version, manifest_for=None):
+        path = os.path.join(publish, "App.py")
+        with open(path, "wb") as f:
+            f.write(manifest_for if manifest_for is not None else data)
+        manifest = update_manifest.build_manifest(f"3.1.{version}", [path])
+        ManifestHandler.manifest = json.dumps(manifest).encode()
+        payload.publish(data, version)
+
+    failed = False
+
+    def check(label, expect_update, expect_content):
+        nonlocal failed
+        payload.sent = 0
+        updated = App.http_update_app_py_if_needed()
+        with open(installed, "rb") as f:
+            ok = updated == expect_update and f.read() == expect_content
+        print(f"  {label:<40} {payload.sent:>9,} bytes  updated={updated}  {'ok' if ok else 'MISMATCH'}")
+        failed = failed or not ok
+
+    try:
+        with open(installed, "rb") as f:
+            v1 = f.read()
+        v2 = v1 + b"\n# 3.1.2\n"
+        v3 = v1 + b"\n# 3.1.3\n"
+        print(f"App.py {len(v1):,} bytes; bytes sent by the server per check")
+        publish_app(v1, 1)
+        check("up to date (manifest only)", False, v1)
+        publish_app(v2, 2)
+        check("new App.py published", True, v2)
+        check("up to date again", False, v2)
+        publish_app(v3, 3, manifest_for=v3 + b"tampered")
+        check("payload does not match manifest", False, v2)
+        ManifestHandler.manifest = None
+        check("no manifest (payload fallback)", True, v3)
+
+        big = os.path.join(root, "CertificateGenerator.exe")
+        with open(big, "wb") as f:
+            f.write(os.urandom(args.hash_mb * 1024 * 1024))
+        timings = []
+        for step in ("first", "cached", "touched"):
+            if step == "touched":
+                os.utime(big, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+            started = time.perf_counter()
+            digest = App._sha256_of_file(big)
+            timings.append((step, (time.perf_counter() - started) * 1000.0, digest))
+        with open(big, "rb") as f:
+            expected = hashlib.sha256(f.read()).hexdigest()
+        print(f"_sha256_of_file on {args.hash_mb} MB: " + ", ".join(f"{step} {ms:.1f} ms" for step, ms, _ in timings))
+        if any(digest != expected for _, _, digest in timings) or timings[1][1] > timings[0][1] / 5:
+            print("hash cache: MISMATCH")
+            failed = True
+    finally:
+        server.shutdown()
+        shutil.rmtree(root, ignore_errors=True)
+    print("FAIL" if failed else "OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1157 @@
+"""Qt-free certificate rendering engine.
+
+Used in-process by CertificateGeneratorThread and by the worker processes it
+spawns for large batches, so importing this module must never pull in PySide6
+or run any of App.py's startup checks.
+"""
+import hashlib
+import io
+import json
+import os
+import multiprocessing
+import threading
+import time
+
+import fitz  # PyMuPDF
+
+# pandas/openpyxl and PyPDF2/reportlab/Pillow are only needed to read a names
+# spreadsheet or to generate, and together they are most of App.py's import
+# time; they are bound on first use by _import_spreadsheet_libs()/_import_pdf_libs().
+openpyxl = pd = None
+PdfReader = PdfWriter = PageObject = None
+ArrayObject = DecodedStreamObject = DictionaryObject = FloatObject = None
+IndirectObject = NameObject = NumberObject = StreamObject = None
+canvas = pdfmetrics = TTFont = ImageReader = Image = None
+
+
+# File name used for the single multi-page output mode
+COMBINED_FILE_NAME = "Certificates.pdf"
+
+# Written inside the output folder; maps each certificate file to the fingerprint of its inputs
+MANIFEST_FILE_NAME = ".certificate_manifest.json"
+MANIFEST_VERSION = 1
+
+# Batches smaller than this render in-process; starting worker processes costs more than it saves
+MIN_PARALLEL_BATCH = 40
+
+
+def _import_spreadsheet_libs():
+    """Bind pandas and openpyxl the first time a spreadsheet is read."""
+    global openpyxl, pd
+    if pd is not None:
+        return
+    import openpyxl
+    import pandas as pd  # bound last: other threads test pd
+
+
+def _import_pdf_libs():
+    """Bind PyPDF2, reportlab and Pillow the first time anything is rendered."""
+    global PdfReader, PdfWriter, PageObject, ArrayObject, DecodedStreamObject, DictionaryObject, FloatObject
+    global IndirectObject, NameObject, NumberObject, StreamObject, canvas, pdfmetrics, TTFont, ImageReader, Image
+    if PdfReader is not None:
+        return
+    from PyPDF2 import PdfWriter, PageObject
+    from PyPDF2.generic import (
+        ArrayObject, DecodedStreamObject, DictionaryObject, FloatObject, IndirectObject, NameObject, NumberObject,
+        StreamObject,
+    )
+    from reportlab.pdfgen import canvas
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.lib.utils import ImageReader
+    from PIL import Image
+    from PyPDF2 import PdfReader  # bound last: other threads test PdfReader
+
+
+def profiling_enabled() -> bool:
+    """Whether per-stage timings are collected by default (CERTGEN_PROFILE=1)."""
+    return os.environ.get("CERTGEN_PROFILE", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class StageTimings:
+    """Wall time and call counts accumulated per pipeline stage.
+
+    Hot paths only touch this when a StageTimings was passed in; with None
+    (the default) the cost is a single `is not None` check per stage.
+    """
+
+    def __init__(self):
+        self.stages = {}  # stage -> [seconds, count]
+
+    def add(self, stage, seconds, count=1):
+        entry = self.stages.get(stage)
+        if entry is None:
+            self.stages[stage] = [seconds, count]
+        else:
+            entry[0] += seconds
+            entry[1] += count
+
+    def lap(self, stage, start):
+        """Record time since start under stage and return now, for chaining."""
+        now = time.perf_counter()
+        self.add(stage, now - start)
+        return now
+
+    def merge(self, stages):
+        """Fold in another StageTimings' .stages (e.g. from a worker process)."""
+        for stage, (seconds, count) in stages.items():
+            self.add(stage, seconds, count)
+
+    def summary(self, **extra):
+        """JSON-friendly summary: per-stage seconds, counts and mean milliseconds."""
+        stages = {
+            stage: {
+                "seconds": round(seconds, 6),
+                "count": count,
+                "mean_ms": round(seconds * 1000.0 / count, 4) if count else None,
+            }
+            for stage, (seconds, count) in sorted(self.stages.items(), key=lambda item: -item[1][0])
+        }
+        return dict(extra, stages=stages)
+
+
+def default_worker_count() -> int:
+    """Worker processes to use when none is given (CERTGEN_WORKERS env overrides CPU count)."""
+    try:
+        env_value = os.environ.get("CERTGEN_WORKERS", "").strip()
+        if env_value:
+            return max(1, int(env_value))
+    except ValueError:
+        pass
+    return max(1, os.cpu_count() or 1)
+
+
+def capitalize_each_word_preserving_rest(name):
+    if not name:
+        return name
+    words = name.split()
+    capitalized_words = []
+    for word in words:
+        if word and word[0].islower():
+            capitalized_words.append(word[0].upper() + word[1:])
+        else:
+            capitalized_words.append(word)
+    return " ".join(capitalized_words)
+
+
+# Rows per pandas chunk when streaming CSV files
+CSV_CHUNK_ROWS = 10000
+
+
+def _is_blank(cell):
+    return cell is None or (isinstance(cell, str) and cell.strip() == "") or (
+        not isinstance(cell, str) and pd.isna(cell))
+
+
+def _iter_xlsx_column(names_file_path, name_column):
+    _import_spreadsheet_libs()
+    # Read-only mode streams rows from the sheet XML instead of loading the workbook
+    workbook = openpyxl.load_workbook(names_file_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]  # pandas reads the first sheet too
+        header = next(sheet.iter_rows(min_row=1, max_row=1, values_only=True), ())
+        column_index = None
+        for index, value in enumerate(header):
+            if value is not None and str(value) == name_column:
+                column_index = index + 1
+                break
+        if column_index is None:
+            raise KeyError(f"Column '{name_column}' not found in sheet")
+        for (cell,) in sheet.iter_rows(min_row=2, min_col=column_index, max_col=column_index, values_only=True):
+            yield cell
+    finally:
+        workbook.close()
+
+
+def _iter_csv_column(names_file_path, name_column):
+    _import_spreadsheet_libs()
+    columns = pd.read_csv(names_file_path, nrows=0).columns
+    if name_column not in columns:
+        raise KeyError(f"Column '{name_column}' not found in sheet")
+    # Only the selected column is parsed, a chunk at a time; text stays as written in the file
+    with pd.read_csv(names_file_path, usecols=[name_column], dtype=str, chunksize=CSV_CHUNK_ROWS) as reader:
+        for chunk in reader:
+            yield from chunk[name_column]
+
+
+def iter_names(names_file_path, name_column):
+    """Yield names from the selected column in sheet order, stopping at the first blank cell.
+
+    Only that one column is read and rows are streamed (openpyxl read-only mode
+    for .xlsx, chunked pandas for CSV), so reading stops as soon as the first
+    blank cell is reached. Raises KeyError if the column is missing.
+    """
+    if names_file_path.lower().endswith(".xlsx"):
+        cells = _iter_xlsx_column(names_file_path, name_column)
+    else:
+        cells = _iter_csv_column(names_file_path, name_column)
+    try:
+        for cell in cells:
+            if _is_blank(cell):
+                break  # stop at first blank cell
+            yield str(cell).strip()
+    finally:
+        cells.close()
+
+
+def read_names(names_file_path, name_column):
+    """Names from the selected column, in sheet order, stopping at the first blank cell."""
+    names_list = list(iter_names(names_file_path, name_column))
+    if not names_list:
+        raise ValueError(f"No names found in column '{name_column}'")
+    return names_list
+
+
+def _read_header(names_file_path):
+    """Column headers of the first sheet (.xlsx) or the CSV, without reading any rows."""
+    _import_spreadsheet_libs()
+    if names_file_path.lower().endswith(".xlsx"):
+        workbook = openpyxl.load_workbook(names_file_path, read_only=True, data_only=True)
+        try:
+            header = next(workbook.worksheets[0].iter_rows(min_row=1, max_row=1, values_only=True), ())
+        finally:
+            workbook.close()
+        # Same header matching as _iter_xlsx_column: str(value), first occurrence wins
+        return tuple(dict.fromkeys(str(value) for value in header if value is not None))
+    return tuple(str(name) for name in pd.read_csv(names_file_path, nrows=0).columns)
+
+
+class NamesSpreadsheet:
+    """Names from the names file, each column read once and shared by the preview and generation.
+
+    Only the header row is read up front, so asking for a missing column raises
+    KeyError without scanning the sheet. A column is streamed through
+    iter_names the first time it is asked for and kept in memory, keyed by the
+    file's (path, mtime, size) and the column, until the file changes. names()
+    follows iter_names: sheet order, stopping at the first blank cell. Safe to
+    share between the GUI and worker threads; cached_names() never reads the
+    file, so the GUI can check for a hit without blocking on a load.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()  # guards the fields below, never held while reading the file
+        self._load_lock = threading.Lock()  # one read of the file at a time
+        self._file_key = None
+        self._header = None
+        self._names = {}  # (file key, column) -> names, cut at the first blank cell
+
+    @staticmethod
+    def _key(names_file_path):
+        st = os.stat(names_file_path)
+        return (os.path.abspath(names_file_path), st.st_mtime_ns, st.st_size)
+
+    def _cached(self, file_key, name_column):
+        """(header, names) in memory for this version of the file; either may be None."""
+        with self._lock:
+            if file_key != self._file_key:
+                self._file_key = file_key
+                self._header = None
+                self._names = {}
+            return self._header, self._names.get((file_key, name_column))
+
+    def cached_names(self, names_file_path, name_column):
+        """names() if that column is already in memory, otherwise None."""
+        names = self._cached(self._key(names_file_path), name_column)[1]
+        return None if names is None else list(names)
+
+    def names(self, names_file_path, name_column):
+        """Names from the selected column (a new list each call)."""
+        file_key = self._key(names_file_path)
+        header, names = self._cached(file_key, name_column)
+        if names is None:
+            with self._load_lock:
+                header, names = self._cached(file_key, name_column)  # another thread may have read it
+                if header is None:
+                    header = _read_header(names_file_path)
+                    with self._lock:
+                        if self._file_key == file_key:
+                            self._header = header
+                if name_column not in header:
+                    raise KeyError(f"Column '{name_column}' not found in sheet")
+                if names is None:
+                    names = list(iter_names(names_file_path, name_column))
+                    with self._lock:
+                        if self._file_key == file_key:
+                            self._names[(file_key, name_column)] = names
+        return list(names)
+
+    def clear(self):
+        with self._lock:
+            self._file_key = None
+            self._header = None
+            self._names = {}
+
+
+def register_font(font_path) -> str:
+    """Register a TTF/OTF file with reportlab and return the font name to draw with."""
+    _import_pdf_libs()
+    font_name = os.path.splitext(os.path.basename(font_path))[0].replace(" ", "_")
+    pdfmetrics.registerFont(TTFont(font_name, font_path))
+    return font_name
+
+
+# Inheritable page attributes copied from the template onto combined output pages
+_PAGE_ATTRIBUTE_KEYS = ("/MediaBox", "/CropBox", "/BleedBox", "/TrimBox", "/ArtBox", "/Rotate", "/UserUnit")
+
+
+def _page_to_form(page):
+    """Return the page's content stream(s) and resources as one Form XObject."""
+    _import_pdf_libs()
+    contents = page.get_contents()
+    if contents is None:
+        body = b""
+    elif isinstance(contents, ArrayObject):
+        body = b"\n".join(s.get_object().get_data() for s in contents)
+    else:
+        body = contents.get_data()
+    form = DecodedStreamObject()
+    form.set_data(body)
+    form = form.flate_encode()
+    # flate_encode() only keeps the filter entries, so set the form keys afterwards
+    form.update({
+        NameObject("/Type"): NameObject("/XObject"),
+        NameObject("/Subtype"): NameObject("/Form"),
+        NameObject("/BBox"): ArrayObject([FloatObject(v) for v in page.mediabox]),
+    })
+    if "/Resources" in page:
+        form[NameObject("/Resources")] = page["/Resources"]
+    return form
+
+
+class TemplatePageCache:
+    """Template PDF read and parsed once per batch.
+
+    The file is read into memory and closed immediately, so a batch holds no
+    template file handles. The page content is moved into a Form XObject once,
+    leaving the page itself with a one-line content stream. merge_page re-parses
+    the content of the page it merges onto, so this keeps each merge independent
+    of how heavy the template is.
+    """
+
+    FORM_NAME = "/CertTemplate"
+
+    def __init__(self, template_pdf_path):
+        _import_pdf_libs()
+        with open(template_pdf_path, "rb") as f:
+            self.template_bytes = f.read()
+        self._reader = PdfReader(io.BytesIO(self.template_bytes))
+        source_page = self._reader.pages[0]
+        self.page_width = float(source_page.mediabox.width)
+        self.page_height = float(source_page.mediabox.height)
+
+        # Move the original content stream(s) into a single Form XObject
+        self.form = _page_to_form(source_page)
+        # Page-level boxes and rotation, reused by combined output pages
+        self.page_attributes = {key: source_page[key] for key in _PAGE_ATTRIBUTE_KEYS if key in source_page}
+        self.page_attributes["/MediaBox"] = ArrayObject([FloatObject(v) for v in source_page.mediabox])
+
+        wrapper = DecodedStreamObject()
+        wrapper.set_data(f"q\n{self.FORM_NAME} Do\nQ\n".encode("ascii"))
+
+        self._page = PageObject(self._reader)
+        self._page.update(source_page)
+        self._page[NameObject("/Contents")] = wrapper
+        self._page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/XObject"): DictionaryObject({NameObject(self.FORM_NAME): self.form}),
+        })
+
+    def new_page(self):
+        """Return a fresh copy of the template page, safe to merge onto.
+
+        merge_page replaces /Contents and /Resources on the copy rather than
+        mutating them, so the cached page stays untouched across certificates.
+        """
+        page = PageObject(self._reader)
+        page.update(self._page)
+        return page
+
+
+def _load_signature_image(path):
+    """Decode a signature file once. Returns (ImageReader, width_px, height_px).
+
+    PDF signatures are rasterized at 2x, matching the preview, and handed to
+    reportlab as a PIL image without a PNG round-trip.
+    """
+    _import_pdf_libs()
+    if path.lower().endswith(".pdf"):
+        sdoc = fitz.open(path)
+        try:
+            spix = sdoc.load_page(0).get_pixmap(matrix=fitz.Matrix(2.0, 2.0))
+            simg = Image.frombytes("RGB", (spix.width, spix.height), spix.samples)
+        finally:
+            sdoc.close()
+        return ImageReader(simg), simg.width, simg.height
+    img_reader = ImageReader(path)
+    sw, sh = img_reader.getSize()
+    return img_reader, sw, sh
+
+
+def signature_placement(sig, image_width, image_height, page_width, page_height):
+    """Where a signature lands on the page: (x, y_bottom, width, height) in PDF points.
+
+    Shared by every backend so they place signatures identically.
+    """
+    # Flexible per-axis scaling if present
+    w_pts = sig.get("w_pts")
+    h_pts = sig.get("h_pts")
+    if w_pts and h_pts:
+        target_w_pts = max(1.0, float(w_pts))
+        target_h_pts = max(1.0, float(h_pts))
+    else:
+        scale_fraction = float(sig.get("scale", 0.2))
+        target_w_pts = max(1.0, page_width * max(min(scale_fraction, 1.0), 0.02))
+        ratio = image_height / max(image_width, 1)
+        target_h_pts = max(1.0, target_w_pts * ratio)
+
+    sx_pts = sig.get("x_pts")
+    sy_pts = sig.get("y_pts")
+    if sx_pts is None or sy_pts is None:
+        sx_pts = page_width * 0.65
+        sy_pts = page_height * 0.25
+    # Convert preview's top-left anchor to PDF's bottom-left anchor
+    # sy_pts is currently measured from bottom to the TOP edge; subtract image height
+    sy_bottom_left = float(sy_pts) - float(target_h_pts)
+    # Clamp to page bounds
+    if sy_bottom_left < 0:
+        sy_bottom_left = 0.0
+    if sx_pts < 0:
+        sx_pts = 0.0
+    if sx_pts > page_width - target_w_pts:
+        sx_pts = page_width - target_w_pts
+    if sy_bottom_left > page_height - target_h_pts:
+        sy_bottom_left = page_height - target_h_pts
+    return float(sx_pts), float(sy_bottom_left), float(target_w_pts), float(target_h_pts)
+
+
+def build_signature_overlay(signatures, page_width, page_height):
+    """Draw all signatures onto a single overlay page, once per batch.
+
+    Each image is decoded, sized and encoded here exactly once; every
+    certificate then merges the same page, so the encoded image streams are
+    shared rather than rebuilt per output. Returns None when there is nothing
+    to draw.
+    """
+    _import_pdf_libs()
+    packet = io.BytesIO()
+    can = canvas.Canvas(packet, pagesize=(page_width, page_height))
+    drawn = 0
+    try:
+        for sig in signatures or []:
+            path = sig.get("path")
+            if not path or not os.path.exists(path):
+                continue
+            try:
+                img_reader, sw, sh = _load_signature_image(path)
+            except Exception:
+                continue
+
+            sx_pts, sy_bottom_left, target_w_pts, target_h_pts = signature_placement(
+                sig, sw, sh, page_width, page_height)
+
+            try:
+                can.drawImage(
+                    img_reader,
+                    float(sx_pts),
+                    float(sy_bottom_left),
+                    width=float(target_w_pts),
+                    height=float(target_h_pts),
+                    mask='auto'
+                )
+                drawn += 1
+            except Exception:
+                continue
+    finally:
+        can.save()
+        packet.seek(0)
+    if not drawn:
+        return None
+    return PdfReader(packet).pages[0]
+
+
+class CertificateRenderer:
+    """Template, font and signatures loaded once; renders one certificate per call.
+
+    Pass a StageTimings as timings to have every stage timed.
+    """
+
+    def __init__(self, template_pdf_path, font_path, font_size, x_position, y_position,
+                 text_color_rgb=(0.0, 0.0, 0.0), signatures=None, timings=None):
+        self.timings = timings
+        start = time.perf_counter() if timings is not None else 0.0
+        self.font_name = register_font(font_path)
+        if timings is not None:
+            start = timings.lap("font_register", start)
+        self.font_size = font_size
+        self.x_position = x_position
+        self.y_position = y_position
+        self.text_color_rgb = text_color_rgb
+        self.template = TemplatePageCache(template_pdf_path)
+        self.page_width = self.template.page_width
+        self.page_height = self.template.page_height
+        if timings is not None:
+            start = timings.lap("template_load", start)
+        # Signatures are identical on every certificate: decode and encode them once
+        self.signature_page = build_signature_overlay(signatures, self.page_width, self.page_height)
+        if timings is not None:
+            timings.lap("signature_prepare", start)
+
+    def draw_name(self, can, name_value):
+        """Draw one name onto the current page of a reportlab canvas."""
+        # Apply text color
+        try:
+            r, g, b = self.text_color_rgb
+            can.setFillColorRGB(float(r), float(g), float(b))
+        except Exception:
+            pass
+        can.setFont(self.font_name, int(self.font_size))
+        # Use selected X (center) if provided, otherwise default to page center
+        x_center = float(self.x_position) if self.x_position is not None else (self.page_width / 2.0)
+        can.drawCentredString(x_center, int(self.y_position), name_value)
+
+    def render(self, name_value) -> "PdfWriter":
+        """Build a single-page writer for one (already capitalized) name."""
+        timings = self.timings
+        if timings is not None:
+            start = time.perf_counter()
+        # Create overlay
+        packet = io.BytesIO()
+        can = canvas.Canvas(packet, pagesize=(self.page_width, self.page_height))
+        try:
+            self.draw_name(can, name_value)
+        finally:
+            can.save()
+            packet.seek(0)
+
+        if timings is not None:
+            start = timings.lap("overlay_draw", start)
+
+        # Merge onto a fresh copy of the cached template page
+        overlay_pdf = PdfReader(packet)
+        template_page = self.template.new_page()
+        template_page.merge_page(overlay_pdf.pages[0])
+        if timings is not None:
+            start = timings.lap("merge_page", start)
+        # Signatures sit above the name, as when both were drawn on one overlay
+        if self.signature_page is not None:
+            template_page.merge_page(self.signature_page)
+            if timings is not None:
+                start = timings.lap("signature_merge", start)
+        writer = PdfWriter()
+        writer.add_page(template_page)
+        if timings is not None:
+            timings.lap("writer_build", start)
+        return writer
+
+    def write(self, name_value, output_path):
+        writer = self.render(name_value)
+        timings = self.timings
+        if timings is not None:
+            start = time.perf_counter()
+        with open(output_path, "wb") as out_file:
+            writer.write(out_file)
+        if timings is not None:
+            timings.lap("write", start)
+
+
+# Page keys that move or clip what fitz draws; neutralized while drawing
+_FITZ_PAGE_BOX_KEYS = ("MediaBox", "CropBox", "Rotate")
+
+
+class FitzCertificateRenderer:
+    """PyMuPDF-only backend with the same constructor and write() as CertificateRenderer.
+
+    The template page and the signatures are combined into one base document
+    once per batch. Each certificate reopens that base from memory and draws the
+    name straight onto it, so there is no overlay PDF to serialize and parse
+    again and no merge per certificate.
+    """
+
+    def __init__(self, template_pdf_path, font_path, font_size, x_position, y_position,
+                 text_color_rgb=(0.0, 0.0, 0.0), signatures=None, timings=None):
+        _import_pdf_libs()
+        self.timings = timings
+        start = time.perf_counter() if timings is not None else 0.0
+        self.font = fitz.Font(fontfile=font_path)
+        if timings is not None:
+            start = timings.lap("font_register", start)
+        self.font_size = font_size
+        self.x_position = x_position
+        self.y_position = y_position
+        try:
+            self.text_color = tuple(float(c) for c in text_color_rgb)
+        except Exception:
+            self.text_color = (0.0, 0.0, 0.0)
+        with open(template_pdf_path, "rb") as f:
+            template = fitz.open(stream=f.read(), filetype="pdf")
+        try:
+            # PDF user space (origin bottom-left), as used by the positions and the other backend
+            mediabox = template[0].mediabox
+            self.page_width = float(mediabox.width)
+            self.page_height = float(mediabox.height)
+            base = fitz.open()
+            base.insert_pdf(template, from_page=0, to_page=0)
+        finally:
+            template.close()
+        if timings is not None:
+            start = timings.lap("template_load", start)
+        try:
+            # fitz maps its drawing coordinates through the CropBox, /Rotate and MediaBox origin, and
+            # not always correctly. Draw on a MediaBox of [0 0 width height], the space the positions
+            # and the reportlab canvas use, and restore the template's boxes on each certificate.
+            xref = base[0].xref
+            self._page_boxes = {}
+            for key in _FITZ_PAGE_BOX_KEYS:
+                self._page_boxes[key] = base.xref_get_key(xref, key)[1]  # "null" when absent
+                base.xref_set_key(xref, key, "null")
+            base.xref_set_key(xref, "MediaBox", f"[0 0 {self.page_width} {self.page_height}]")
+            base_page = base[0]
+            base_page.wrap_contents()
+            # Content streams up to here are the template's; the name goes between them and the signatures
+            self._template_streams = len(base_page.get_contents())
+            signature_doc = self._build_signature_doc(signatures)
+            if signature_doc is not None:
+                base_page.show_pdf_page(base_page.rect, signature_doc, 0, overlay=True)
+                signature_doc.close()
+            self._base_streams = len(base_page.get_contents())
+            self.base_bytes = base.tobytes(garbage=1, deflate=True)
+        finally:
+            base.close()
+        if timings is not None:
+            timings.lap("signature_prepare", start)
+
+    def _build_signature_doc(self, signatures):
+        """Place every signature on one page, once per batch; None when there is nothing to draw."""
+        doc = fitz.open()
+        page = doc.new_page(width=self.page_width, height=self.page_height)
+        drawn = 0
+        for sig in signatures or []:
+            path = sig.get("path")
+            if not path or not os.path.exists(path):
+                continue
+            try:
+                if path.lower().endswith(".pdf"):
+                    # Rasterized at 2x, matching the preview and the reportlab backend
+                    sdoc = fitz.open(path)
+                    try:
+                        image = {"pixmap": sdoc.load_page(0).get_pixmap(matrix=fitz.Matrix(2.0, 2.0))}
+                    finally:
+                        sdoc.close()
+                    sw, sh = image["pixmap"].width, image["pixmap"].height
+                else:
+                    with open(path, "rb") as f:
+                        image = {"stream": f.read()}
+                    with Image.open(io.BytesIO(image["stream"])) as img:
+                        sw, sh = img.size
+            except Exception:
+                continue
+            x, y_bottom, w, h = signature_placement(sig, sw, sh, self.page_width, self.page_height)
+            top = self.page_height - y_bottom - h
+            try:
+                page.insert_image(fitz.Rect(x, top, x + w, top + h), keep_proportion=False, **image)
+                drawn += 1
+            except Exception:
+                continue
+        if not drawn:
+            doc.close()
+            return None
+        return doc
+
+    def render(self, name_value):
+        """Build a single-page fitz document for one (already capitalized) name."""
+        timings = self.timings
+        if timings is not None:
+            start = time.perf_counter()
+        doc = fitz.open(stream=self.base_bytes, filetype="pdf")
+        page = doc[0]
+        size = int(self.font_size)
+        # Use selected X (center) if provided, otherwise default to page center
+        x_center = float(self.x_position) if self.x_position is not None else (self.page_width / 2.0)
+        x_left = x_center - self.font.text_length(name_value, fontsize=size) / 2.0
+        # Positions are PDF points from the bottom; fitz measures from the top
+        baseline = self.page_height - int(self.y_position)
+        writer = fitz.TextWriter(page.rect, color=self.text_color)
+        writer.append(fitz.Point(x_left, baseline), name_value, font=self.font, fontsize=size)
+        writer.write_text(page)
+        for key, value in self._page_boxes.items():
+            doc.xref_set_key(page.xref, key, value)
+        if self._base_streams > self._template_streams:
+            # Signatures sit above the name, as in the reportlab backend
+            streams = page.get_contents()
+            split, end = self._template_streams, self._base_streams
+            order = streams[:split] + streams[end:] + streams[split:end]
+            doc.xref_set_key(page.xref, "Contents", "[" + " ".join(f"{xref} 0 R" for xref in order) + "]")
+        if timings is not None:
+            timings.lap("overlay_draw", start)
+        return doc
+
+    def write(self, name_value, output_path):
+        doc = self.render(name_value)
+        timings = self.timings
+        try:
+            if timings is not None:
+                start = time.perf_counter()
+            # Embed only the glyphs used, as reportlab does
+            doc.subset_fonts()
+            if timings is not None:
+                start = timings.lap("font_subset", start)
+            doc.save(output_path, garbage=1, deflate=True)
+            if timings is not None:
+                timings.lap("write", start)
+        finally:
+            doc.close()
+
+
+# Rendering backends by setting name. A backend takes CertificateRenderer's
+# keyword arguments and provides write(name_value, output_path).
+ENGINES = {
+    "reportlab": CertificateRenderer,
+    "pymupdf": FitzCertificateRenderer,
+}
+DEFAULT_ENGINE = "reportlab"
+
+
+def default_engine() -> str:
+    """Backend to use when none is given (CERTGEN_ENGINE env overrides the default)."""
+    env_value = os.environ.get("CERTGEN_ENGINE", "").strip().lower()
+    return env_value if env_value in ENGINES else DEFAULT_ENGINE
+
+
+def create_renderer(settings, timings=None):
+    """Build the renderer selected by settings["engine"] from the remaining settings."""
+    settings = dict(settings)
+    engine = settings.pop("engine", None) or default_engine()
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown rendering engine '{engine}' (choose from: {', '.join(ENGINES)})")
+    return ENGINES[engine](timings=timings, **settings)
+
+
+def plan_outputs(names, output_folder_path):
+    """Map spreadsheet names to [(name_value, output_path)] in row order.
+
+    Output file names are the capitalized name, exactly as before. When two rows
+    map to the same file only the last one is kept, which is the file a
+    sequential run would have left behind; this keeps parallel runs deterministic
+    and means no two workers ever write the same file. Paths are compared with
+    os.path.normcase, so on Windows names differing only in case are one file.
+    """
+    jobs = {}
+    for raw_name in names:
+        name_value = capitalize_each_word_preserving_rest(raw_name)
+        output_path = os.path.join(output_folder_path, f"{name_value}.pdf")
+        key = os.path.normcase(output_path)
+        jobs.pop(key, None)
+        jobs[key] = (name_value, output_path)
+    return list(jobs.values())
+
+
+def _file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _number(value):
+    """value with whole floats as ints, so 300 from the GUI and 300.0 from the CLI fingerprint alike."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def settings_fingerprint(settings):
+    """Digest of everything except the name that shapes a certificate.
+
+    Covers template, font and signature file contents (not just their paths),
+    size, position, color, signature placement and the rendering backend.
+    """
+    signatures = []
+    for sig in settings.get("signatures") or []:
+        path = sig.get("path")
+        if not path or not os.path.exists(path):
+            continue  # skipped at render time too
+        signatures.append({
+            "sha256": _file_digest(path),
+            "pdf": path.lower().endswith(".pdf"),
+            **{key: _number(sig.get(key)) for key in ("x_pts", "y_pts", "w_pts", "h_pts", "scale")},
+        })
+    inputs = {
+        "manifest": MANIFEST_VERSION,
+        "template": _file_digest(settings["template_pdf_path"]),
+        "font": _file_digest(settings["font_path"]),
+        "font_size": _number(settings.get("font_size")),
+        "x_position": _number(settings.get("x_position")),
+        "y_position": _number(settings.get("y_position")),
+        "text_color_rgb": [_number(c) for c in settings.get("text_color_rgb") or ()],
+        "signatures": signatures,
+        "engine": settings.get("engine") or default_engine(),
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def name_fingerprint(common_fingerprint, name_value):
+    return hashlib.sha256(f"{common_fingerprint}\0{name_value}".encode("utf-8")).hexdigest()
+
+
+def load_manifest(output_folder_path) -> dict:
+    """{file name: fingerprint} from the output folder; empty when missing or unreadable."""
+    try:
+        with open(os.path.join(output_folder_path, MANIFEST_FILE_NAME), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == MANIFEST_VERSION and isinstance(data.get("outputs"), dict):
+            return data["outputs"]
+    except Exception:
+        pass
+    return {}
+
+
+def save_manifest(output_folder_path, outputs):
+    path = os.path.join(output_folder_path, MANIFEST_FILE_NAME)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": MANIFEST_VERSION, "outputs": outputs}, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def plan_incremental(jobs, settings, output_folder_path):
+    """Split planned jobs into the ones that need rendering and the ones already up to date.
+
+    Returns (pending_jobs, outputs, stale_paths): outputs is the manifest to save
+    once the pending jobs are written, and stale_paths are certificates from a
+    previous run whose rows are gone. Only files recorded in the manifest are
+    ever reported as stale, so unrelated files in the folder are left alone.
+    """
+    previous = load_manifest(output_folder_path)
+    common = settings_fingerprint(settings)
+    pending, outputs = [], {}
+    for name_value, output_path in jobs:
+        file_name = os.path.basename(output_path)
+        fingerprint = name_fingerprint(common, name_value)
+        outputs[file_name] = fingerprint
+        if previous.get(file_name) != fingerprint or not os.path.exists(output_path):
+            pending.append((name_value, output_path))
+    # Compare as the platform does: on Windows "Mcdonald.pdf" and "McDonald.pdf" are the same file
+    current = {os.path.normcase(file_name) for file_name in outputs}
+    folded = {file_name.casefold(): file_name for file_name in outputs}
+    stale_paths = []
+    for file_name in previous:
+        if os.path.normcase(file_name) in current:
+            continue
+        path = os.path.join(output_folder_path, file_name)
+        # A case-insensitive volume elsewhere (e.g. macOS) sees a case-only rename as the same file too
+        renamed = folded.get(file_name.casefold())
+        if renamed is not None and _same_file(path, os.path.join(output_folder_path, renamed)):
+            continue
+        stale_paths.append(path)
+    return pending, outputs, stale_paths
+
+
+def _same_file(path, other_path):
+    try:
+        return os.path.samefile(path, other_path)
+    except OSError:
+        return False
+
+
+def remove_stale_outputs(stale_paths) -> int:
+    """Delete certificates whose rows were removed; returns how many files went away."""
+    removed = 0
+    for path in stale_paths:
+        try:
+            os.remove(path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+class CombinedCertificateWriter:
+    """Streams one multi-page PDF, one page per name, straight to disk.
+
+    The template and the signatures are written once as Form XObjects that
+    every page references, so each page only adds its own small name content
+    stream. Objects are written as soon as they are produced and name overlays
+    are drawn in chunks, so memory stays flat however many names there are.
+    PyPDF2's PdfWriter keeps the whole document until write(), hence the small
+    hand-rolled object writer here. The file appears under its final name only
+    once close() completes.
+    """
+
+    CHUNK_SIZE = 256
+    SIGNATURES_FORM_NAME = "/CertSignatures"
+
+    def __init__(self, renderer, output_path):
+        _import_pdf_libs()
+        self.renderer = renderer
+        self.output_path = output_path
+        self._partial_path = output_path + ".part"
+        self._file = open(self._partial_path, "wb")
+        self._offsets = {}  # object number -> byte offset
+        self._next_number = 1
+        self._page_refs = []
+        # Template/signature objects, translated once and shared by every page
+        self._shared = {}
+        self._file.write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+        self._catalog_ref = self._reserve()
+        self._pages_ref = self._reserve()
+
+        template = renderer.template
+        pending = []
+        self._page_attributes = {
+            NameObject(key): self._translate(value, self._shared, pending)
+            for key, value in template.page_attributes.items()
+        }
+        self._write_pending(pending, self._shared)
+        self._xobjects = {NameObject(template.FORM_NAME): self._write_new(template.form, self._shared)}
+        self._prefix = f"q\n{template.FORM_NAME} Do\nQ\nq\n".encode("ascii")
+        self._suffix = b"\nQ\n"
+        if renderer.signature_page is not None:
+            signatures_form = _page_to_form(renderer.signature_page)
+            self._xobjects[NameObject(self.SIGNATURES_FORM_NAME)] = self._write_new(signatures_form, self._shared)
+            # Signatures sit above the name, as in the one-file-per-name output
+            self._suffix += f"q\n{self.SIGNATURES_FORM_NAME} Do\nQ\n".encode("ascii")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    @property
+    def page_count(self):
+        return len(self._page_refs)
+
+    def _reserve(self):
+        ref = IndirectObject(self._next_number, 0, None)
+        self._next_number += 1
+        return ref
+
+    def _translate(self, obj, translated, pending):
+        """Renumber references into this file, queueing unseen objects for writing."""
+        if isinstance(obj, IndirectObject):
+            if obj.pdf is None:
+                return obj  # already one of ours
+            key = (id(obj.pdf), obj.idnum, obj.generation)
+            ref = translated.get(key)
+            if ref is None:
+                ref = translated[key] = self._reserve()
+                pending.append((ref, obj))
+            return ref
+        if isinstance(obj, StreamObject):
+            # Streams can't be direct objects inside another object
+            ref = self._reserve()
+            pending.append((ref, obj))
+            return ref
+        if isinstance(obj, DictionaryObject):
+            return DictionaryObject({
+                NameObject(key): self._translate(value, translated, pending) for key, value in obj.items()
+            })
+        if isinstance(obj, ArrayObject):
+            return ArrayObject([self._translate(value, translated, pending) for value in obj])
+        return obj
+
+    def _write_new(self, obj, translated):
+        ref = self._reserve()
+        self._write(ref, obj, translated)
+        return ref
+
+    def _write(self, ref, obj, translated):
+        """Write obj as ref, then every object it pulls in that isn't written yet."""
+        self._write_pending([(ref, obj)], translated)
+
+    def _write_pending(self, pending, translated):
+        out = self._file
+        while pending:
+            ref, obj = pending.pop()
+            obj = obj.get_object()
+            self._offsets[ref.idnum] = out.tell()
+            out.write(f"{ref.idnum} 0 obj\n".encode("ascii"))
+            if isinstance(obj, StreamObject):
+                # _data is the stream exactly as stored (still encoded), so filters carry over untouched
+                data = obj._data
+                header = self._translate(
+                    DictionaryObject({key: value for key, value in obj.items() if key != "/Length"}),
+                    translated, pending)
+                header[NameObject("/Length")] = NumberObject(len(data))
+                header.write_to_stream(out, None)
+                out.write(b"\nstream\n")
+                out.write(data)
+                out.write(b"\nendstream")
+            else:
+                self._translate(obj, translated, pending).write_to_stream(out, None)
+            out.write(b"\nendobj\n")
+
+    def add_names(self, names):
+        """Append one page per (already capitalized) name, in order."""
+        for start in range(0, len(names), self.CHUNK_SIZE):
+            self._add_chunk(names[start:start + self.CHUNK_SIZE])
+
+    def _add_chunk(self, names):
+        renderer = self.renderer
+        timings = renderer.timings
+        if timings is not None:
+            start = time.perf_counter()
+        packet = io.BytesIO()
+        can = canvas.Canvas(packet, pagesize=(renderer.page_width, renderer.page_height))
+        try:
+            for name_value in names:
+                renderer.draw_name(can, name_value)
+                can.showPage()
+        finally:
+            can.save()
+            packet.seek(0)
+
+        if timings is not None:
+            start = timings.lap("overlay_draw", start)
+
+        # Fonts are shared by the pages of a chunk; the map is dropped with the chunk
+        translated = {}
+        for overlay_page in PdfReader(packet).pages:
+            overlay_contents = overlay_page.get_contents()
+            if isinstance(overlay_contents, ArrayObject):
+                name_body = b"\n".join(s.get_object().get_data() for s in overlay_contents)
+            else:
+                name_body = overlay_contents.get_data() if overlay_contents is not None else b""
+            contents = DecodedStreamObject()
+            contents.set_data(self._prefix + name_body + self._suffix)
+            contents_ref = self._write_new(contents.flate_encode(), translated)
+
+            resources = DictionaryObject(overlay_page.get("/Resources", DictionaryObject()).get_object())
+            xobjects = DictionaryObject(resources.get("/XObject", DictionaryObject()).get_object())
+            xobjects.update(self._xobjects)
+            resources[NameObject("/XObject")] = xobjects
+
+            page = DictionaryObject(self._page_attributes)
+            page.update({
+                NameObject("/Type"): NameObject("/Page"),
+                NameObject("/Parent"): self._pages_ref,
+                NameObject("/Resources"): resources,
+                NameObject("/Contents"): contents_ref,
+            })
+            self._page_refs.append(self._write_new(page, translated))
+        if timings is not None:
+            timings.add("write", time.perf_counter() - start, len(names))
+
+    def close(self):
+        """Write the page tree, cross-reference table and trailer, then publish the file."""
+        self._write(self._pages_ref, DictionaryObject({
+            NameObject("/Type"): NameObject("/Pages"),
+            NameObject("/Kids"): ArrayObject(self._page_refs),
+            NameObject("/Count"): NumberObject(len(self._page_refs)),
+        }), {})
+        self._write(self._catalog_ref, DictionaryObject({
+            NameObject("/Type"): NameObject("/Catalog"),
+            NameObject("/Pages"): self._pages_ref,
+        }), {})
+        out = self._file
+        xref_offset = out.tell()
+        size = self._next_number
+        out.write(f"xref\n0 {size}\n0000000000 65535 f \n".encode("ascii"))
+        for number in range(1, size):
+            out.write(f"{self._offsets[number]:010d} 00000 n \n".encode("ascii"))
+        out.write(f"trailer\n<< /Size {size} /Root {self._catalog_ref.idnum} 0 R >>\n"
+                  f"startxref\n{xref_offset}\n%%EOF\n".encode("ascii"))
+        out.close()
+        os.replace(self._partial_path, self.output_path)
+
+    def abort(self):
+        """Discard a partially written file."""
+        try:
+            self._file.close()
+        finally:
+            try:
+                os.remove(self._partial_path)
+            except OSError:
+                pass
+
+
+def generate_combined(names, output_path, settings, on_progress=None, timings=None):
+    """Write every name as one page of a single PDF and return the page count.
+
+    names are raw spreadsheet values; each row gets its own page in sheet
+    order (duplicates included). settings are CertificateRenderer keyword
+    arguments. The shared-XObject layout is built from PyPDF2 objects, so this
+    mode always uses the reportlab backend whatever settings["engine"] says.
+    on_progress(completed, total, name_value) is called per chunk.
+    """
+    renderer = CertificateRenderer(timings=timings, **{key: value for key, value in settings.items() if key != "engine"})
+    names = [capitalize_each_word_preserving_rest(name) for name in names]
+    total = len(names)
+    chunk_size = CombinedCertificateWriter.CHUNK_SIZE
+    with CombinedCertificateWriter(renderer, output_path) as writer:
+        for start in range(0, total, chunk_size):
+            chunk = names[start:start + chunk_size]
+            writer.add_names(chunk)
+            if on_progress is not None:
+                on_progress(writer.page_count, total, chunk[-1])
+    return total
+
+
+# Per-process renderer for pool workers (set up once by _init_worker)
+_worker_renderer = None
+_worker_error = None
+_worker_timings = None
+
+
+def _init_worker(settings, collect_timings=False):
+    global _worker_renderer, _worker_error, _worker_timings
+    try:
+        _worker_timings = StageTimings() if collect_timings else None
+        _worker_renderer = create_renderer(settings, _worker_timings)
+    except Exception as exc:
+        # Raising here would make the pool respawn workers forever; report on first chunk instead
+        _worker_error = exc
+
+
+def _render_chunk(chunk):
+    if _worker_error is not None:
+        raise _worker_error
+    for name_value, output_path in chunk:
+        _worker_renderer.write(name_value, output_path)
+    stages = None
+    if _worker_timings is not None:
+        # Hand over what this chunk (and, for the first one, worker setup) cost, then start afresh
+        stages, _worker_timings.stages = _worker_timings.stages, {}
+    return [name_value for name_value, _ in chunk], stages
+
+
+def generate_batch(jobs, settings, workers=1, on_progress=None, timings=None):
+    """Render [(name_value, output_path)] jobs and return how many were written.
+
+    settings are CertificateRenderer keyword arguments plus an optional
+    "engine" naming the backend (see ENGINES). With more than one
+    worker and a large enough batch, jobs are split into chunks and handed to a
+    pool of processes that each load the template, font and signatures once.
+    on_progress(completed, total, name_value) is called in this process as
+    certificates (or whole chunks) finish. Stage timings from every process
+    are accumulated into timings when one is given.
+    """
+    total = len(jobs)
+    workers = max(1, int(workers or 1))
+    if workers == 1 or total < MIN_PARALLEL_BATCH:
+        renderer = create_renderer(settings, timings)
+        for completed, (name_value, output_path) in enumerate(jobs, start=1):
+            renderer.write(name_value, output_path)
+            if on_progress is not None:
+                on_progress(completed, total, name_value)
+        return total
+
+    workers = min(workers, total)
+    # A few chunks per worker balances load without flooding the result queue
+    chunk_size = max(1, min(64, total // (workers * 4)))
+    chunks = [jobs[i:i + chunk_size] for i in range(0, total, chunk_size)]
+    # Spawn (not fork): the caller is usually a QThread inside a threaded Qt process
+    ctx = multiprocessing.get_context("spawn")
+    completed = 0
+    with ctx.Pool(workers, initializer=_init_worker, initargs=(settings, timings is not None)) as pool:
+        for names, stages in pool.imap_unordered(_render_chunk, chunks):
+            if timings is not None and stages:
+                timings.merge(stages)
+            completed += len(names)
+            if on_progress is not None and names:
+                on_progress(completed, total, names[-1])
+    return completed
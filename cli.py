@@ -0,0 +1,189 @@
+"""Headless command-line entry point for batch certificate generation.
+
+Runs the same pipeline as the GUI's Generate button without importing PySide6,
+printing a banner, checking for updates or probing packages, so it is safe to
+use on build servers and in scripts.
+
+Example:
+    python cli.py --names names.xlsx --template template.pdf --output out \\
+        --font Fonts/PinyonScript-Regular.ttf --size 30 --y 300 \\
+        --signature sig.png@420,180,150,60
+
+Exit codes:
+    0  all certificates written
+    1  generation failed part-way
+    2  invalid command-line arguments
+    3  invalid input (missing file, unknown column, no names)
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from certificate_engine import (
+    COMBINED_FILE_NAME, ENGINES, StageTimings, default_engine, default_worker_count, generate_batch,
+    generate_combined, plan_incremental, plan_outputs, read_names, remove_stale_outputs, save_manifest,
+)
+
+
+EXIT_OK = 0
+EXIT_GENERATION_FAILED = 1
+EXIT_USAGE = 2
+EXIT_BAD_INPUT = 3
+
+
+def _parse_color(value):
+    """'#RRGGBB' (or 'RRGGBB') -> (r, g, b) floats in 0..1, as CertificateGeneratorThread takes."""
+    txt = (value or "").strip().lstrip("#")
+    if len(txt) != 6 or any(c not in "0123456789abcdefABCDEF" for c in txt):
+        raise argparse.ArgumentTypeError(f"invalid color '{value}', expected #RRGGBB")
+    return tuple(int(txt[i:i + 2], 16) / 255.0 for i in (0, 2, 4))
+
+
+def _parse_signature(value):
+    """PATH[@X,Y[,W,H]] -> signature dict matching the GUI's session entries.
+
+    X/Y are the top-left corner in PDF points (Y measured from the bottom),
+    W/H the size in points. Without a position the GUI defaults apply.
+    """
+    path, coords = value, None
+    if "@" in value:
+        head, tail = value.rsplit("@", 1)
+        parts = [p.strip() for p in tail.split(",")]
+        try:
+            numbers = [float(p) for p in parts]
+        except ValueError:
+            numbers = None
+        if numbers is not None and len(numbers) in (2, 4):
+            path, coords = head, numbers
+    sig = {"path": path, "x_pts": None, "y_pts": None, "w_pts": None, "h_pts": None, "scale": 0.2}
+    if coords:
+        sig["x_pts"], sig["y_pts"] = coords[0], coords[1]
+        if len(coords) == 4:
+            sig["w_pts"], sig["h_pts"] = coords[2], coords[3]
+    return sig
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Generate one certificate PDF per name without the GUI.",
+    )
+    parser.add_argument("--names", required=True, help="Excel (.xlsx) or CSV file with the names")
+    parser.add_argument("--template", required=True, help="template PDF (first page is used)")
+    parser.add_argument("--output", required=True, help="output folder (created if missing)")
+    parser.add_argument("--font", required=True, help="TTF/OTF font file for the name")
+    parser.add_argument("--size", type=int, default=30, help="font size in points (default: 30)")
+    parser.add_argument("--x", type=float, default=None,
+                        help="horizontal center of the name in PDF points (default: page center)")
+    parser.add_argument("--y", type=float, default=300, help="baseline of the name in PDF points (default: 300)")
+    parser.add_argument("--column", default="Name", help="column header holding the names (default: Name)")
+    parser.add_argument("--color", type=_parse_color, default=(0.0, 0.0, 0.0),
+                        help="text color as #RRGGBB (default: #000000)")
+    parser.add_argument("--signature", type=_parse_signature, action="append", default=[],
+                        metavar="PATH[@X,Y[,W,H]]",
+                        help="signature image or PDF; repeat for several signatures")
+    parser.add_argument("--combined", nargs="?", const=COMBINED_FILE_NAME, default=None, metavar="FILE",
+                        help=f"write one multi-page PDF instead of one file per name "
+                             f"(FILE inside --output, default: {COMBINED_FILE_NAME})")
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate every certificate, even those unchanged since the last run")
+    parser.add_argument("--engine", choices=list(ENGINES), default=None,
+                        help="rendering backend (default: CERTGEN_ENGINE or reportlab)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: CERTGEN_WORKERS or CPU count)")
+    parser.add_argument("--timings", default=None, metavar="FILE",
+                        help="write a per-stage timing summary (JSON) to FILE")
+    parser.add_argument("--quiet", action="store_true", help="only print errors")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as exc:
+        # argparse exits 0 for --help and 2 for usage errors
+        return EXIT_OK if exc.code == 0 else EXIT_USAGE
+
+    def fail(message, code):
+        print(f"error: {message}", file=sys.stderr)
+        return code
+
+    if not os.path.exists(args.names):
+        return fail("Names file not found", EXIT_BAD_INPUT)
+    if not os.path.exists(args.template):
+        return fail("Template PDF not found", EXIT_BAD_INPUT)
+    if not os.path.exists(args.font):
+        return fail("Font file not found", EXIT_BAD_INPUT)
+    for sig in args.signature:
+        if not os.path.exists(sig["path"]):
+            return fail(f"Signature file not found: {sig['path']}", EXIT_BAD_INPUT)
+    try:
+        os.makedirs(args.output, exist_ok=True)
+    except OSError as exc:
+        return fail(f"Could not create output folder: {exc}", EXIT_BAD_INPUT)
+
+    timings = StageTimings() if args.timings else None
+    run_started = time.perf_counter()
+    try:
+        names_list = read_names(args.names, args.column)
+    except (KeyError, ValueError) as exc:
+        return fail(str(exc).strip("'\""), EXIT_BAD_INPUT)
+    except Exception as exc:
+        return fail(f"Could not read names file: {exc}", EXIT_BAD_INPUT)
+    if timings is not None:
+        timings.lap("names_read", run_started)
+
+    settings = {
+        "template_pdf_path": args.template,
+        "font_path": args.font,
+        "font_size": args.size,
+        "x_position": args.x,
+        "y_position": args.y,
+        "text_color_rgb": args.color,
+        "signatures": args.signature,
+        "engine": args.engine or default_engine(),
+    }
+    def _on_progress(completed, total, name_value):
+        if not args.quiet:
+            print(f"Generated {completed}/{total}: {name_value}", flush=True)
+
+    destination = args.output
+    try:
+        if args.combined:
+            destination = os.path.join(args.output, args.combined)
+            generate_combined(names_list, destination, settings, on_progress=_on_progress, timings=timings)
+        else:
+            jobs = plan_outputs(names_list, args.output)
+            pending, manifest, stale_paths = plan_incremental(jobs, settings, args.output)
+            if args.force:
+                pending = jobs
+            if not args.quiet and len(pending) < len(jobs):
+                print(f"Skipping {len(jobs) - len(pending)} up-to-date certificate(s)")
+            generate_batch(pending, settings, workers=args.workers or default_worker_count(),
+                           on_progress=_on_progress, timings=timings)
+            removed = remove_stale_outputs(stale_paths)
+            save_manifest(args.output, manifest)
+            if not args.quiet and removed:
+                print(f"Removed {removed} certificate(s) for deleted rows")
+    except Exception as exc:
+        return fail(str(exc), EXIT_GENERATION_FAILED)
+
+    if timings is not None:
+        summary = timings.summary(total_seconds=round(time.perf_counter() - run_started, 6),
+                                  engine=settings["engine"])
+        try:
+            with open(args.timings, "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=2)
+        except OSError as exc:
+            print(f"warning: could not write timings: {exc}", file=sys.stderr)
+
+    if not args.quiet:
+        print(f"Done. Certificates saved to: {destination}")
+    return EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
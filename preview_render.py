@@ -0,0 +1,638 @@
+"""Qt-side preview plumbing: PDF pages to pixmaps, off-thread rendering and the preview canvas.
+
+Kept out of App.py so they can be imported (e.g. by the benchmarks) without
+App.py's startup banner, update check and package probing.
+"""
+import ctypes
+import hashlib
+import multiprocessing
+import os
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+
+from PySide6.QtCore import QPoint, QThread, Signal
+from PySide6.QtGui import QImage, QPainter, QPixmap
+from PySide6.QtWidgets import QLabel
+import fitz  # PyMuPDF
+
+
+def qimage_from_fitz(pix) -> QImage:
+    """Wrap a fitz.Pixmap's sample buffer as a QImage, without copying or re-encoding.
+
+    The QImage borrows pix's memory: keep pix alive while the image is used,
+    or convert straight away as pixmap_from_fitz does.
+    """
+    if pix.n - pix.alpha != 3:
+        # Grayscale/CMYK: have MuPDF convert to RGB first; the converted
+        # pixmap dies with this frame, so hand back an owning copy
+        rgb = fitz.Pixmap(fitz.csRGB, pix)
+        return qimage_from_fitz(rgb).copy()
+    fmt = QImage.Format_RGBA8888 if pix.alpha else QImage.Format_RGB888
+    return QImage(pix.samples_mv, pix.width, pix.height, pix.stride, fmt)
+
+
+def pixmap_from_fitz(pix) -> QPixmap:
+    """Convert a rendered fitz.Pixmap to a QPixmap in one copy (no PPM/PNG round-trip)."""
+    if pix.n - pix.alpha != 3:
+        pix = fitz.Pixmap(fitz.csRGB, pix)
+    image = qimage_from_fitz(pix)
+    # fromImage copies into the display format while pix is still referenced here
+    return QPixmap.fromImage(image)
+
+
+# PySide6 6.12 on Python < 3.12 (where None is not immortal) drops a reference
+# to None on nearly every call of a method returning void: setPen, drawPixmap,
+# QLabel.update... A busy window makes thousands a minute and the interpreter
+# aborts once None's count reaches zero ("none_dealloc"). Where that happens,
+# keep_none_alive() tops the count up with lists of None that are never freed
+# (freeing them at exit would give back references the leak already spent).
+_NONE_REFERENCE_FLOOR = 100000
+
+
+def _void_calls_leak_none():
+    if sys.version_info >= (3, 12):
+        return False
+    point = QPoint()
+    before = sys.getrefcount(None)
+    for _ in range(16):
+        point.setX(0)
+    return sys.getrefcount(None) < before
+
+
+_VOID_CALLS_LEAK_NONE = _void_calls_leak_none()
+
+
+def keep_none_alive():
+    """Top up None's reference count if this PySide6 build leaks it; cheap, call it often."""
+    if _VOID_CALLS_LEAK_NONE and sys.getrefcount(None) < _NONE_REFERENCE_FLOOR:
+        ctypes.pythonapi.Py_IncRef(ctypes.py_object([None] * _NONE_REFERENCE_FLOOR))
+
+
+# Edge length of preview tiles in device pixels
+TILE_SIZE = 512
+
+
+def tile_threshold_pixels():
+    """Page size (in pixels) above which the preview is rendered as tiles (CERTGEN_PREVIEW_TILE_MP, default 6)."""
+    try:
+        return int(float(os.environ.get("CERTGEN_PREVIEW_TILE_MP", "6")) * 1000 * 1000)
+    except ValueError:
+        return 6 * 1000 * 1000
+
+
+def tile_rect(tx, ty, page_w, page_h):
+    """Pixel rect (x, y, w, h) of tile (tx, ty) on a page_w x page_h page; edge tiles are clipped."""
+    x, y = tx * TILE_SIZE, ty * TILE_SIZE
+    return x, y, min(TILE_SIZE, page_w - x), min(TILE_SIZE, page_h - y)
+
+
+def tiles_in_rect(x, y, w, h, page_w, page_h):
+    """(tx, ty) of every tile intersecting the pixel rect, row by row."""
+    x0, y0 = max(0, x), max(0, y)
+    x1, y1 = min(page_w, x + w), min(page_h, y + h)
+    if x1 <= x0 or y1 <= y0:
+        return []
+    return [(tx, ty)
+            for ty in range(y0 // TILE_SIZE, (y1 - 1) // TILE_SIZE + 1)
+            for tx in range(x0 // TILE_SIZE, (x1 - 1) // TILE_SIZE + 1)]
+
+
+def _rasterize_page(page, zoom, clip=None):
+    """Render page at zoom; clip is (x, y, w, h) in device pixels at that zoom."""
+    matrix = fitz.Matrix(zoom, zoom)
+    if clip is None:
+        return page.get_pixmap(matrix=matrix)
+    x, y, w, h = clip
+    return page.get_pixmap(matrix=matrix, clip=fitz.Rect(x / zoom, y / zoom, (x + w) / zoom, (y + h) / zoom))
+
+
+def _rasterize_first_page(path, zoom, clip=None):
+    doc = fitz.open(path)
+    try:
+        page = doc.load_page(0)
+        pix = _rasterize_page(page, zoom, clip)
+        width_pts, height_pts = float(page.rect.width), float(page.rect.height)
+    finally:
+        doc.close()
+    return pix, width_pts, height_pts
+
+
+def render_first_page(path, zoom):
+    """Rasterize page 1 of a PDF. Returns (QPixmap, width_pts, height_pts); the file is closed again."""
+    pix, width_pts, height_pts = _rasterize_first_page(path, zoom)
+    return pixmap_from_fitz(pix), width_pts, height_pts
+
+
+def render_first_page_image(path, zoom, clip=None):
+    """Like render_first_page, but returns a QImage that owns its pixels.
+
+    QPixmap may only be created on the GUI thread; this is the variant for
+    worker threads. clip limits rendering to a pixel rect (see _rasterize_page).
+    """
+    pix, width_pts, height_pts = _rasterize_first_page(path, zoom, clip)
+    return qimage_from_fitz(pix).copy(), width_pts, height_pts
+
+
+class PreviewRenderCache:
+    """LRU cache of rasterized template pages for the preview and placement dialogs.
+
+    Keyed by (template path, mtime, size, zoom bucket), so revisiting a zoom
+    level is instant and editing or replacing the template misses. Entries of
+    any other template version are dropped as soon as a new one is rendered.
+    Zoom is rounded to ZOOM_STEP before rendering; the overlay scales from the
+    pixmap size, so the rounding never shifts text or signatures. The cache is
+    bounded by the total size of the stored pixmaps (CERTGEN_PREVIEW_CACHE_MB,
+    default 192).
+
+    The cache also owns the open template document used for GUI-thread
+    renders and page sizes: one per template version, closed as soon as
+    another version is used, and by close(). Use shared_render_cache() for
+    the app-wide instance.
+    """
+
+    ZOOM_STEP = 0.02
+
+    def __init__(self, max_bytes=None):
+        if max_bytes is None:
+            try:
+                max_bytes = int(float(os.environ.get("CERTGEN_PREVIEW_CACHE_MB", "192")) * 1024 * 1024)
+            except ValueError:
+                max_bytes = 192 * 1024 * 1024
+        self.max_bytes = max(0, max_bytes)
+        self._entries = OrderedDict()  # key -> (pixmap, width_pts, height_pts, bytes)
+        self._bytes = 0
+        self._page_sizes = {}  # file key -> (width_pts, height_pts)
+        self._doc = None
+        self._doc_key = None
+
+    @staticmethod
+    def _file_key(path):
+        st = os.stat(path)
+        return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+    def _drop_other_versions(self, file_key):
+        for key in [k for k in self._entries if k[:3] != file_key]:
+            self._bytes -= self._entries.pop(key)[3]
+        for key in [k for k in self._page_sizes if k != file_key]:
+            del self._page_sizes[key]
+        if self._doc_key != file_key:
+            self._close_document()
+
+    def _document(self, path, file_key):
+        """The open fitz document of this template version, opening it on first use."""
+        if self._doc is None or self._doc_key != file_key:
+            self._close_document()
+            self._doc = fitz.open(path)
+            self._doc_key = file_key
+        return self._doc
+
+    def _close_document(self):
+        if self._doc is not None:
+            self._doc.close()
+        self._doc = None
+        self._doc_key = None
+
+    def clear(self):
+        self._entries.clear()
+        self._page_sizes.clear()
+        self._bytes = 0
+        self._close_document()
+
+    def close(self):
+        """Release every pixmap and close the open document."""
+        self.clear()
+
+    def page_size(self, path):
+        """(width, height) of the first page in PDF points."""
+        file_key = self._file_key(path)
+        size = self._page_sizes.get(file_key)
+        if size is None:
+            self._drop_other_versions(file_key)
+            rect = self._document(path, file_key).load_page(0).rect
+            size = (float(rect.width), float(rect.height))
+            self._page_sizes[file_key] = size
+        return size
+
+    def key(self, path, zoom):
+        """Cache key of (path, zoom); key_zoom(key) is the zoom to render it at.
+
+        Preview tiles are stored under key + (tx, ty).
+        """
+        bucket = max(1, int(round(float(zoom) / self.ZOOM_STEP)))
+        return self._file_key(path) + (bucket,)
+
+    @classmethod
+    def key_zoom(cls, key):
+        return key[3] * cls.ZOOM_STEP
+
+    def get(self, key):
+        """Cached (QPixmap, width_pts, height_pts) for key, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0], entry[1], entry[2]
+
+    def render(self, path, zoom):
+        """Return (QPixmap, width_pts, height_pts) of the first page at roughly zoom."""
+        key = self.key(path, zoom)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        self._drop_other_versions(key[:3])
+        page = self._document(path, key[:3]).load_page(0)
+        pixmap = pixmap_from_fitz(_rasterize_page(page, self.key_zoom(key)))
+        width_pts, height_pts = float(page.rect.width), float(page.rect.height)
+        self.store(key, pixmap, width_pts, height_pts)
+        return pixmap, width_pts, height_pts
+
+    def store(self, key, pixmap, width_pts, height_pts):
+        """Add a page rendered elsewhere (e.g. by PreviewRenderWorker) under key."""
+        file_key = key[:3]
+        self._drop_other_versions(file_key)
+        self._page_sizes[file_key] = (width_pts, height_pts)
+
+        cost = pixmap.width() * pixmap.height() * 4
+        if cost <= self.max_bytes:
+            self._entries[key] = (pixmap, width_pts, height_pts, cost)
+            self._bytes += cost
+            while self._bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[3]
+
+
+_shared_render_cache = None
+
+
+def shared_render_cache():
+    """The app-wide PreviewRenderCache shared by the main preview and the placement dialogs."""
+    global _shared_render_cache
+    if _shared_render_cache is None:
+        _shared_render_cache = PreviewRenderCache()
+    return _shared_render_cache
+
+
+def _render_server(conn):
+    """Render process loop: receives (path, zoom, clip), replies with raw RGB(A) samples.
+
+    The last document stays open between requests, so tiles of one page do
+    not re-parse the file each time.
+    """
+    doc, doc_key = None, None
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            break
+        if request is None:
+            break
+        path, zoom, clip = request
+        try:
+            st = os.stat(path)
+            key = (path, st.st_mtime_ns, st.st_size)
+            if key != doc_key:
+                if doc is not None:
+                    doc.close()
+                    doc = None  # stays None if the next file does not open
+                doc, doc_key = fitz.open(path), key
+            page = doc.load_page(0)
+            pix = _rasterize_page(page, zoom, clip)
+            width_pts, height_pts = float(page.rect.width), float(page.rect.height)
+            if pix.n - pix.alpha != 3:
+                pix = fitz.Pixmap(fitz.csRGB, pix)
+            conn.send(("ok", pix.width, pix.height, pix.stride, bool(pix.alpha), pix.samples,
+                       width_pts, height_pts))
+        except Exception as exc:
+            doc_key = None
+            conn.send(("error", str(exc)))
+    if doc is not None:
+        doc.close()
+
+
+class _RenderProcessClient:
+    """Renders through a spawned _render_server process, for QThread workers.
+
+    MuPDF keeps the GIL while it renders, so rendering in a worker thread would
+    still stall the GUI thread. Users set _cond, _process, _conn and _use_process
+    in __init__; if the process cannot be started, _render falls back to
+    rendering in the calling thread.
+    """
+
+    def _start_process(self):
+        ctx = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = ctx.Pipe()
+        process = ctx.Process(target=_render_server, args=(child_conn,), daemon=True)
+        process.start()
+        child_conn.close()
+        with self._cond:
+            self._process, self._conn = process, parent_conn
+
+    def _close_process(self):
+        with self._cond:
+            process, conn = self._process, self._conn
+            self._process = self._conn = None
+        if conn is not None:
+            try:
+                conn.send(None)
+            except Exception:
+                pass
+            conn.close()
+        if process is not None:
+            process.join(timeout=2)
+            if process.is_alive():
+                process.terminate()
+
+    def _render(self, path, zoom, clip=None):
+        """(QImage, width_pts, height_pts), rendered in the helper process when available."""
+        if self._use_process and self._conn is None:
+            try:
+                self._start_process()
+            except Exception:
+                self._use_process = False
+        if not self._use_process:
+            return render_first_page_image(path, zoom, clip)
+        try:
+            self._conn.send((path, zoom, clip))
+            reply = self._conn.recv()
+        except (EOFError, OSError):
+            # Process died (or was terminated by stop()); start a fresh one next time
+            self._close_process()
+            raise RuntimeError("Preview renderer stopped unexpectedly")
+        if reply[0] == "error":
+            raise RuntimeError(reply[1])
+        _, width, height, stride, alpha, samples, width_pts, height_pts = reply
+        fmt = QImage.Format_RGBA8888 if alpha else QImage.Format_RGB888
+        # copy(): the QImage must own its pixels once samples goes away
+        return QImage(samples, width, height, stride, fmt).copy(), width_pts, height_pts
+
+
+class PreviewRenderWorker(_RenderProcessClient, QThread):
+    """Rasterizes preview pages off the GUI thread.
+
+    Requests are coalesced: request() replaces any render that has not started
+    yet, so a burst of zoom steps renders only the last one, and a result that
+    was overtaken by a newer request while rendering is dropped. Each result
+    carries the id request() returned, so the receiver can ignore stale ones.
+    request_tiles() queues a batch of tiles the same way; they are emitted one
+    by one and the rest of the batch is abandoned once a newer request arrives.
+
+    MuPDF keeps the GIL while it renders, so the pages are rasterized in a
+    long-lived spawned process and this thread only waits on the pipe. If the
+    process cannot be started, rendering falls back to this thread.
+    """
+
+    rendered = Signal(int, QImage, float, float)  # request id, image, width_pts, height_pts
+    tile_rendered = Signal(int, int, int, QImage)  # request id, tx, ty, image
+    failed = Signal(int, str)  # request id, error message
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cond = threading.Condition()
+        self._pending = None  # (request id, path, zoom, tiles or None)
+        self._latest_id = 0
+        self._stopping = False
+        self._process = None
+        self._conn = None
+        self._use_process = True
+
+    def request(self, path, zoom):
+        """Queue page 1 of path at zoom, superseding anything still queued. Returns the request id."""
+        return self._queue(path, zoom, None)
+
+    def request_tiles(self, path, zoom, tiles):
+        """Queue tiles [(tx, ty, (x, y, w, h)), ...] of page 1, in order. Returns the request id."""
+        return self._queue(path, zoom, list(tiles))
+
+    def _queue(self, path, zoom, tiles):
+        with self._cond:
+            self._latest_id += 1
+            request_id = self._latest_id
+            self._pending = (request_id, path, zoom, tiles)
+            self._stopping = False
+            self._cond.notify()
+        if not self.isRunning():
+            self.start()
+        return request_id
+
+    def stop(self):
+        """Drop queued work, abandon the current render and shut the render process down."""
+        with self._cond:
+            self._stopping = True
+            self._pending = None
+            self._cond.notify()
+            process = self._process
+        if process is not None and process.is_alive():
+            # Unblocks a pending recv() in run()
+            process.terminate()
+        self.wait()
+        self._close_process()
+
+    def _is_latest(self, request_id):
+        with self._cond:
+            return request_id == self._latest_id and not self._stopping
+
+    def run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                request_id, path, zoom, tiles = self._pending
+                self._pending = None
+            try:
+                if tiles is None:
+                    image, width_pts, height_pts = self._render(path, zoom)
+                    if self._is_latest(request_id):
+                        self.rendered.emit(request_id, image, width_pts, height_pts)
+                    continue
+                for tx, ty, clip in tiles:
+                    if not self._is_latest(request_id):
+                        break
+                    image, _, _ = self._render(path, zoom, clip)
+                    if self._is_latest(request_id):
+                        self.tile_rendered.emit(request_id, tx, ty, image)
+            except Exception as exc:
+                if self._is_latest(request_id):
+                    self.failed.emit(request_id, str(exc))
+
+
+# Signature PDFs are shown rasterized at this zoom (the generated PDFs embed them as images at 2x too)
+SIGNATURE_ZOOM = 2.0
+
+
+def load_signature_image(path, cache_dir, zoom=SIGNATURE_ZOOM, render=render_first_page_image):
+    """QImage of a signature file; PDFs are rasterized once per content and zoom.
+
+    A rasterized PDF is kept in cache_dir as <sha256 of the file>@<zoom>x.png,
+    so an unchanged (or renamed) signature later loads without fitz. render is
+    called as render(path, zoom) -> (QImage, width_pts, height_pts) on a cache
+    miss. Safe off the GUI thread. Raises ValueError if the file does not load
+    as an image.
+    """
+    if not path.lower().endswith(".pdf"):
+        image = QImage(path)
+        if image.isNull():
+            raise ValueError(f"not an image: {path}")
+        return image
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    cached = os.path.join(cache_dir, f"{digest.hexdigest()}@{zoom:g}x.png")
+    image = QImage(cached)
+    if not image.isNull():
+        return image
+    image, _, _ = render(path, zoom)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        partial = f"{cached}.{os.getpid()}-{threading.get_ident()}.part"
+        if image.save(partial, "PNG"):
+            os.replace(partial, cached)
+    except OSError:
+        pass  # the cache is optional
+    return image
+
+
+class SignatureLoadWorker(_RenderProcessClient, QThread):
+    """Loads signature images with load_signature_image off the GUI thread, one signal per file.
+
+    PDFs missing from the cache are rasterized in a render process, started
+    only when the first one is needed and shut down when the batch is done.
+    """
+
+    loaded = Signal(int, QImage)  # index into paths, image
+    failed = Signal(int, str)  # index into paths, error message
+
+    def __init__(self, paths, cache_dir, parent=None):
+        super().__init__(parent)
+        self._paths = list(paths)
+        self._cache_dir = cache_dir
+        self._cond = threading.Condition()
+        self._process = None
+        self._conn = None
+        self._use_process = True
+
+    def stop(self):
+        """Abandon the remaining files and the current render."""
+        self.requestInterruption()
+        with self._cond:
+            process = self._process
+        if process is not None and process.is_alive():
+            process.terminate()
+        self.wait()
+        self._close_process()
+
+    def run(self):
+        try:
+            for index, path in enumerate(self._paths):
+                if self.isInterruptionRequested():
+                    return
+                try:
+                    image = load_signature_image(path, self._cache_dir, render=self._render)
+                except Exception as exc:
+                    if self.isInterruptionRequested():
+                        return
+                    self.failed.emit(index, str(exc))
+                    continue
+                self.loaded.emit(index, image)
+        finally:
+            self._close_process()
+
+
+# One overlay item on the preview page. id names the item across updates,
+# rect is its page-pixel bounds (including frames/shadows), state is anything
+# that changes its look, and paint(painter) draws it in page coordinates,
+# setting whatever pen, brush and font it uses.
+OverlayLayer = namedtuple("OverlayLayer", "id rect state paint")
+
+
+class PreviewCanvas(QLabel):
+    """Preview label that composes the page and its overlay layers at paint time.
+
+    With a page set, the label reports the page size to the scroll area and
+    paints only the exposed area: the page layer through a callback (a slice
+    of a pixmap, or tiles), then the overlay layers in order. set_layers()
+    compares the new layers with the previous ones and repaints only the
+    bounds of those that appeared, disappeared, moved or changed state, so a
+    hover or drag step costs the same on any page size. Without a page it is
+    a plain QLabel, used for placeholder and error text.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._page_size = None
+        self._paint_page = None
+        self._layers = []
+
+    def set_page(self, size, paint_page=None):
+        """Show a page of QSize size painted by paint_page(painter, exposed_rect), or none (size None)."""
+        if size is not None and size == self._page_size and paint_page == self._paint_page:
+            self.update()
+            return
+        self._page_size = size
+        self._paint_page = paint_page
+        if size is not None:
+            self.clear()
+        else:
+            self._layers = []
+        self.updateGeometry()
+        self.update()
+
+    def page_size(self):
+        return self._page_size
+
+    def page_origin(self):
+        """Top-left of the page inside the label (centered like AlignCenter)."""
+        if self._page_size is None:
+            return QPoint(0, 0)
+        return QPoint(max(0, (self.width() - self._page_size.width()) // 2),
+                      max(0, (self.height() - self._page_size.height()) // 2))
+
+    def update_page_rect(self, rect):
+        """Schedule a repaint of a rect given in page coordinates."""
+        self.update(rect.translated(self.page_origin()))
+
+    def set_layers(self, layers):
+        """Replace the overlay layers, repainting only what differs from the previous set."""
+        old = {layer.id: layer for layer in self._layers}
+        new = {layer.id: layer for layer in layers}
+        self._layers = list(layers)
+        if self._page_size is None:
+            return
+        for layer_id, layer in old.items():
+            other = new.get(layer_id)
+            if other is None or other.rect != layer.rect or other.state != layer.state:
+                self.update_page_rect(layer.rect)
+        for layer_id, layer in new.items():
+            other = old.get(layer_id)
+            if other is None or other.rect != layer.rect or other.state != layer.state:
+                self.update_page_rect(layer.rect)
+
+    def sizeHint(self):
+        return self._page_size if self._page_size is not None else super().sizeHint()
+
+    def minimumSizeHint(self):
+        return self._page_size if self._page_size is not None else super().minimumSizeHint()
+
+    def paintEvent(self, event):
+        keep_none_alive()
+        if self._page_size is None or self._paint_page is None:
+            super().paintEvent(event)
+            return
+        origin = self.page_origin()
+        exposed = event.rect().translated(-origin)
+        painter = QPainter(self)
+        try:
+            painter.translate(origin)
+            painter.setClipRect(exposed)
+            self._paint_page(painter, exposed)
+            for layer in self._layers:
+                if layer.rect.intersects(exposed):
+                    # Layers set the pen, brush and font they draw with: save()/restore() per
+                    # layer only adds to the None leak keep_none_alive() works around
+                    layer.paint(painter)
+        finally:
+            painter.end()
+
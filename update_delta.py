@@ -0,0 +1,164 @@
+"""Binary deltas between two releases of the packaged exe (stdlib only).
+
+A delta is a header followed by an LZMA stream of operations that rebuild
+the new file: copy a range of the old file, or insert literal bytes.
+
+    header: MAGIC, sha256(old), sha256(new), len(new)   (8 + 32 + 32 + 8 bytes)
+    ops:    b"C" offset length  |  b"I" length data  |  b"E"
+
+make_delta() runs on the release side; it indexes the old file in fixed
+blocks and scans the new one for matches, so unchanged or moved regions
+become copies. apply_delta() runs on the client. It streams the output to
+disk and refuses to return a result whose SHA-256 is not the one recorded
+in the header.
+"""
+import hashlib
+import lzma
+import os
+import struct
+
+MAGIC = b"CGDELTA1"
+BLOCK_SIZE = 256
+_HEADER = struct.Struct(">8s32s32sQ")
+_COPY = struct.Struct(">QQ")
+_LENGTH = struct.Struct(">Q")
+_EXTEND_STEP = 64 * 1024
+_WRITE_CHUNK = 1024 * 1024
+
+
+class DeltaError(Exception):
+    """The delta does not apply to this file or did not reproduce the expected result."""
+
+
+def _match_length(new, i, old, o):
+    """Length of the common run of new[i:] and old[o:]."""
+    length = 0
+    step = _EXTEND_STEP
+    limit = min(len(new) - i, len(old) - o)
+    while length < limit and step:
+        step = min(step, limit - length)
+        if new[i + length:i + length + step] == old[o + length:o + length + step]:
+            length += step
+        else:
+            step //= 2
+    return length
+
+
+def _ops(old, new, block_size):
+    index = {}
+    for offset in range(len(old) - block_size, -1, -block_size):
+        index[old[offset:offset + block_size]] = offset  # lowest offset wins
+    literal_start = 0
+    i = 0
+    last = len(new) - block_size
+    while i <= last:
+        o = index.get(new[i:i + block_size])
+        if o is None:
+            i += 1
+            continue
+        # Grow the match backwards into the pending literal bytes, then forwards
+        back = 0
+        while i - back > literal_start and o - back > 0 and new[i - back - 1] == old[o - back - 1]:
+            back += 1
+        start, o = i - back, o - back
+        length = _match_length(new, start, old, o)
+        if start > literal_start:
+            yield "I", new[literal_start:start]
+        yield "C", (o, length)
+        i = literal_start = start + length
+    if literal_start < len(new):
+        yield "I", new[literal_start:]
+
+
+def make_delta(old_path, new_path, delta_path, block_size=BLOCK_SIZE):
+    """Write a delta that turns old_path into new_path. Returns the delta size in bytes."""
+    with open(old_path, "rb") as f:
+        old = f.read()
+    with open(new_path, "rb") as f:
+        new = f.read()
+    header = _HEADER.pack(MAGIC, hashlib.sha256(old).digest(), hashlib.sha256(new).digest(), len(new))
+    partial = delta_path + ".part"
+    with open(partial, "wb") as raw:
+        raw.write(header)
+        with lzma.open(raw, "wb", preset=6) as out:
+            pending_copy = None
+            for kind, value in _ops(old, new, block_size):
+                if kind == "C":
+                    # Adjacent copies (a match split by the block scan) are merged
+                    if pending_copy and pending_copy[0] + pending_copy[1] == value[0]:
+                        pending_copy = (pending_copy[0], pending_copy[1] + value[1])
+                        continue
+                    if pending_copy:
+                        out.write(b"C" + _COPY.pack(*pending_copy))
+                    pending_copy = value
+                else:
+                    if pending_copy:
+                        out.write(b"C" + _COPY.pack(*pending_copy))
+                        pending_copy = None
+                    out.write(b"I" + _LENGTH.pack(len(value)) + value)
+            if pending_copy:
+                out.write(b"C" + _COPY.pack(*pending_copy))
+            out.write(b"E")
+    os.replace(partial, delta_path)
+    return os.path.getsize(delta_path)
+
+
+def _read_exact(stream, size):
+    data = stream.read(size)
+    if len(data) != size:
+        raise DeltaError("truncated delta")
+    return data
+
+
+def apply_delta(old_path, delta_path, out_path):
+    """Rebuild the new file at out_path from old_path and a delta. Returns its hex SHA-256.
+
+    The result is written to out_path.part and only renamed once its SHA-256
+    and size match the delta header; DeltaError otherwise.
+    """
+    partial = out_path + ".part"
+    try:
+        with open(delta_path, "rb") as raw:
+            magic, old_sha, new_sha, new_size = _HEADER.unpack(_read_exact(raw, _HEADER.size))
+            if magic != MAGIC:
+                raise DeltaError("not a delta file")
+            h = hashlib.sha256()
+            with open(old_path, "rb") as old, open(partial, "wb") as out, lzma.open(raw, "rb") as ops:
+                old_h = hashlib.sha256()
+                for chunk in iter(lambda: old.read(_WRITE_CHUNK), b""):
+                    old_h.update(chunk)
+                if old_h.digest() != old_sha:
+                    raise DeltaError("delta is for a different file")
+                while True:
+                    op = _read_exact(ops, 1)
+                    if op == b"E":
+                        break
+                    if op == b"C":
+                        offset, length = _COPY.unpack(_read_exact(ops, _COPY.size))
+                        old.seek(offset)
+                        while length:
+                            chunk = old.read(min(length, _WRITE_CHUNK))
+                            if not chunk:
+                                raise DeltaError("copy past the end of the old file")
+                            out.write(chunk)
+                            h.update(chunk)
+                            length -= len(chunk)
+                    elif op == b"I":
+                        (length,) = _LENGTH.unpack(_read_exact(ops, _LENGTH.size))
+                        while length:
+                            chunk = _read_exact(ops, min(length, _WRITE_CHUNK))
+                            out.write(chunk)
+                            h.update(chunk)
+                            length -= len(chunk)
+                    else:
+                        raise DeltaError("corrupt delta")
+                size = out.tell()
+        if size != new_size or h.digest() != new_sha:
+            raise DeltaError("patched file does not match the expected SHA-256")
+        os.replace(partial, out_path)
+        return h.hexdigest()
+    except (OSError, lzma.LZMAError, struct.error) as e:
+        raise DeltaError(str(e)) from e
+    finally:
+        if os.path.exists(partial):
+            os.remove(partial)
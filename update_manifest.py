@@ -0,0 +1,85 @@
+"""Write the update manifest the self-updater checks before downloading anything.
+
+Publish the output next to the payloads it describes: update-manifest.json
+on the main branch for App.py, and as a release asset for the packaged exe.
+Clients download a payload only when its SHA-256 differs from their own copy,
+and refuse one that does not match the manifest.
+
+With --delta-from (the previous release's exe), a binary delta from that
+release is written next to the manifest and listed under the payload's
+"deltas"; publish it alongside. Clients running exactly that release patch
+their exe instead of downloading the whole file.
+
+Example:
+    python update_manifest.py --version 3.1.0 App.py dist/CertificateGenerator.exe -o update-manifest.json \\
+        --delta-from releases/3.0.0/CertificateGenerator.exe
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+from update_delta import make_delta
+
+
+def describe(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return {"sha256": h.hexdigest(), "size": os.path.getsize(path)}
+
+
+def build_manifest(version, paths):
+    """{"version", "files": {basename: {"sha256", "size"}}} for the given payloads."""
+    return {"version": version, "files": {os.path.basename(path): describe(path) for path in paths}}
+
+
+def add_delta(manifest, payload, old_path, out_dir):
+    """Write the delta old_path -> payload and list it in the manifest; False if it saves too little."""
+    name = os.path.basename(payload)
+    entry = manifest["files"][name]
+    old_sha = describe(old_path)["sha256"]
+    delta_name = f"{name}.{old_sha[:12]}.delta"
+    delta_path = os.path.join(out_dir, delta_name)
+    size = make_delta(old_path, payload, delta_path)
+    if size > entry["size"] // 2:
+        os.remove(delta_path)  # a full download is nearly as cheap and needs no patching
+        return False
+    entry.setdefault("deltas", []).append({"from_sha256": old_sha, "file": delta_name, **describe(delta_path)})
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write an update manifest for published payloads.")
+    parser.add_argument("payloads", nargs="+", help="files to describe (App.py, CertificateGenerator.exe)")
+    parser.add_argument("--version", required=True, help="version being published, without a leading 'v'")
+    parser.add_argument("-o", "--output", default="update-manifest.json", help="manifest path (default: %(default)s)")
+    parser.add_argument("--delta-from", action="append", default=[], metavar="OLD",
+                        help="previous release of a payload (same file name); may be repeated")
+    args = parser.parse_args(argv)
+    missing = [path for path in args.payloads + args.delta_from if not os.path.isfile(path)]
+    if missing:
+        parser.error(f"not a file: {', '.join(missing)}")
+    by_name = {os.path.basename(path): path for path in args.payloads}
+    unmatched = [path for path in args.delta_from if os.path.basename(path) not in by_name]
+    if unmatched:
+        parser.error(f"no payload named like: {', '.join(unmatched)}")
+
+    manifest = build_manifest(args.version, args.payloads)
+    out_dir = os.path.dirname(os.path.abspath(args.output))
+    for old_path in args.delta_from:
+        if add_delta(manifest, by_name[os.path.basename(old_path)], old_path, out_dir):
+            delta = manifest["files"][os.path.basename(old_path)]["deltas"][-1]
+            print(f"Wrote {delta['file']} ({delta['size']:,} bytes)")
+        else:
+            print(f"Skipped delta from {old_path}: not much smaller than the full file")
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Wrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())